@@ -3,12 +3,43 @@
 Base class for all data cleaners.
 """
 
+import functools
+import itertools
 import logging
+import math
+import os
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
 
 from ..config import Config
-from ..utils.logging_config import setup_logging
+from ..utils.logging_config import get_logger
+
+# Input types whose cleaned values are cached
+_CACHEABLE_TYPES = (str, int, float)
+
+@functools.lru_cache(maxsize=None)
+def _has_matching_clean_series(cls: type) -> bool:
+    """
+    Check if a cleaner class cleans with the clean and _clean_impl its clean_series mirrors.
+    
+    A subclass that overrides clean or _clean_impl without also overriding
+    clean_series is cleaned record by record, so batches use its override.
+    
+    Args:
+        cls (type): Cleaner class.
+        
+    Returns:
+        bool: True if batches can be cleaned through clean_series, False otherwise.
+    """
+    owner = next((klass for klass in cls.__mro__ if "clean_series" in vars(klass)), None)
+    if owner is None:
+        return False
+    return cls.clean is owner.clean and cls._clean_impl is owner._clean_impl
 
 class DataCleaner(ABC):
     """
@@ -18,6 +49,9 @@ class DataCleaner(ABC):
         config (Config): Configuration object.
         logger (logging.Logger): Logger instance.
         clean_stats (Dict): Statistics about cleaning operations.
+        n_jobs (int): Number of worker processes for batch cleaning (-1 for all CPUs).
+        parallel_threshold (int): Minimum batch size to clean in parallel.
+        cache_size (int): Number of cleaned values to cache for repeated inputs.
     """
     
     def __init__(self, config: Optional[Config] = None):
@@ -29,19 +63,98 @@ class DataCleaner(ABC):
         """
         from ..config import get_default_config
         self.config = config or get_default_config()
-        self.logger = setup_logging(self.__class__.__name__)
+        self.logger = get_logger(self.__class__.__name__)
         self.clean_stats = {
             "total_records": 0,
             "cleaned_records": 0,
             "removed_records": 0,
             "errors": 0
         }
+        self.n_jobs = self.config.get("general.n_jobs", 1)
+        self.parallel_threshold = self.config.get("general.parallel_threshold", 10000)
+        self.cache_size = self.config.get("general.cache_size", 8192)
+        self._build_caches()
+    
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Keep subclasses that override clean instead of _clean_impl working.
+        
+        Such a subclass gets its clean as _clean_impl, so it is not left
+        abstract. Its clean is called directly, without the cache.
+        """
+        super().__init_subclass__(**kwargs)
+        if cls.clean is not DataCleaner.clean and getattr(cls._clean_impl, "__isabstractmethod__", False):
+            cls._clean_impl = cls.clean
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Get the state for pickling, without the caches.
+        
+        Returns:
+            Dict[str, Any]: Instance state.
+        """
+        return {key: value for key, value in self.__dict__.items() if not hasattr(value, "cache_clear")}
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restore the state after unpickling and rebuild the caches.
+        
+        Args:
+            state (Dict[str, Any]): Instance state.
+        """
+        self.__dict__.update(state)
+        self._build_caches()
+    
+    def _build_caches(self) -> None:
+        """
+        Create the per-instance caches. Subclasses can override this to cache other methods.
+        """
+        self._clean_cached = self._lru_cache(self._clean_impl)
+    
+    def _lru_cache(self, func: Callable) -> Callable:
+        """
+        Wrap a method in an LRU cache of the configured size.
+        
+        Args:
+            func (Callable): Method to cache.
+            
+        Returns:
+            Callable: Cached method.
+        """
+        return functools.lru_cache(maxsize=self.cache_size, typed=True)(func)
+    
+    def clear_cache(self) -> None:
+        """
+        Clear the cached cleaned values, e.g. after changing cleaner settings.
+        """
+        for value in self.__dict__.values():
+            if hasattr(value, "cache_clear"):
+                value.cache_clear()
     
-    @abstractmethod
     def clean(self, data: Any) -> Any:
+        """
+        Clean data.
+        
+        Strings and numbers are cleaned through a per-instance LRU cache, so
+        repeated values are only cleaned once.
+        
+        Args:
+            data (Any): Data to be cleaned.
+            
+        Returns:
+            Any: Cleaned data.
+        """
+        if isinstance(data, _CACHEABLE_TYPES):
+            return self._clean_cached(data)
+        return self._clean_impl(data)
+    
+    @abstractmethod
+    def _clean_impl(self, data: Any) -> Any:
         """
         Abstract method to clean data.
         
+        Subclasses implement this, or override clean itself as before.
+        
         Args:
             data (Any): Data to be cleaned.
             
@@ -61,38 +174,227 @@ class DataCleaner(ABC):
             bool: True if data is clean, False otherwise.
         """
         try:
-            cleaned_data = self.clean(data)
-            return cleaned_data is not None
+            return self._is_valid(data)
         except Exception:
             return False
     
+    def _is_valid(self, data: Any) -> bool:
+        """
+        Check if data would be kept by cleaning.
+        
+        Subclasses can override this with a cheaper check that skips building
+        the cleaned value.
+        
+        Args:
+            data (Any): Data to check.
+            
+        Returns:
+            bool: True if data is clean, False otherwise.
+        """
+        return self.clean(data) is not None
+    
     def clean_batch(self, data_list: List[Any]) -> List[Any]:
         """
         Clean a batch of data.
         
+        Collects the records yielded by ``iter_clean``; see there for how the
+        batch is cleaned.
+        
         Args:
             data_list (List[Any]): List of data to be cleaned.
             
         Returns:
             List[Any]: List of cleaned data.
         """
-        self.clean_stats["total_records"] = len(data_list)
-        cleaned_list = []
+        return list(self.iter_clean(data_list))
+    
+    def iter_clean(self, data_iterable: Iterable[Any]) -> Iterator[Any]:
+        """
+        Clean data lazily, yielding cleaned records one at a time.
+        
+        Cleaning statistics are updated as records are consumed. Cleaners that
+        provide a vectorized ``clean_series`` method clean lists, tuples, NumPy
+        arrays and pandas Series through it, unless a subclass overrides
+        ``clean`` or ``_clean_impl`` but not ``clean_series``; everything else
+        goes through the per-record loop. When ``n_jobs`` is not 1 and the input is larger than
+        ``parallel_threshold`` (or has no length), it is split into chunks that
+        are cleaned in separate processes, with only a few chunks in flight at
+        a time.
+        
+        Args:
+            data_iterable (Iterable[Any]): Data to be cleaned.
+            
+        Yields:
+            Any: Cleaned data, in input order, with invalid records removed.
+        """
+        sized = hasattr(data_iterable, "__len__")
+        
+        if self.n_jobs != 1 and (not sized or len(data_iterable) > self.parallel_threshold):
+            yield from self._iter_clean_parallel(data_iterable)
+        elif self._is_vectorizable(data_iterable):
+            yield from self._clean_batch_vectorized(data_iterable)
+        else:
+            yield from self._iter_clean_records(data_iterable)
         
-        for data in data_list:
+        self.logger.info("Batch cleaning completed. Stats: %s", self.clean_stats)
+    
+    def _is_vectorizable(self, data: Any) -> bool:
+        """
+        Check if data can be cleaned through the cleaner's ``clean_series`` method.
+        
+        Args:
+            data (Any): Data to be cleaned.
+            
+        Returns:
+            bool: True if data can be cleaned as a Series, False otherwise.
+        """
+        return isinstance(data, (list, tuple, np.ndarray, pd.Series)) and _has_matching_clean_series(type(self))
+    
+    def _clean_records(self, data_list: List[Any]) -> List[Any]:
+        """
+        Clean records and update the cleaning statistics.
+        
+        Args:
+            data_list (List[Any]): List of data to be cleaned.
+            
+        Returns:
+            List[Any]: List of cleaned data.
+        """
+        if self._is_vectorizable(data_list):
+            return self._clean_batch_vectorized(data_list)
+        return list(self._iter_clean_records(data_list))
+    
+    def _iter_clean_records(self, data_iterable: Iterable[Any]) -> Iterator[Any]:
+        """
+        Clean records one at a time and update the cleaning statistics.
+        
+        Args:
+            data_iterable (Iterable[Any]): Data to be cleaned.
+            
+        Yields:
+            Any: Cleaned data.
+        """
+        for data in data_iterable:
+            self.clean_stats["total_records"] += 1
             try:
                 cleaned_data = self.clean(data)
-                if cleaned_data is not None:
-                    cleaned_list.append(cleaned_data)
-                    self.clean_stats["cleaned_records"] += 1
-                else:
-                    self.clean_stats["removed_records"] += 1
             except Exception as e:
-                self.logger.error(f"Error cleaning data: {e}")
+                self.logger.error("Error cleaning data: %s", e)
                 self.clean_stats["errors"] += 1
                 self.clean_stats["removed_records"] += 1
+                continue
+            
+            if cleaned_data is not None:
+                self.clean_stats["cleaned_records"] += 1
+                yield cleaned_data
+            else:
+                self.clean_stats["removed_records"] += 1
+    
+    def _iter_clean_parallel(self, data_iterable: Iterable[Any]) -> Iterator[Any]:
+        """
+        Clean data in chunks across worker processes.
+        
+        Sized inputs are split into one chunk per worker; other iterables are
+        read in chunks of ``parallel_threshold`` records. At most two chunks
+        per worker are submitted ahead of the one being yielded.
+        
+        Args:
+            data_iterable (Iterable[Any]): Data to be cleaned.
+            
+        Yields:
+            Any: Cleaned data, in input order.
+        """
+        max_workers = self.n_jobs if self.n_jobs > 0 else (os.cpu_count() or 1)
+        if hasattr(data_iterable, "__len__"):
+            chunk_size = max(1, math.ceil(len(data_iterable) / max_workers))
+        else:
+            chunk_size = max(1, self.parallel_threshold)
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque()
+            for chunk in self._iter_chunks(data_iterable, chunk_size):
+                pending.append(executor.submit(self._clean_chunk, chunk))
+                if len(pending) > 2 * max_workers:
+                    yield from self._merge_chunk(*pending.popleft().result())
+            
+            while pending:
+                yield from self._merge_chunk(*pending.popleft().result())
+    
+    @staticmethod
+    def _iter_chunks(data_iterable: Iterable[Any], chunk_size: int) -> Iterator[Any]:
+        """
+        Split data into chunks, slicing sequences and reading other iterables lazily.
+        
+        Args:
+            data_iterable (Iterable[Any]): Data to split.
+            chunk_size (int): Number of records per chunk.
+            
+        Yields:
+            Any: Chunks of data.
+        """
+        if isinstance(data_iterable, pd.Series):
+            for i in range(0, len(data_iterable), chunk_size):
+                yield data_iterable.iloc[i:i + chunk_size]
+        elif isinstance(data_iterable, (list, tuple, np.ndarray)):
+            for i in range(0, len(data_iterable), chunk_size):
+                yield data_iterable[i:i + chunk_size]
+        else:
+            iterator = iter(data_iterable)
+            while True:
+                chunk = list(itertools.islice(iterator, chunk_size))
+                if not chunk:
+                    return
+                yield chunk
+    
+    def _merge_chunk(self, chunk_cleaned: List[Any], chunk_stats: Dict) -> List[Any]:
+        """
+        Add the statistics of a cleaned chunk to this cleaner's statistics.
+        
+        Args:
+            chunk_cleaned (List[Any]): Cleaned data of the chunk.
+            chunk_stats (Dict): Cleaning statistics of the chunk.
+            
+        Returns:
+            List[Any]: Cleaned data of the chunk.
+        """
+        for key in ("total_records", "cleaned_records", "removed_records", "errors"):
+            self.clean_stats[key] += chunk_stats[key]
+        return chunk_cleaned
+    
+    def _clean_chunk(self, chunk: List[Any]) -> Tuple[List[Any], Dict]:
+        """
+        Clean one chunk of a parallel batch in a worker process.
+        
+        Runs on the worker's copy of the cleaner, so the returned statistics
+        only cover this chunk.
+        
+        Args:
+            chunk (List[Any]): Chunk of data to be cleaned.
+            
+        Returns:
+            Tuple[List[Any], Dict]: Cleaned data and cleaning statistics for the chunk.
+        """
+        self.reset_stats()
+        cleaned_list = self._clean_records(chunk)
+        return cleaned_list, self.clean_stats
+    
+    def _clean_batch_vectorized(self, data_list: List[Any]) -> List[Any]:
+        """
+        Clean a batch of data through the cleaner's ``clean_series`` method.
+        
+        Args:
+            data_list (List[Any]): List of data to be cleaned.
+            
+        Returns:
+            List[Any]: List of cleaned data, with invalid records removed.
+        """
+        series = data_list if isinstance(data_list, pd.Series) else pd.Series(list(data_list), dtype=object)
+        cleaned_list = self.clean_series(series).dropna().tolist()
+        
+        self.clean_stats["total_records"] += len(series)
+        self.clean_stats["cleaned_records"] += len(cleaned_list)
+        self.clean_stats["removed_records"] += len(series) - len(cleaned_list)
         
-        self.logger.info(f"Batch cleaning completed. Stats: {self.clean_stats}")
         return cleaned_list
     
     def get_stats(self) -> Dict:
@@ -3,13 +3,52 @@
 Date and time cleaning utilities.
 """
 
-from datetime import datetime
-from typing import Any, Optional, Union
+import re
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Union
 import dateutil.parser as parser
+import numpy as np
+import pandas as pd
 
-from .base_cleaner import DataCleaner
+from .base_cleaner import DataCleaner, _CACHEABLE_TYPES
 from ..config import Config
 
+# Word characters and whitespace, removed from strings and formats to leave their separators
+_SKELETON_STRIP_RE = re.compile(r"[\w\s]+")
+
+# strptime directives that only match digits, whitespace or AM/PM
+_WORD_DIRECTIVES = frozenset("dfHIjmMpSUwWyY")
+
+_DIRECTIVE_RE = re.compile(r"%(.)")
+
+# Maximum number of string skeletons to remember candidate formats for
+_MAX_SKELETONS = 1024
+
+def _format_skeleton(fmt: str) -> Optional[str]:
+    """
+    Get the separators a string must have to be parsed with a format.
+    
+    Args:
+        fmt (str): strptime format.
+        
+    Returns:
+        Optional[str]: Format literals without word characters and whitespace,
+        or None if the format has directives that can match other characters.
+    """
+    literals = []
+    pos = 0
+    for match in _DIRECTIVE_RE.finditer(fmt):
+        literals.append(fmt[pos:match.start()])
+        directive = match.group(1)
+        if directive == "%":
+            literals.append("%")
+        elif directive not in _WORD_DIRECTIVES:
+            return None
+        pos = match.end()
+    literals.append(fmt[pos:])
+    return _SKELETON_STRIP_RE.sub("", "".join(literals))
+
 class DateTimeCleaner(DataCleaner):
     """
     Date and time cleaning utility class.
@@ -40,101 +79,304 @@ class DateTimeCleaner(DataCleaner):
         ])
         self.output_format = self.config.get("datetime_cleaner.output_format", "%Y-%m-%d %H:%M:%S")
         
+        # Separator skeleton of each input format, and the formats that can match each string skeleton
+        self._format_skeletons = [(fmt, _format_skeleton(fmt)) for fmt in self.input_formats]
+        self._formats_by_skeleton: Dict[str, List[str]] = {}
+        
         # Parse min and max datetime if provided
         self.min_datetime = None
         if self.config.get("datetime_cleaner.min_datetime"):
             try:
                 self.min_datetime = parser.parse(self.config["datetime_cleaner.min_datetime"])
             except Exception as e:
-                self.logger.warning(f"Invalid min_datetime format: {e}")
+                self.logger.warning("Invalid min_datetime format: %s", e)
                 
         self.max_datetime = None
         if self.config.get("datetime_cleaner.max_datetime"):
             try:
                 self.max_datetime = parser.parse(self.config["datetime_cleaner.max_datetime"])
             except Exception as e:
-                self.logger.warning(f"Invalid max_datetime format: {e}")
+                self.logger.warning("Invalid max_datetime format: %s", e)
                 
         self.allow_future = self.config.get("datetime_cleaner.allow_future", True)
+        
+        # Bounds as POSIX timestamps, so validation is a float comparison
+        self._min_ts = self._timestamp(self.min_datetime) if self.min_datetime else None
+        self._max_ts = self._timestamp(self.max_datetime) if self.max_datetime else None
     
-    def clean(self, datetime_str: Any) -> Optional[str]:
+    def clean(self, datetime_str: Any, *, output_format: Optional[str] = None) -> Optional[str]:
         """
         Clean date and time data.
         
+        Strings and numbers are cleaned through a per-instance LRU cache. With
+        allow_future disabled, a cached rejection of a future date is not
+        revisited once that date has passed; call clear_cache to reset it.
+        
+        Args:
+            datetime_str (Any): Date/time string to be cleaned.
+            output_format (str, optional): Output format to use instead of the configured one.
+            
+        Returns:
+            Optional[str]: Cleaned and formatted date/time string, or None if input is invalid.
+        """
+        if isinstance(datetime_str, _CACHEABLE_TYPES):
+            return self._clean_cached(datetime_str, output_format)
+        return self._clean_impl(datetime_str, output_format)
+    
+    def _build_caches(self) -> None:
+        """
+        Create the per-instance caches of cleaned strings and of cleaned datetimes.
+        """
+        super()._build_caches()
+        self._clean_datetime_cached = self._lru_cache(self._clean_datetime_impl)
+    
+    def _clean_impl(self, datetime_str: Any, output_format: Optional[str] = None) -> Optional[str]:
+        """
+        Clean date and time data without the cache.
+        
         Args:
             datetime_str (Any): Date/time string to be cleaned.
+            output_format (str, optional): Output format to use instead of the configured one.
             
         Returns:
             Optional[str]: Cleaned and formatted date/time string, or None if input is invalid.
         """
+        parsed_dt = self.clean_to_datetime(datetime_str)
+        if parsed_dt is None:
+            return None
+        
+        # Format to output format
+        return parsed_dt.strftime(output_format or self.output_format)
+    
+    def clean_to_datetime(self, datetime_str: Any) -> Optional[datetime]:
+        """
+        Clean date and time data into a datetime, without formatting it.
+        
+        Strings and numbers are cleaned through a per-instance LRU cache, with
+        the same caveat about rejected future dates as clean.
+        
+        Args:
+            datetime_str (Any): Date/time string to be cleaned.
+            
+        Returns:
+            Optional[datetime]: Parsed and validated datetime, or None if input is invalid.
+        """
+        if isinstance(datetime_str, _CACHEABLE_TYPES):
+            return self._clean_datetime_cached(datetime_str)
+        return self._clean_datetime_impl(datetime_str)
+    
+    def _clean_datetime_impl(self, datetime_str: Any) -> Optional[datetime]:
+        """
+        Parse and validate date and time data without the cache.
+        
+        Args:
+            datetime_str (Any): Date/time string to be cleaned.
+            
+        Returns:
+            Optional[datetime]: Parsed and validated datetime, or None if input is invalid.
+        """
         if datetime_str is None:
             return None
             
         # Convert to string first
-        try:
-            dt_str = str(datetime_str)
-        except Exception as e:
-            self.logger.error(f"Error converting to string: {e}")
-            return None
+        dt_str = str(datetime_str)
             
         # Try to parse with known formats first
-        parsed_dt = None
-        
-        # Try each input format
-        for fmt in self.input_formats:
-            try:
-                parsed_dt = datetime.strptime(dt_str, fmt)
-                break
-            except ValueError:
-                continue
+        parsed_dt = self._parse_input_formats(dt_str)
         
         # If no format matched, try dateutil parser
         if parsed_dt is None:
             try:
                 parsed_dt = parser.parse(dt_str)
-            except Exception as e:
-                self.logger.warning(f"Could not parse datetime: {dt_str}. Error: {e}")
+            except (ValueError, OverflowError) as e:
+                self.logger.warning("Could not parse datetime: %s. Error: %s", dt_str, e)
                 return None
         
         # Validate datetime
-        if not self.allow_future and parsed_dt > datetime.now():
-            self.logger.warning(f"Future dates not allowed: {parsed_dt}")
-            return None
+        if not self.allow_future or self._min_ts is not None or self._max_ts is not None:
+            parsed_ts = self._timestamp(parsed_dt)
             
-        if self.min_datetime and parsed_dt < self.min_datetime:
-            self.logger.warning(f"Datetime below minimum: {parsed_dt} < {self.min_datetime}")
-            return None
+            if not self.allow_future and parsed_ts > time.time():
+                self.logger.warning("Future dates not allowed: %s", parsed_dt)
+                return None
+                
+            if self._min_ts is not None and parsed_ts < self._min_ts:
+                self.logger.warning("Datetime below minimum: %s < %s", parsed_dt, self.min_datetime)
+                return None
+                
+            if self._max_ts is not None and parsed_ts > self._max_ts:
+                self.logger.warning("Datetime above maximum: %s > %s", parsed_dt, self.max_datetime)
+                return None
+        
+        return parsed_dt
+    
+    def clean_series(self, series: pd.Series) -> pd.Series:
+        """
+        Clean a pandas Series of dates/times in a vectorized pass.
+        
+        Each input format is applied once to the values that are still
+        unparsed, and only the remainder is parsed one value at a time like
+        ``clean``. Datetimes are held at microsecond resolution, so any date a
+        ``datetime`` can hold is kept. When bounds or allow_future are set,
+        values are validated one at a time as POSIX timestamps, like ``clean``,
+        so naive and timezone-aware values and bounds compare the same way.
+        Values that cannot be parsed or fall outside the allowed range are
+        returned as missing.
+        
+        Args:
+            series (pd.Series): Series of date/time strings to be cleaned.
             
-        if self.max_datetime and parsed_dt > self.max_datetime:
-            self.logger.warning(f"Datetime above maximum: {parsed_dt} > {self.max_datetime}")
-            return None
+        Returns:
+            pd.Series: Cleaned and formatted date/time strings.
+        """
+        dt_str = series.astype(str).where(series.notna())
+        parsed = pd.Series(pd.NaT, index=series.index, dtype="datetime64[us]")
+        
+        # Try each input format on the values not parsed yet
+        for fmt in self.input_formats:
+            unparsed = parsed.isna() & dt_str.notna()
+            if not unparsed.any():
+                break
+            try:
+                parsed[unparsed] = pd.to_datetime(dt_str[unparsed], format=fmt, errors="coerce").astype("datetime64[us]")
+            except (OverflowError, TypeError, ValueError):
+                # Leave values pandas cannot convert to the per-value parser
+                break
+        
+        # Parse the rest one value at a time, keeping timezone-aware results to validate them
+        aware = {}
+        unparsed = parsed.isna() & dt_str.notna()
+        if unparsed.any():
+            positions = np.flatnonzero(unparsed.to_numpy())
+            fallback = [self._parse_fallback(value) for value in dt_str.iloc[positions].tolist()]
+            aware = {
+                pos: parsed_dt for pos, parsed_dt in zip(positions.tolist(), fallback)
+                if parsed_dt is not None and parsed_dt.tzinfo is not None
+            }
+            parsed.iloc[positions] = pd.Series(
+                [None if parsed_dt is None else parsed_dt.replace(tzinfo=None) for parsed_dt in fallback],
+                dtype="datetime64[us]"
+            ).to_numpy()
+        
+        # Validate datetimes as POSIX timestamps, as clean does
+        if not self.allow_future or self._min_ts is not None or self._max_ts is not None:
+            timestamps = self._series_timestamps(parsed, aware)
+            invalid = np.zeros(len(parsed), dtype=bool)
+            
+            if not self.allow_future:
+                invalid |= timestamps > time.time()
+                
+            if self._min_ts is not None:
+                invalid |= timestamps < self._min_ts
+                
+            if self._max_ts is not None:
+                invalid |= timestamps > self._max_ts
+            
+            parsed = parsed.mask(invalid)
+        
+        invalid_count = int((parsed.isna() & series.notna()).sum())
+        if invalid_count:
+            self.logger.warning("%s of %s datetimes were invalid or out of range", invalid_count, len(parsed))
         
         # Format to output format
-        return parsed_dt.strftime(self.output_format)
+        return parsed.dt.strftime(self.output_format)
     
-    def clean_date(self, date_str: Any) -> Optional[str]:
+    def _series_timestamps(self, parsed: pd.Series, aware: Dict[int, datetime]) -> np.ndarray:
         """
-        Clean date data (without time).
+        Get the POSIX timestamps of parsed datetimes, as ``_timestamp`` computes them.
         
         Args:
-            date_str (Any): Date string to be cleaned.
+            parsed (pd.Series): Parsed naive datetimes.
+            aware (Dict[int, datetime]): Timezone-aware datetimes by position, overriding the naive ones.
             
         Returns:
-            Optional[str]: Cleaned and formatted date string, or None if input is invalid.
+            np.ndarray: Timestamps, NaN for missing values.
         """
-        # Save current output format
-        original_output_format = self.output_format
+        return np.array([
+            np.nan if pd.isna(value) else self._timestamp(aware.get(pos) or value.to_pydatetime())
+            for pos, value in enumerate(parsed.tolist())
+        ], dtype=np.float64)
+    
+    def _parse_fallback(self, dt_str: str) -> Optional[datetime]:
+        """
+        Parse a date/time string with the input formats, then the dateutil parser.
         
-        # Set output format to date only
-        self.output_format = "%Y-%m-%d"
+        Args:
+            dt_str (str): Date/time string to parse.
+            
+        Returns:
+            Optional[datetime]: Parsed datetime, with its timezone if it has one, or None if it cannot be parsed.
+        """
+        parsed_dt = self._parse_input_formats(dt_str)
+        if parsed_dt is None:
+            try:
+                parsed_dt = parser.parse(dt_str)
+            except (ValueError, OverflowError):
+                return None
+        return parsed_dt
+    
+    def _parse_input_formats(self, dt_str: str) -> Optional[datetime]:
+        """
+        Parse a date/time string with the configured input formats.
         
-        # Clean using the main method
-        cleaned_date = self.clean(date_str)
+        Formats are tried in configuration order, skipping those whose
+        separators cannot match the string's, so a column in a single format
+        needs one ``strptime`` call per value unless several formats share
+        its separators.
         
-        # Restore original output format
-        self.output_format = original_output_format
+        Args:
+            dt_str (str): Date/time string to parse.
+            
+        Returns:
+            Optional[datetime]: Parsed datetime, or None if no input format matches.
+        """
+        skeleton = _SKELETON_STRIP_RE.sub("", dt_str)
+        candidates = self._formats_by_skeleton.get(skeleton)
+        if candidates is None:
+            candidates = [
+                fmt for fmt, fmt_skeleton in self._format_skeletons
+                if fmt_skeleton is None or fmt_skeleton == skeleton
+            ]
+            if len(self._formats_by_skeleton) < _MAX_SKELETONS:
+                self._formats_by_skeleton[skeleton] = candidates
+        
+        for fmt in candidates:
+            try:
+                return datetime.strptime(dt_str, fmt)
+            except ValueError:
+                continue
         
-        return cleaned_date
+        return None
+    
+    @staticmethod
+    def _timestamp(dt: datetime) -> float:
+        """
+        Get the POSIX timestamp of a datetime, treating naive datetimes as local time.
+        
+        Args:
+            dt (datetime): Datetime to convert.
+            
+        Returns:
+            float: POSIX timestamp. Naive datetimes too early for the local
+            time conversion are treated as UTC.
+        """
+        try:
+            return dt.timestamp()
+        except (ValueError, OverflowError, OSError):
+            return dt.replace(tzinfo=timezone.utc).timestamp()
+    
+    def clean_date(self, date_str: Any) -> Optional[str]:
+        """
+        Clean date data (without time).
+        
+        Args:
+            date_str (Any): Date string to be cleaned.
+            
+        Returns:
+            Optional[str]: Cleaned and formatted date string, or None if input is invalid.
+        """
+        # Clean using the main method with a date only output format
+        return self.clean(date_str, output_format="%Y-%m-%d")
     
     def clean_time(self, time_str: Any) -> Optional[str]:
         """
@@ -149,24 +391,8 @@ class DateTimeCleaner(DataCleaner):
         if time_str is None:
             return None
             
-        try:
-            # Add a dummy date to use the main clean method
-            dt_str = f"2000-01-01 {time_str}"
-            
-            # Save current output format
-            original_output_format = self.output_format
-            
-            # Set output format to time only
-            self.output_format = "%H:%M:%S"
-            
-            # Clean using the main method
-            cleaned_time = self.clean(dt_str)
-            
-            # Restore original output format
-            self.output_format = original_output_format
-            
-            return cleaned_time
-            
-        except Exception as e:
-            self.logger.error(f"Error cleaning time: {e}")
-            return None
+        # Add a dummy date to use the main clean method
+        dt_str = f"2000-01-01 {time_str}"
+        
+        # Clean using the main method with a time only output format
+        return self.clean(dt_str, output_format="%H:%M:%S")
@@ -4,11 +4,25 @@ Email address cleaning utilities.
 """
 
 import re
-from typing import Any, Optional
+from typing import Any, NamedTuple, Optional
 
 from .base_cleaner import DataCleaner
 from ..config import Config
 
+# Common disposable email domains
+DISPOSABLE_DOMAINS = frozenset({
+    "gmail.com", "yahoo.com", "hotmail.com", "outlook.com", "icloud.com",
+    "protonmail.com", "aol.com", "mail.com", "yandex.com", "zoho.com"
+})
+
+class _CleanedEmail(NamedTuple):
+    """
+    Cleaned email address with its local part and domain.
+    """
+    full: str
+    local: str
+    domain: str
+
 class EmailCleaner(DataCleaner):
     """
     Email address cleaning utility class.
@@ -16,7 +30,7 @@ class EmailCleaner(DataCleaner):
     Attributes:
         allow_subdomains (bool): Whether to allow subdomains.
         allow_special_chars (bool): Whether to allow special characters in local part.
-        valid_domains (Optional[List[str]]): List of allowed domains, or None to allow all.
+        valid_domains (Optional[FrozenSet[str]]): Set of allowed domains, or None to allow all.
     """
     
     def __init__(self, config: Optional[Config] = None):
@@ -31,78 +45,126 @@ class EmailCleaner(DataCleaner):
         # Get configuration from config object
         self.allow_subdomains = self.config.get("email_cleaner.allow_subdomains", True)
         self.allow_special_chars = self.config.get("email_cleaner.allow_special_chars", True)
-        self.valid_domains = self.config.get("email_cleaner.valid_domains", None)
+        valid_domains = self.config.get("email_cleaner.valid_domains", None)
+        self.valid_domains = frozenset(valid_domains) if valid_domains else None
         
-        # Compile regex patterns
+        # Compile a single email pattern whose local part and domain follow the configuration
         if self.allow_special_chars:
             # Allow common special characters in local part
-            self.local_part_pattern = re.compile(r"^[a-zA-Z0-9._%+-]+$")
+            local_part = r"[a-zA-Z0-9._%+-]+"
         else:
             # Only allow alphanumeric and underscore
-            self.local_part_pattern = re.compile(r"^[a-zA-Z0-9_]+$")
+            local_part = r"[a-zA-Z0-9_]+"
             
         if self.allow_subdomains:
-            self.domain_pattern = re.compile(r"^[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+            domain = r"[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}"
         else:
-            self.domain_pattern = re.compile(r"^[a-zA-Z0-9]+\.[a-zA-Z]{2,}$")
+            domain = r"[a-zA-Z0-9]+\.[a-zA-Z]{2,}"
         
-        # Full email pattern
-        self.email_pattern = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+        self.email_pattern = re.compile(rf"(?P<local>{local_part})@(?P<domain>{domain})")
+    
+    def _build_caches(self) -> None:
+        """
+        Create the per-instance cache of parsed addresses, which also serves clean.
+        """
+        self._parse_cached = self._lru_cache(self._parse_email)
     
     def clean(self, email: Any) -> Optional[str]:
         """
         Clean email address.
         
+        String inputs are parsed through a per-instance LRU cache, shared with
+        extract_domain and extract_local_part.
+        
         Args:
             email (Any): Email address to be cleaned.
             
         Returns:
             Optional[str]: Cleaned email address, or None if input is invalid.
         """
-        if email is None:
-            return None
+        parsed = self._parse(email)
+        return parsed.full if parsed else None
+    
+    def _clean_impl(self, email: Any) -> Optional[str]:
+        """
+        Clean email address without the cache.
+        
+        Args:
+            email (Any): Email address to be cleaned.
             
-        # Convert to string and strip whitespace
-        try:
-            email_str = str(email).strip().lower()
-        except Exception as e:
-            self.logger.error(f"Error converting to string: {e}")
-            return None
+        Returns:
+            Optional[str]: Cleaned email address, or None if input is invalid.
+        """
+        parsed = self._parse_email(email) if email is not None else None
+        return parsed.full if parsed else None
+    
+    def _parse(self, email: Any) -> Optional[_CleanedEmail]:
+        """
+        Parse an email address, using the cache for string inputs.
         
-        # Basic format validation
-        if not self.email_pattern.match(email_str):
-            self.logger.warning(f"Invalid email format: {email_str}")
+        Args:
+            email (Any): Email address to be parsed.
+            
+        Returns:
+            Optional[_CleanedEmail]: Parsed email address, or None if input is invalid.
+        """
+        if email is None:
             return None
+        if isinstance(email, str):
+            return self._parse_cached(email)
+        return self._parse_email(email)
+    
+    def _parse_email(self, email: Any) -> Optional[_CleanedEmail]:
+        """
+        Clean an email address and split it into its parts.
         
-        # Split into local part and domain
-        local_part, domain = email_str.split("@", 1)
+        Args:
+            email (Any): Email address to be parsed.
+            
+        Returns:
+            Optional[_CleanedEmail]: Parsed email address, or None if input is invalid.
+        """
+        # Convert to string and strip whitespace
+        email_str = str(email).strip().lower()
         
-        # Validate local part
-        if not self.local_part_pattern.match(local_part):
-            self.logger.warning(f"Invalid local part in email: {local_part}")
+        # Validate format, local part and domain in a single match
+        match = self.email_pattern.fullmatch(email_str)
+        if not match:
+            self.logger.warning("Invalid email format: %s", email_str)
             return None
         
-        # Validate domain
-        if not self.domain_pattern.match(domain):
-            self.logger.warning(f"Invalid domain in email: {domain}")
-            return None
+        local_part, domain = match.group("local", "domain")
         
         # Check if domain is in valid domains list
         if self.valid_domains and domain not in self.valid_domains:
-            self.logger.warning(f"Domain not allowed: {domain}")
+            self.logger.warning("Domain not allowed: %s", domain)
             return None
         
         # Check for common disposable email domains
-        disposable_domains = [
-            "gmail.com", "yahoo.com", "hotmail.com", "outlook.com", "icloud.com",
-            "protonmail.com", "aol.com", "mail.com", "yandex.com", "zoho.com"
-        ]
-        
-        if domain in disposable_domains:
-            self.logger.info(f"Disposable email domain detected: {domain}")
+        if domain in DISPOSABLE_DOMAINS:
+            self.logger.info("Disposable email domain detected: %s", domain)
             # We still return it, just log the information
         
-        return email_str
+        return _CleanedEmail(email_str, local_part, domain)
+    
+    def _is_valid(self, email: Any) -> bool:
+        """
+        Check if an email address would be kept by cleaning, without logging.
+        
+        Args:
+            email (Any): Email address to check.
+            
+        Returns:
+            bool: True if the email address is valid, False otherwise.
+        """
+        if email is None:
+            return False
+        
+        match = self.email_pattern.fullmatch(str(email).strip().lower())
+        if not match:
+            return False
+        
+        return not self.valid_domains or match.group("domain") in self.valid_domains
     
     def extract_domain(self, email: Any) -> Optional[str]:
         """
@@ -114,10 +176,8 @@ class EmailCleaner(DataCleaner):
         Returns:
             Optional[str]: Extracted domain, or None if email is invalid.
         """
-        cleaned_email = self.clean(email)
-        if cleaned_email:
-            return cleaned_email.split("@", 1)[1]
-        return None
+        parsed = self._parse(email)
+        return parsed.domain if parsed else None
     
     def extract_local_part(self, email: Any) -> Optional[str]:
         """
@@ -129,7 +189,5 @@ class EmailCleaner(DataCleaner):
         Returns:
             Optional[str]: Extracted local part, or None if email is invalid.
         """
-        cleaned_email = self.clean(email)
-        if cleaned_email:
-            return cleaned_email.split("@", 1)[0]
-        return None
+        parsed = self._parse(email)
+        return parsed.local if parsed else None
@@ -6,9 +6,60 @@ Number cleaning utilities.
 import re
 from typing import Any, Optional, Union
 
+import numpy as np
+import pandas as pd
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
 from .base_cleaner import DataCleaner
 from ..config import Config
 
+# Plain number format accepted after formatting removal
+_NUMBER_RE = re.compile(r"^-?\d+(\.\d+)?$")
+
+# Well-formed number with optional sign, thousands separators and fraction
+_FORMATTED_NUMBER_RE = re.compile(r"\s*(-?)\s*(\d{1,3}(?:[, ]\d{3})*|\d+)(?:\.(\d+))?\s*")
+
+# Magnitude from which integers no longer fit in int64
+_INT64_LIMIT = 2 ** 63
+
+# Longest number string pandas parses to the same float as float()
+_MAX_EXACT_DIGITS = 15
+
+if numba is not None:
+    @numba.njit(cache=True, parallel=True)
+    def _out_of_bounds(values: np.ndarray, min_value: float, max_value: float,
+                       allow_negative: bool, allow_decimal: bool) -> np.ndarray:
+        """
+        Flag values that break the sign, decimal or range constraints, in a single parallel pass.
+        """
+        mask = np.empty(values.shape[0], dtype=np.bool_)
+        for i in numba.prange(values.shape[0]):
+            value = values[i]
+            mask[i] = (
+                value < min_value
+                or value > max_value
+                or (not allow_negative and value < 0)
+                or (not allow_decimal and value % 1 != 0)
+            )
+        return mask
+else:
+    def _out_of_bounds(values: np.ndarray, min_value: float, max_value: float,
+                       allow_negative: bool, allow_decimal: bool) -> np.ndarray:
+        """
+        Flag values that break the sign, decimal or range constraints.
+        """
+        mask = (values < min_value) | (values > max_value)
+        if not allow_negative:
+            mask |= values < 0
+        if not allow_decimal:
+            with np.errstate(invalid="ignore"):
+                mask |= np.mod(values, 1) != 0
+        return mask
+
 class NumberCleaner(DataCleaner):
     """
     Number cleaning utility class.
@@ -42,7 +93,7 @@ class NumberCleaner(DataCleaner):
         # Compile regex pattern for formatting removal
         self.formatting_pattern = re.compile(r"[^\d.-]")
     
-    def clean(self, number: Any) -> Optional[Union[int, float]]:
+    def _clean_impl(self, number: Any) -> Optional[Union[int, float]]:
         """
         Clean number data.
         
@@ -56,54 +107,178 @@ class NumberCleaner(DataCleaner):
             return None
             
         # Convert to string first for cleaning
-        try:
-            number_str = str(number)
-        except Exception as e:
-            self.logger.error(f"Error converting to string: {e}")
+        number_str = str(number)
+        
+        float_num = self._parse_float(number_str)
+        if float_num is None:
+            self.logger.warning("Invalid number format: %s", number_str)
+            return None
+        
+        # Check negative numbers
+        if not self.allow_negative and float_num < 0:
+            self.logger.warning("Negative numbers not allowed: %s", float_num)
+            return None
+        
+        # Check decimal numbers
+        if not self.allow_decimal and float_num % 1 != 0:
+            self.logger.warning("Decimal numbers not allowed: %s", float_num)
+            return None
+        
+        # Check range constraints
+        if self.min_value is not None and float_num < self.min_value:
+            self.logger.warning("Number below minimum value %s: %s", self.min_value, float_num)
+            return None
+        
+        if self.max_value is not None and float_num > self.max_value:
+            self.logger.warning("Number above maximum value %s: %s", self.max_value, float_num)
             return None
         
+        # Convert to the default type
+        if self.default_type == int:
+            return int(float_num)
+        else:
+            return float_num
+    
+    def _parse_float(self, number_str: str) -> Optional[float]:
+        """
+        Parse a number string, removing formatting if configured.
+        
+        Args:
+            number_str (str): Number string to parse.
+            
+        Returns:
+            Optional[float]: Parsed number, or None if the format is invalid.
+        """
+        # Parse well-formed numbers in a single match
+        match = _FORMATTED_NUMBER_RE.fullmatch(number_str) if self.remove_formatting else None
+        
+        if match:
+            sign, integer_part, fraction = match.groups()
+            integer_part = integer_part.replace(",", "").replace(" ", "")
+            return float(f"{sign}{integer_part}.{fraction or '0'}")
+        
         # Remove formatting characters
         if self.remove_formatting:
             number_str = self.formatting_pattern.sub("", number_str)
         
-        # Validate and convert to number
-        try:
-            # Check if it's a valid number format
-            if not re.match(r"^-?\d+(\.\d+)?$", number_str):
-                self.logger.warning(f"Invalid number format: {number_str}")
-                return None
-            
-            # Convert to float first for validation
-            float_num = float(number_str)
-            
-            # Check negative numbers
-            if not self.allow_negative and float_num < 0:
-                self.logger.warning(f"Negative numbers not allowed: {float_num}")
-                return None
+        # Check if it's a valid number format
+        if not _NUMBER_RE.match(number_str):
+            return None
+        
+        return float(number_str)
+    
+    def _is_valid(self, number: Any) -> bool:
+        """
+        Check if a number would be kept by cleaning, without converting it.
+        
+        Args:
+            number (Any): Number to check.
             
-            # Check decimal numbers
-            if not self.allow_decimal and float_num % 1 != 0:
-                self.logger.warning(f"Decimal numbers not allowed: {float_num}")
-                return None
+        Returns:
+            bool: True if the number is valid, False otherwise.
+        """
+        if number is None:
+            return False
+        
+        float_num = self._parse_float(str(number))
+        if float_num is None:
+            return False
+        
+        return (
+            (self.allow_negative or float_num >= 0)
+            and (self.allow_decimal or float_num % 1 == 0)
+            and (self.min_value is None or float_num >= self.min_value)
+            and (self.max_value is None or float_num <= self.max_value)
+        )
+    
+    def clean_series(self, series: pd.Series) -> pd.Series:
+        """
+        Clean a pandas Series of numbers in a single vectorized pass.
+        
+        Applies the same rules as ``clean`` but over the whole column at once.
+        Invalid values are returned as missing (NaN, or <NA> for integers).
+        
+        Args:
+            series (pd.Series): Series of numbers to be cleaned.
             
-            # Check range constraints
-            if self.min_value is not None and float_num < self.min_value:
-                self.logger.warning(f"Number below minimum value {self.min_value}: {float_num}")
-                return None
+        Returns:
+            pd.Series: Cleaned numbers, as nullable Int64 if the default type is int (object
+            holding Python ints if any is beyond int64), float64 otherwise.
+        """
+        number_str = series.astype(str)
+        
+        # Remove formatting characters
+        if self.remove_formatting:
+            number_str = number_str.str.replace(self.formatting_pattern, "", regex=True)
+        
+        # Only convert values that pass the number format check
+        valid_format = number_str.str.fullmatch(_NUMBER_RE)
+        float_nums = pd.to_numeric(number_str.where(valid_format), errors="coerce").astype(float)
+        
+        # pandas only parses ASCII digits, and rounds long numbers differently from float,
+        # so parse those one value at a time like clean
+        per_value = number_str.notna() & (
+            number_str.str.isascii().eq(False) | number_str.str.len().gt(_MAX_EXACT_DIGITS)
+        )
+        if per_value.any():
+            float_nums[per_value] = number_str[per_value].map(self._parse_plain)
+        
+        # Apply sign, decimal and range constraints as a single mask
+        float_nums = float_nums.mask(_out_of_bounds(
+            float_nums.to_numpy(dtype=float),
+            -np.inf if self.min_value is None else float(self.min_value),
+            np.inf if self.max_value is None else float(self.max_value),
+            bool(self.allow_negative),
+            bool(self.allow_decimal)
+        ))
+        
+        invalid_count = int(float_nums.isna().sum())
+        if invalid_count:
+            self.logger.warning("%s of %s numbers were invalid or out of range", invalid_count, len(float_nums))
+        
+        # Convert to the default type
+        if self.default_type == int:
+            return self._to_int_series(float_nums)
+        return float_nums
+    
+    def _to_int_series(self, float_nums: pd.Series) -> pd.Series:
+        """
+        Truncate cleaned numbers to integers, as ``int`` does in ``clean``.
+        
+        Infinite values cannot be converted and are returned as missing.
+        
+        Args:
+            float_nums (pd.Series): Cleaned numbers.
             
-            if self.max_value is not None and float_num > self.max_value:
-                self.logger.warning(f"Number above maximum value {self.max_value}: {float_num}")
-                return None
+        Returns:
+            pd.Series: Nullable Int64 integers, or Python ints in an object
+            Series if any value is outside the int64 range.
+        """
+        float_nums = float_nums.mask(np.isinf(float_nums))
+        truncated = np.trunc(float_nums)
+        
+        if (truncated.abs() < _INT64_LIMIT).where(truncated.notna(), True).all():
+            return truncated.astype("Int64")
+        
+        # Convert values one at a time when any is beyond int64
+        return pd.Series(
+            [None if np.isnan(value) else int(value) for value in float_nums.tolist()],
+            index=float_nums.index,
+            dtype=object
+        )
+    
+    @staticmethod
+    def _parse_plain(number_str: str) -> float:
+        """
+        Parse a number string that formatting has already been removed from.
+        
+        Args:
+            number_str (str): Number string to parse.
             
-            # Convert to the default type
-            if self.default_type == int:
-                return int(float_num)
-            else:
-                return float_num
-                
-        except Exception as e:
-            self.logger.error(f"Error processing number {number_str}: {e}")
-            return None
+        Returns:
+            float: Parsed number, or NaN if the format is invalid.
+        """
+        return float(number_str) if _NUMBER_RE.match(number_str) else np.nan
     
     def clean_currency(self, currency: Any, currency_symbol: str = "$") -> Optional[Union[int, float]]:
         """
@@ -120,11 +295,7 @@ class NumberCleaner(DataCleaner):
             return None
             
         # Remove currency symbol
-        try:
-            currency_str = str(currency).replace(currency_symbol, "")
-        except Exception as e:
-            self.logger.error(f"Error processing currency: {e}")
-            return None
+        currency_str = str(currency).replace(currency_symbol, "")
             
         # Use regular clean method for the rest
         return self.clean(currency_str)
@@ -143,11 +314,7 @@ class NumberCleaner(DataCleaner):
             return None
             
         # Remove percentage symbol
-        try:
-            percentage_str = str(percentage).replace("%", "")
-        except Exception as e:
-            self.logger.error(f"Error processing percentage: {e}")
-            return None
+        percentage_str = str(percentage).replace("%", "")
             
         # Clean as regular number
         cleaned_num = self.clean(percentage_str)
@@ -4,11 +4,35 @@ Text cleaning utilities.
 """
 
 import re
-from typing import Any, Optional
+from typing import Any, Callable, Dict, Optional
+
+import pandas as pd
 
 from .base_cleaner import DataCleaner
 from ..config import Config
 
+# Validation patterns used by clean_email and clean_url
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_URL_RE = re.compile(r"^(https?://)?([\da-z.-]+)\.([a-z.]{2,6})([/\w .-]*)*/?$")
+
+# Numbered or named backreference, or group conditional, inside a replace pattern
+_GROUP_REFERENCE_RE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+# Flags of a pattern compiled without inline flags
+_DEFAULT_FLAGS = re.compile("").flags
+
+def _ascii_deletion_table(keep: Callable[[str], bool]) -> Dict[int, Optional[int]]:
+    """
+    Build a ``str.translate`` table over ASCII that deletes characters not kept by a predicate.
+    
+    Kept characters map to themselves so every ASCII lookup hits the table.
+    """
+    return {codepoint: codepoint if keep(chr(codepoint)) else None for codepoint in range(128)}
+
+# Translation tables for the ASCII fast path of [^a-zA-Z0-9\s] and \d removal
+_ASCII_SPECIAL_CHARS_TABLE = _ascii_deletion_table(lambda char: char.isalnum() or char.isspace())
+_ASCII_DIGITS_TABLE = _ascii_deletion_table(lambda char: not char.isdigit())
+
 class TextCleaner(DataCleaner):
     """
     Text cleaning utility class.
@@ -21,6 +45,7 @@ class TextCleaner(DataCleaner):
         remove_digits (bool): Whether to remove digits.
         strip_whitespace (bool): Whether to strip whitespace from both ends.
         replace_patterns (dict): Dictionary of patterns to replace.
+        combine_replace_patterns (bool): Whether to apply all replace patterns in a single scan.
     """
     
     def __init__(self, config: Optional[Config] = None):
@@ -40,14 +65,22 @@ class TextCleaner(DataCleaner):
         self.remove_digits = self.config.get("text_cleaner.remove_digits", False)
         self.strip_whitespace = self.config.get("text_cleaner.strip_whitespace", True)
         self.replace_patterns = self.config.get("text_cleaner.replace_patterns", {})
+        self.combine_replace_patterns = self.config.get("text_cleaner.combine_replace_patterns", False)
         
         # Compile regex patterns for performance
         self.special_chars_pattern = re.compile(r"[^a-zA-Z0-9\s]")
         self.extra_spaces_pattern = re.compile(r"\s+")
         self.newlines_pattern = re.compile(r"[\r\n]+")
         self.digits_pattern = re.compile(r"\d+")
+        
+        # Compile custom replace patterns
+        self._compiled_replace = [
+            (re.compile(pattern), replacement)
+            for pattern, replacement in self.replace_patterns.items()
+        ]
+        self._combined_replace = self._combine_replace_patterns() if self.combine_replace_patterns else None
     
-    def clean(self, text: Any) -> Optional[str]:
+    def _clean_impl(self, text: Any) -> Optional[str]:
         """
         Clean text data.
         
@@ -61,18 +94,14 @@ class TextCleaner(DataCleaner):
             return None
             
         # Convert to string
-        try:
-            cleaned_text = str(text)
-        except Exception as e:
-            self.logger.error(f"Error converting to string: {e}")
-            return None
+        cleaned_text = str(text)
         
         # Apply cleaning operations based on configuration
         if self.lowercase:
             cleaned_text = cleaned_text.lower()
             
         if self.remove_special_chars:
-            cleaned_text = self.special_chars_pattern.sub("", cleaned_text)
+            cleaned_text = self._remove_special_chars(cleaned_text)
             
         if self.remove_extra_spaces:
             cleaned_text = self.extra_spaces_pattern.sub(" ", cleaned_text)
@@ -81,18 +110,144 @@ class TextCleaner(DataCleaner):
             cleaned_text = self.newlines_pattern.sub(" ", cleaned_text)
             
         if self.remove_digits:
-            cleaned_text = self.digits_pattern.sub("", cleaned_text)
+            cleaned_text = self._remove_digits(cleaned_text)
             
         if self.strip_whitespace:
             cleaned_text = cleaned_text.strip()
             
         # Apply custom replace patterns
-        for pattern, replacement in self.replace_patterns.items():
-            cleaned_text = re.sub(pattern, replacement, cleaned_text)
+        if self._combined_replace is not None:
+            cleaned_text = self._combined_replace.sub(self._replace_match, cleaned_text)
+        else:
+            for pattern, replacement in self._compiled_replace:
+                cleaned_text = pattern.sub(replacement, cleaned_text)
         
         # Return None if text is empty after cleaning
         return cleaned_text if cleaned_text else None
     
+    def clean_series(self, series: pd.Series) -> pd.Series:
+        """
+        Clean a pandas Series of text in a single vectorized pass.
+        
+        Applies the same operations as ``clean``, each stage running once over
+        the whole column. As in ``clean``, None and texts that are empty after
+        cleaning are returned as missing, while other missing markers such as
+        NaN are cleaned as their text.
+        
+        Args:
+            series (pd.Series): Series of text to be cleaned.
+            
+        Returns:
+            pd.Series: Cleaned text.
+        """
+        cleaned_text = series.astype(str)
+        missing = series.isna()
+        if missing.any():
+            cleaned_text[missing] = [None if value is None else str(value) for value in series[missing]]
+        
+        # Apply cleaning operations based on configuration
+        if self.lowercase:
+            cleaned_text = cleaned_text.str.lower()
+            
+        if self.remove_special_chars:
+            cleaned_text = cleaned_text.map(self._remove_special_chars, na_action="ignore")
+            
+        if self.remove_extra_spaces:
+            cleaned_text = cleaned_text.str.replace(self.extra_spaces_pattern, " ", regex=True)
+            
+        if self.remove_newlines:
+            cleaned_text = cleaned_text.str.replace(self.newlines_pattern, " ", regex=True)
+            
+        if self.remove_digits:
+            cleaned_text = cleaned_text.map(self._remove_digits, na_action="ignore")
+            
+        if self.strip_whitespace:
+            cleaned_text = cleaned_text.str.strip()
+            
+        # Apply custom replace patterns
+        if self._combined_replace is not None:
+            cleaned_text = cleaned_text.str.replace(self._combined_replace, self._replace_match, regex=True)
+        else:
+            for pattern, replacement in self._compiled_replace:
+                cleaned_text = cleaned_text.str.replace(pattern, replacement, regex=True)
+        
+        # Mark texts that are empty after cleaning as missing
+        return cleaned_text.mask(cleaned_text == "")
+    
+    def _remove_special_chars(self, text: str) -> str:
+        """
+        Remove special characters, using a translation table for ASCII text.
+        
+        Args:
+            text (str): Text to clean.
+            
+        Returns:
+            str: Text without special characters.
+        """
+        if text.isascii():
+            return text.translate(_ASCII_SPECIAL_CHARS_TABLE)
+        return self.special_chars_pattern.sub("", text)
+    
+    def _remove_digits(self, text: str) -> str:
+        """
+        Remove digits, using a translation table for ASCII text.
+        
+        Args:
+            text (str): Text to clean.
+            
+        Returns:
+            str: Text without digits.
+        """
+        if text.isascii():
+            return text.translate(_ASCII_DIGITS_TABLE)
+        return self.digits_pattern.sub("", text)
+    
+    def _combine_replace_patterns(self) -> Optional[re.Pattern]:
+        """
+        Combine the custom replace patterns into a single alternation.
+        
+        With the combined pattern, text is scanned once and every match is
+        replaced according to the pattern that matched, instead of applying
+        the patterns one after another. Replacements are therefore not
+        re-scanned by later patterns, and where matches overlap the leftmost
+        one wins. Patterns that refer to their groups, define named groups or
+        set global inline flags such as (?i) cannot be combined, and keep the
+        sequential behaviour.
+        
+        Returns:
+            Optional[re.Pattern]: Combined pattern, or None if the patterns are applied one by one.
+        """
+        if len(self._compiled_replace) < 2:
+            return None
+        
+        for pattern, _ in self._compiled_replace:
+            if (pattern.flags != _DEFAULT_FLAGS or pattern.groupindex
+                    or _GROUP_REFERENCE_RE.search(pattern.pattern)):
+                self.logger.warning("Replace pattern %s cannot be combined, applying patterns one by one", pattern.pattern)
+                return None
+        
+        try:
+            return re.compile("|".join(
+                f"(?P<_replace{i}>{pattern.pattern})"
+                for i, (pattern, _) in enumerate(self._compiled_replace)
+            ))
+        except re.error as e:
+            self.logger.warning("Replace patterns cannot be combined, applying them one by one: %s", e)
+            return None
+    
+    def _replace_match(self, match: re.Match) -> str:
+        """
+        Get the replacement for a match of the combined replace pattern.
+        
+        Args:
+            match (re.Match): Match of the combined replace pattern.
+            
+        Returns:
+            str: Replacement text, expanded from the pattern that matched.
+        """
+        pattern, replacement = self._compiled_replace[int(match.lastgroup[len("_replace"):])]
+        return pattern.match(match.string, match.start()).expand(replacement)
+    
     def clean_email(self, email: Any) -> Optional[str]:
         """
         Clean and validate email address.
@@ -108,11 +263,10 @@ class TextCleaner(DataCleaner):
             return None
             
         # Basic email validation
-        email_pattern = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
-        if email_pattern.match(cleaned_email):
+        if _EMAIL_RE.match(cleaned_email):
             return cleaned_email
         else:
-            self.logger.warning(f"Invalid email format: {cleaned_email}")
+            self.logger.warning("Invalid email format: %s", cleaned_email)
             return None
     
     def clean_url(self, url: Any) -> Optional[str]:
@@ -130,12 +284,11 @@ class TextCleaner(DataCleaner):
             return None
             
         # Basic URL validation
-        url_pattern = re.compile(r"^(https?://)?([\da-z.-]+)\.([a-z.]{2,6})([/\w .-]*)*/?$")
-        if url_pattern.match(cleaned_url):
+        if _URL_RE.match(cleaned_url):
             # Add http:// if missing
             if not cleaned_url.startswith(("http://", "https://")):
                 cleaned_url = f"http://{cleaned_url}"
             return cleaned_url
         else:
-            self.logger.warning(f"Invalid URL format: {cleaned_url}")
+            self.logger.warning("Invalid URL format: %s", cleaned_url)
             return None
@@ -4,23 +4,57 @@ URL cleaning utilities.
 """
 
 import re
-from typing import Any, Optional
-from urllib.parse import urlparse, urlunparse
+from typing import Any, NamedTuple, Optional
+from urllib.parse import urlsplit, urlunsplit
 
 from .base_cleaner import DataCleaner
 from ..config import Config
 
+# URL host and character patterns, see _is_valid_url
+_URL_HOST_RE = re.compile(r"[\da-z.-]+\.[a-z.]{2}")
+_URL_CHARS_RE = re.compile(r"[/\w .-]*$")
+
+def _is_valid_url(url_str: str) -> bool:
+    """
+    Check if a string has a valid URL format, in time linear in its length.
+    
+    Accepts the same strings as ``^(https?://)?([\da-z.-]+)\.([a-z.]{2,6})([/\w .-]*)*/?$``
+    without its nested quantifier, which backtracks exponentially on long
+    invalid URLs. Every character after the scheme must be a path character,
+    and the host must start with a name followed by a dot and at least two
+    lowercase letters or dots.
+    
+    Args:
+        url_str (str): URL to check.
+        
+    Returns:
+        bool: True if the URL format is valid, False otherwise.
+    """
+    if url_str.startswith("http://"):
+        url_str = url_str[7:]
+    elif url_str.startswith("https://"):
+        url_str = url_str[8:]
+    return _URL_CHARS_RE.match(url_str) is not None and _URL_HOST_RE.match(url_str) is not None
+
+class _CleanedURL(NamedTuple):
+    """
+    Cleaned URL with its network location and path.
+    """
+    full: str
+    netloc: str
+    path: str
+
 class URLCleaner(DataCleaner):
     """
     URL cleaning utility class.
     
     Attributes:
         add_scheme (bool): Whether to add http:// if no scheme is present.
-        allowed_schemes (List[str]): List of allowed schemes.
+        allowed_schemes (FrozenSet[str]): Set of allowed schemes.
         remove_www (bool): Whether to remove www prefix.
         remove_query_params (bool): Whether to remove query parameters.
         remove_fragments (bool): Whether to remove fragments.
-        valid_domains (Optional[List[str]]): List of allowed domains, or None to allow all.
+        valid_domains (Optional[FrozenSet[str]]): Set of allowed domains, or None to allow all.
     """
     
     def __init__(self, config: Optional[Config] = None):
@@ -33,40 +67,82 @@ class URLCleaner(DataCleaner):
         super().__init__(config)
         
         # Get configuration from config object
-        self.add_scheme = self.config.get("url_cleaner.add_scheme", True)
-        self.allowed_schemes = self.config.get("url_cleaner.allowed_schemes", ["http", "https"])
-        self.remove_www = self.config.get("url_cleaner.remove_www", False)
-        self.remove_query_params = self.config.get("url_cleaner.remove_query_params", False)
-        self.remove_fragments = self.config.get("url_cleaner.remove_fragments", True)
-        self.valid_domains = self.config.get("url_cleaner.valid_domains", None)
-        
-        # Compile regex patterns
-        self.url_pattern = re.compile(r"^(https?://)?([\da-z.-]+)\.([a-z.]{2,6})([/\w .-]*)*/?$")
-        self.www_pattern = re.compile(r"^www\.")
+        settings = self.config.section("url_cleaner")
+        self.add_scheme = getattr(settings, "add_scheme", True)
+        self.allowed_schemes = frozenset(getattr(settings, "allowed_schemes", ["http", "https"]))
+        self.remove_www = getattr(settings, "remove_www", False)
+        self.remove_query_params = getattr(settings, "remove_query_params", False)
+        self.remove_fragments = getattr(settings, "remove_fragments", True)
+        valid_domains = getattr(settings, "valid_domains", None)
+        self.valid_domains = frozenset(valid_domains) if valid_domains else None
+    
+    def _build_caches(self) -> None:
+        """
+        Create the per-instance cache of parsed URLs, which also serves clean.
+        """
+        self._parse_cached = self._lru_cache(self._parse_url)
     
     def clean(self, url: Any) -> Optional[str]:
         """
         Clean URL address.
         
+        String inputs are parsed through a per-instance LRU cache, shared with
+        extract_domain and extract_path.
+        
+        Args:
+            url (Any): URL to be cleaned.
+            
+        Returns:
+            Optional[str]: Cleaned URL, or None if input is invalid.
+        """
+        parsed = self._parse(url)
+        return parsed.full if parsed else None
+    
+    def _clean_impl(self, url: Any) -> Optional[str]:
+        """
+        Clean URL address without the cache.
+        
         Args:
             url (Any): URL to be cleaned.
             
         Returns:
             Optional[str]: Cleaned URL, or None if input is invalid.
         """
+        parsed = self._parse_url(url) if url is not None else None
+        return parsed.full if parsed else None
+    
+    def _parse(self, url: Any) -> Optional[_CleanedURL]:
+        """
+        Parse a URL, using the cache for string inputs.
+        
+        Args:
+            url (Any): URL to be parsed.
+            
+        Returns:
+            Optional[_CleanedURL]: Parsed URL, or None if input is invalid.
+        """
         if url is None:
             return None
+        if isinstance(url, str):
+            return self._parse_cached(url)
+        return self._parse_url(url)
+    
+    def _parse_url(self, url: Any) -> Optional[_CleanedURL]:
+        """
+        Clean a URL and keep the components needed by the extract helpers.
+        
+        Args:
+            url (Any): URL to be cleaned.
             
+        Returns:
+            Optional[_CleanedURL]: Cleaned URL, or None if input is invalid.
+        """
         # Convert to string and strip whitespace
-        try:
-            url_str = str(url).strip()
-        except Exception as e:
-            self.logger.error(f"Error converting to string: {e}")
-            return None
+        url_str = url.strip() if isinstance(url, str) else str(url).strip()
         
         # Basic format validation
-        if not self.url_pattern.match(url_str):
-            self.logger.warning(f"Invalid URL format: {url_str}")
+        if not _is_valid_url(url_str):
+            self.logger.warning("Invalid URL format: %s", url_str)
             return None
         
         # Add scheme if not present
@@ -74,18 +150,17 @@ class URLCleaner(DataCleaner):
             url_str = f"http://{url_str}"
         
         # Parse URL components
-        parsed = urlparse(url_str)
+        parsed = urlsplit(url_str)
         
         # Validate scheme
         if parsed.scheme not in self.allowed_schemes:
-            self.logger.warning(f"Scheme not allowed: {parsed.scheme}")
+            self.logger.warning("Scheme not allowed: %s", parsed.scheme)
             return None
         
         # Remove www prefix if configured
-        if self.remove_www:
-            netloc = self.www_pattern.sub("", parsed.netloc)
-        else:
-            netloc = parsed.netloc
+        netloc = parsed.netloc
+        if self.remove_www and netloc.startswith("www."):
+            netloc = netloc[4:]
         
         # Validate domain if valid_domains is configured
         if self.valid_domains:
@@ -94,7 +169,7 @@ class URLCleaner(DataCleaner):
             if len(domain_parts) >= 2:
                 domain = ".".join(domain_parts[-2:])
                 if domain not in self.valid_domains:
-                    self.logger.warning(f"Domain not allowed: {domain}")
+                    self.logger.warning("Domain not allowed: %s", domain)
                     return None
         
         # Remove query params if configured
@@ -104,16 +179,15 @@ class URLCleaner(DataCleaner):
         fragment = "" if self.remove_fragments else parsed.fragment
         
         # Reconstruct URL
-        cleaned_url = urlunparse((
+        cleaned_url = urlunsplit((
             parsed.scheme,
             netloc,
             parsed.path,
-            parsed.params,
             query,
             fragment
         ))
         
-        return cleaned_url
+        return _CleanedURL(cleaned_url, netloc, parsed.path)
     
     def extract_domain(self, url: Any) -> Optional[str]:
         """
@@ -125,11 +199,8 @@ class URLCleaner(DataCleaner):
         Returns:
             Optional[str]: Extracted domain, or None if URL is invalid.
         """
-        cleaned_url = self.clean(url)
-        if cleaned_url:
-            parsed = urlparse(cleaned_url)
-            return parsed.netloc
-        return None
+        parsed = self._parse(url)
+        return parsed.netloc if parsed else None
     
     def extract_path(self, url: Any) -> Optional[str]:
         """
@@ -141,8 +212,5 @@ class URLCleaner(DataCleaner):
         Returns:
             Optional[str]: Extracted path, or None if URL is invalid.
         """
-        cleaned_url = self.clean(url)
-        if cleaned_url:
-            parsed = urlparse(cleaned_url)
-            return parsed.path
-        return None
+        parsed = self._parse(url)
+        return parsed.path if parsed else None
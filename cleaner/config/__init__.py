@@ -3,10 +3,11 @@
 Configuration management for the data_cleaner package.
 """
 
-from .config import Config, load_config, save_config, DEFAULT_CONFIG
+from .config import Config, get_default_config, load_config, save_config, DEFAULT_CONFIG
 
 __all__ = [
     "Config",
+    "get_default_config",
     "load_config",
     "save_config",
     "DEFAULT_CONFIG"
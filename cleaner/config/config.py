@@ -3,9 +3,12 @@
 Configuration class and utilities for the data_cleaner package.
 """
 
+import copy
+import functools
 import json
 import os
-from typing import Any, Dict, List, Optional, Union
+from collections import namedtuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 def load_json_file(file_path: str) -> Dict[str, Any]:
     """
@@ -36,7 +39,10 @@ DEFAULT_CONFIG = {
     "general": {
         "encoding": "utf-8",
         "logging_level": "INFO",
-        "log_file": "data_cleaner.log"
+        "log_file": "data_cleaner.log",
+        "n_jobs": 1,  # number of worker processes for batch cleaning, -1 = all CPUs
+        "parallel_threshold": 10000,  # minimum batch size to clean in parallel
+        "cache_size": 8192  # number of cleaned values cached per cleaner, 0 = no caching
     },
     "cleaners": {
         "text": {
@@ -111,6 +117,38 @@ DEFAULT_CONFIG = {
     }
 }
 
+# Marker for keys not found
+_MISSING = object()
+
+@functools.lru_cache(maxsize=512)
+def _split_key(key: str) -> tuple:
+    """
+    Split a dotted configuration key into its parts.
+    
+    Args:
+        key (str): Configuration key (supports dot notation).
+        
+    Returns:
+        tuple: Key parts.
+    """
+    return tuple(key.split("."))
+
+@functools.lru_cache(maxsize=64)
+def _section_type(fields: Tuple[str, ...]) -> type:
+    """
+    Get the namedtuple type for configuration sections with the given keys.
+    
+    Args:
+        fields (Tuple[str, ...]): Section keys.
+        
+    Returns:
+        type: Namedtuple type.
+    """
+    return namedtuple("Section", fields, rename=True)
+
+# Serialized default configuration, loaded to get a fresh deep copy
+_DEFAULT_CONFIG_JSON = json.dumps(DEFAULT_CONFIG)
+
 class Config:
     """
     Configuration class for managing data_cleaner settings.
@@ -123,7 +161,7 @@ class Config:
         Args:
             config (Dict[str, Any], optional): Initial configuration.
         """
-        self._config = DEFAULT_CONFIG.copy()
+        self._config = json.loads(_DEFAULT_CONFIG_JSON)
         
         # Merge with provided config if any
         if config:
@@ -164,11 +202,7 @@ class Config:
         Returns:
             bool: True if key exists, False otherwise.
         """
-        try:
-            self.get(key)
-            return True
-        except KeyError:
-            return False
+        return self.get(key, _MISSING) is not _MISSING
     
     def get(self, key: str, default: Any = None) -> Any:
         """
@@ -181,17 +215,34 @@ class Config:
         Returns:
             Any: Configuration value or default.
         """
-        keys = key.split(".")
         value = self._config
-        
         try:
-            for k in keys:
+            for k in _split_key(key):
                 value = value[k]
-            return value
         except (KeyError, TypeError):
             if default is KeyError:
                 raise KeyError(f"Configuration key not found: {key}")
             return default
+        return value
+    
+    def section(self, prefix: str) -> Tuple[Any, ...]:
+        """
+        Get all values under a configuration key as a read-only record, resolving the key once.
+        
+        The record is an immutable namedtuple built from the current values;
+        record types are cached by their field names. Keys that are not valid
+        field names are renamed to positional names (_0, _1, ...).
+        
+        Args:
+            prefix (str): Configuration key of the section (supports dot notation).
+            
+        Returns:
+            Tuple[Any, ...]: Namedtuple of section values, empty if the key is not found or not a section.
+        """
+        values = self.get(prefix)
+        if not isinstance(values, dict):
+            values = {}
+        return _section_type(tuple(values))(*values.values())
     
     def set(self, key: str, value: Any) -> None:
         """
@@ -201,7 +252,7 @@ class Config:
             key (str): Configuration key (supports dot notation).
             value (Any): Configuration value.
         """
-        keys = key.split(".")
+        keys = _split_key(key)
         config = self._config
         
         # Navigate to the parent of the final key
@@ -229,19 +280,23 @@ class Config:
     
     def _merge_dicts(self, base: Dict[str, Any], other: Dict[str, Any]) -> None:
         """
-        Recursively merge two dictionaries.
+        Merge two nested dictionaries, without recursion.
         
         Args:
             base (Dict[str, Any]): Base dictionary to merge into.
             other (Dict[str, Any]): Dictionary to merge from.
         """
-        for key, value in other.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                # Recursively merge dictionaries
-                self._merge_dicts(base[key], value)
-            else:
-                # Override or add new key
-                base[key] = value
+        stack = [(base, other)]
+        
+        while stack:
+            base, other = stack.pop()
+            for key, value in other.items():
+                if isinstance(value, dict) and isinstance(base.get(key), dict):
+                    # Merge nested dictionaries on a later pass
+                    stack.append((base[key], value))
+                else:
+                    # Override or add new key
+                    base[key] = value
     
     def update(self, **kwargs) -> None:
         """
@@ -260,13 +315,14 @@ class Config:
         Args:
             key (str, optional): Specific key to reset. If None, reset entire configuration.
         """
+        
         if key is None:
             # Reset entire configuration
-            self._config = DEFAULT_CONFIG.copy()
+            self._config = json.loads(_DEFAULT_CONFIG_JSON)
         else:
             # Reset specific key
-            keys = key.split(".")
-            default_config = DEFAULT_CONFIG
+            keys = _split_key(key)
+            default_config = json.loads(_DEFAULT_CONFIG_JSON)
             config = self._config
             
             # Navigate to the parent of the final key
@@ -288,9 +344,9 @@ class Config:
         Convert configuration to a dictionary.
         
         Returns:
-            Dict[str, Any]: Configuration as a dictionary.
+            Dict[str, Any]: Deep copy of the configuration.
         """
-        return self._config.copy()
+        return copy.deepcopy(self._config)
     
     def __str__(self) -> str:
         """
@@ -310,6 +366,15 @@ class Config:
         """
         return f"Config({json.dumps(self._config)})"
 
+def get_default_config() -> Config:
+    """
+    Get a configuration with the default values.
+    
+    Returns:
+        Config: New Config instance with the default configuration.
+    """
+    return Config()
+
 def load_config(file_path: str) -> Config:
     """
     Load configuration from a file.
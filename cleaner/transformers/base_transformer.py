@@ -4,11 +4,14 @@ Base class for all data transformers.
 """
 
 import logging
+import math
+import os
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
 
 from ..config import Config
-from ..utils.logging_config import setup_logging
+from ..utils.logging_config import get_logger
 
 class DataTransformer(ABC):
     """
@@ -18,6 +21,8 @@ class DataTransformer(ABC):
         config (Config): Configuration object.
         logger (logging.Logger): Logger instance.
         transform_stats (Dict): Statistics about transformation operations.
+        n_jobs (int): Number of worker processes for batch transformation (-1 for all CPUs).
+        parallel_threshold (int): Minimum batch size to transform in parallel.
     """
     
     def __init__(self, config: Optional[Config] = None):
@@ -29,7 +34,9 @@ class DataTransformer(ABC):
         """
         from ..config import get_default_config
         self.config = config or get_default_config()
-        self.logger = setup_logging(self.__class__.__name__)
+        self.logger = get_logger(self.__class__.__name__)
+        self.n_jobs = self.config.get("general.n_jobs", 1)
+        self.parallel_threshold = self.config.get("general.parallel_threshold", 10000)
         self.transform_stats = {
             "total_records": 0,
             "transformed_records": 0,
@@ -53,13 +60,35 @@ class DataTransformer(ABC):
         """
         Transform a batch of data.
         
+        When ``n_jobs`` is not 1 and the batch is larger than
+        ``parallel_threshold``, the batch is split into chunks that are
+        transformed in separate processes.
+        
         Args:
             data_list (List[Any]): List of data to be transformed.
             
         Returns:
             List[Any]: List of transformed data.
         """
-        self.transform_stats["total_records"] = len(data_list)
+        if self.n_jobs != 1 and len(data_list) > self.parallel_threshold:
+            transformed_list = self._transform_batch_parallel(data_list)
+        else:
+            transformed_list = self._transform_records(data_list)
+        
+        self.logger.info("Batch transformation completed. Stats: %s", self.transform_stats)
+        return transformed_list
+    
+    def _transform_records(self, data_list: List[Any]) -> List[Any]:
+        """
+        Transform records and update the transformation statistics.
+        
+        Args:
+            data_list (List[Any]): List of data to be transformed.
+            
+        Returns:
+            List[Any]: List of transformed data, with None for records that failed.
+        """
+        self.transform_stats["total_records"] += len(data_list)
         transformed_list = []
         
         for data in data_list:
@@ -68,13 +97,54 @@ class DataTransformer(ABC):
                 transformed_list.append(transformed_data)
                 self.transform_stats["transformed_records"] += 1
             except Exception as e:
-                self.logger.error(f"Error transforming data: {e}")
+                self.logger.error("Error transforming data: %s", e)
                 transformed_list.append(None)
                 self.transform_stats["errors"] += 1
         
-        self.logger.info(f"Batch transformation completed. Stats: {self.transform_stats}")
         return transformed_list
     
+    def _transform_batch_parallel(self, data_list: List[Any]) -> List[Any]:
+        """
+        Transform a batch of data in chunks across worker processes.
+        
+        Args:
+            data_list (List[Any]): List of data to be transformed.
+            
+        Returns:
+            List[Any]: List of transformed data, in input order.
+        """
+        max_workers = self.n_jobs if self.n_jobs > 0 else (os.cpu_count() or 1)
+        chunk_size = math.ceil(len(data_list) / max_workers)
+        chunks = [data_list[i:i + chunk_size] for i in range(0, len(data_list), chunk_size)]
+        
+        transformed_list = []
+        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for chunk_transformed, chunk_stats in executor.map(self._transform_chunk, chunks, chunksize=1):
+                transformed_list.extend(chunk_transformed)
+                self.transform_stats["total_records"] += chunk_stats["total_records"]
+                self.transform_stats["transformed_records"] += chunk_stats["transformed_records"]
+                self.transform_stats["errors"] += chunk_stats["errors"]
+        
+        return transformed_list
+    
+    def _transform_chunk(self, chunk: List[Any]) -> Tuple[List[Any], Dict]:
+        """
+        Transform one chunk of a parallel batch in a worker process.
+        
+        Runs on the worker's copy of the transformer, so the returned
+        statistics only cover this chunk.
+        
+        Args:
+            chunk (List[Any]): Chunk of data to be transformed.
+            
+        Returns:
+            Tuple[List[Any], Dict]: Transformed data and transformation statistics for the chunk.
+        """
+        self.reset_stats()
+        transformed_list = self._transform_records(chunk)
+        return transformed_list, self.transform_stats
+    
     def get_stats(self) -> Dict:
         """
         Get transformation statistics.
@@ -86,13 +156,10 @@ class DataTransformer(ABC):
     
     def reset_stats(self) -> None:
         """
-        Reset transformation statistics.
+        Reset transformation statistics, zeroing the counters in place.
         """
-        self.transform_stats = {
-            "total_records": 0,
-            "transformed_records": 0,
-            "errors": 0
-        }
+        for key in self.transform_stats:
+            self.transform_stats[key] = 0
     
     def fit(self, data_list: List[Any]) -> "DataTransformer":
         """
@@ -6,6 +6,9 @@ Categorical data transformation utilities.
 from typing import Any, Dict, List, Optional, Union
 from collections import Counter
 
+import numpy as np
+import pandas as pd
+
 from .base_transformer import DataTransformer
 from ..config import Config
 
@@ -40,6 +43,8 @@ class CategoricalTransformer(DataTransformer):
         # Initialize category mapping
         self.category_map = {}
         self.most_common = []
+        self._categories_set = frozenset(self.categories) if self.categories is not None else None
+        self._one_hot_template = None
     
     def fit(self, data_list: List[Any]) -> "CategoricalTransformer":
         """
@@ -55,8 +60,18 @@ class CategoricalTransformer(DataTransformer):
         str_data = [str(data) for data in data_list if data is not None]
         
         # Count category frequencies
-        category_counts = Counter(str_data)
+        return self._fit_counts(Counter(str_data))
+    
+    def _fit_counts(self, category_counts: Counter) -> "CategoricalTransformer":
+        """
+        Fit the transformer to category frequencies.
         
+        Args:
+            category_counts (Counter): Category frequencies, in order of first occurrence.
+            
+        Returns:
+            CategoricalTransformer: Self for method chaining.
+        """
         # Determine categories to use
         if self.categories is None:
             if self.max_categories:
@@ -64,11 +79,13 @@ class CategoricalTransformer(DataTransformer):
                 self.most_common = [cat for cat, count in category_counts.most_common(self.max_categories)]
                 self.categories = self.most_common
                 if len(category_counts) > self.max_categories:
-                    self.logger.info(f"Keeping only top {self.max_categories} categories out of {len(category_counts)}")
+                    self.logger.info("Keeping only top %s categories out of %s", self.max_categories, len(category_counts))
             else:
                 # Use all categories
                 self.categories = list(category_counts.keys())
         
+        self._categories_set = frozenset(self.categories)
+        
         # Create encoding mapping based on encoding type
         if self.encoding_type == "label":
             # Label encoding: map each category to an integer
@@ -88,9 +105,8 @@ class CategoricalTransformer(DataTransformer):
                 self.category_map[self.unknown_category] = 0.0
                 
         elif self.encoding_type == "one-hot":
-            # One-hot encoding: map each category to a binary vector
-            # This will be handled during transformation, not during fitting
-            pass
+            # One-hot encoding: build an all-zero vector that transform copies
+            self._build_one_hot_template()
         
         return self
     
@@ -109,29 +125,30 @@ class CategoricalTransformer(DataTransformer):
             return None
             
         # Convert to string
-        try:
-            category = str(data)
-        except Exception as e:
-            self.logger.error(f"Error converting to string: {e}")
-            return None
+        if isinstance(data, str):
+            category = data
+        else:
+            try:
+                category = str(data)
+            except Exception as e:
+                self.logger.error("Error converting to string: %s", e)
+                return None
         
         # Handle unknown categories
-        if category not in self.categories:
+        if category not in self._categories_set:
             if self.unknown_category:
                 category = self.unknown_category
             else:
-                self.logger.warning(f"Unknown category: {category}")
+                self.logger.warning("Unknown category: %s", category)
                 return None
         
         # Apply encoding
         if self.encoding_type == "one-hot":
             # One-hot encoding
-            one_hot = {}
-            for cat in self.categories:
-                one_hot[cat] = 1 if cat == category else 0
-            # Add unknown category indicator if applicable
-            if self.unknown_category:
-                one_hot[self.unknown_category] = 1 if category == self.unknown_category else 0
+            if self._one_hot_template is None:
+                self._build_one_hot_template()
+            one_hot = self._one_hot_template.copy()
+            one_hot[category] = 1
             return one_hot
             
         elif category in self.category_map:
@@ -140,6 +157,147 @@ class CategoricalTransformer(DataTransformer):
         
         return None
     
+    def fit_transform_array(self, arr: Union[np.ndarray, pd.Series, List[Any]]) -> np.ndarray:
+        """
+        Fit the transformer to an array of categorical data and transform it in a vectorized pass.
+        
+        Each distinct value is converted and encoded once, and the encoding is
+        broadcast back to the rows with NumPy indexing. Missing values (None
+        or NaN) are skipped when fitting.
+        
+        Args:
+            arr (Union[np.ndarray, pd.Series, List[Any]]): Categorical data to fit to and transform.
+            
+        Returns:
+            np.ndarray: Encoded data. Label encoding gives int64 labels and
+            frequency encoding gives float64 frequencies, with -1 and NaN
+            respectively for missing and unknown values. One-hot encoding gives
+            a uint8 matrix whose columns follow the one-hot vector keys, with
+            all-zero rows for missing and unknown values.
+        """
+        series = arr if isinstance(arr, pd.Series) else pd.Series(list(arr), dtype=object)
+        codes, uniques = pd.factorize(series.astype(str).where(series.notna()))
+        uniques = list(uniques)
+        
+        # Fit to the category frequencies, in order of first occurrence
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        self._fit_counts(Counter(dict(zip(uniques, counts.tolist()))))
+        
+        # Resolve each distinct value to its category, as transform does
+        resolved = [
+            value if value in self._categories_set else (self.unknown_category or None)
+            for value in uniques
+        ]
+        
+        if self.encoding_type == "one-hot":
+            if self._one_hot_template is None:
+                self._build_one_hot_template()
+            columns = {cat: i for i, cat in enumerate(self._one_hot_template)}
+            column_index = np.array([columns.get(cat, -1) for cat in resolved] + [-1], dtype=np.int64)
+            row_columns = column_index[codes]
+            rows = np.flatnonzero(row_columns >= 0)
+            encoded = np.zeros((len(series), len(columns)), dtype=np.uint8)
+            encoded[rows, row_columns[rows]] = 1
+        elif self.encoding_type == "label":
+            lookup = [self.category_map.get(cat) for cat in resolved]
+            lookup = np.array([-1 if value is None else value for value in lookup] + [-1], dtype=np.int64)
+            encoded = lookup[codes]
+        else:
+            lookup = [self.category_map.get(cat) for cat in resolved]
+            lookup = np.array([np.nan if value is None else value for value in lookup] + [np.nan], dtype=np.float64)
+            encoded = lookup[codes]
+        
+        self.transform_stats["total_records"] += len(series)
+        self.transform_stats["transformed_records"] += len(series)
+        
+        return encoded
+    
+    def _build_one_hot_template(self) -> None:
+        """
+        Build the all-zero one-hot vector, with the unknown category indicator if applicable.
+        """
+        template = {cat: 0 for cat in self.categories}
+        if self.unknown_category:
+            template[self.unknown_category] = 0
+        self._one_hot_template = template
+    
+    def transform_batch(self, data_list: List[Any]) -> List[Any]:
+        """
+        Transform a batch of categorical data.
+        
+        Label and frequency encodings are looked up directly in the category
+        map once the transformer is fitted; other cases go through transform.
+        
+        Args:
+            data_list (List[Any]): List of data to be transformed.
+            
+        Returns:
+            List[Any]: List of transformed data.
+        """
+        if self.encoding_type not in ("label", "frequency") or self._categories_set is None:
+            return super().transform_batch(data_list)
+        
+        try:
+            str_list = [None if data is None else str(data) for data in data_list]
+        except Exception:
+            # Fall back to per-record transformation to find and count the bad records
+            return super().transform_batch(data_list)
+        
+        return self._lookup_batch(str_list)
+    
+    def fit_transform(self, data_list: List[Any]) -> List[Any]:
+        """
+        Fit the transformer to the data and then transform it.
+        
+        For label and frequency encodings each value is converted to a string
+        once, and the strings are reused for both fitting and encoding.
+        
+        Args:
+            data_list (List[Any]): List of data to fit to and transform.
+            
+        Returns:
+            List[Any]: List of transformed data.
+        """
+        if self.encoding_type not in ("label", "frequency"):
+            return super().fit_transform(data_list)
+        
+        try:
+            str_list = [None if data is None else str(data) for data in data_list]
+        except Exception:
+            return super().fit_transform(data_list)
+        
+        self._fit_counts(Counter(category for category in str_list if category is not None))
+        return self._lookup_batch(str_list)
+    
+    def _lookup_batch(self, str_list: List[Optional[str]]) -> List[Any]:
+        """
+        Look up label or frequency encodings of categories in the category map.
+        
+        Args:
+            str_list (List[Optional[str]]): Categories as strings, or None for missing values.
+            
+        Returns:
+            List[Any]: List of transformed data.
+        """
+        category_map = self.category_map
+        unknown_value = category_map.get(self.unknown_category) if self.unknown_category else None
+        
+        transformed_list = [
+            None if category is None else category_map.get(category, unknown_value)
+            for category in str_list
+        ]
+        
+        if not self.unknown_category:
+            unknown_count = sum(1 for category, value in zip(str_list, transformed_list) if category is not None and value is None)
+            if unknown_count:
+                self.logger.warning("%s of %s values were unknown categories", unknown_count, len(transformed_list))
+        
+        self.transform_stats["total_records"] += len(transformed_list)
+        self.transform_stats["transformed_records"] += len(transformed_list)
+        
+        self.logger.info("Batch transformation completed. Stats: %s", self.transform_stats)
+        return transformed_list
+    
     def get_category_counts(self) -> Dict[str, int]:
         """
         Get category counts from the fitted data.
@@ -3,14 +3,102 @@
 Date and time transformation utilities.
 """
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+import functools
+import operator
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
 import dateutil.parser as parser
 
 from .base_transformer import DataTransformer
 from ..config import Config
 from ..cleaners.datetime_cleaner import DateTimeCleaner
 
+# Common formats tried before the dateutil parser, read month first like dateutil
+_FAST_FORMATS = ("%Y/%m/%d", "%m/%d/%Y", "%Y/%m/%d %H:%M:%S", "%m/%d/%Y %H:%M:%S")
+
+# Cleaner output format that keeps every field of a naive datetime down to the second
+_SECONDS_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+def _is_weekend(dt: datetime) -> bool:
+    """Check if a datetime falls on a Saturday or Sunday."""
+    return dt.weekday() >= 5
+
+def _quarter(dt: datetime) -> int:
+    """Get the quarter of the year (1-4) of a datetime."""
+    return (dt.month - 1) // 3 + 1
+
+# Component extractors in output order
+_COMPONENT_EXTRACTORS = (
+    ("year", operator.attrgetter("year")),
+    ("month", operator.attrgetter("month")),
+    ("day", operator.attrgetter("day")),
+    ("hour", operator.attrgetter("hour")),
+    ("minute", operator.attrgetter("minute")),
+    ("second", operator.attrgetter("second")),
+    ("weekday", operator.methodcaller("weekday")),  # Monday=0, Sunday=6
+    ("is_weekend", _is_weekend),
+    ("quarter", _quarter),
+)
+
+@functools.lru_cache(maxsize=4096)
+def _parse_cached(dt_str: str) -> datetime:
+    """
+    Parse a date/time string, caching the results for repeated strings.
+    
+    ISO 8601 strings, such as the output of DateTimeCleaner, and a few
+    common formats are parsed directly; anything else goes through the
+    dateutil parser.
+    
+    Args:
+        dt_str (str): Date/time string to parse.
+        
+    Returns:
+        datetime: Parsed datetime.
+    """
+    try:
+        return datetime.fromisoformat(dt_str)
+    except (TypeError, ValueError):
+        pass
+    
+    for fmt in _FAST_FORMATS:
+        try:
+            return datetime.strptime(dt_str, fmt)
+        except (TypeError, ValueError):
+            continue
+    
+    return parser.parse(dt_str)
+
+@functools.lru_cache(maxsize=2048)
+def _format_cached(dt_str: str, fmt: str) -> str:
+    """
+    Parse and reformat a date/time string, caching the results for repeated strings.
+    
+    Keyed on the string rather than the datetime, since aware datetimes in
+    different timezones compare equal but format differently.
+    
+    Args:
+        dt_str (str): Date/time string to format.
+        fmt (str): strftime format.
+        
+    Returns:
+        str: Formatted date/time.
+    """
+    return _parse_cached(dt_str).strftime(fmt)
+
+@functools.lru_cache(maxsize=2048)
+def _strftime_cached(dt: datetime, fmt: str) -> str:
+    """
+    Format a naive datetime, caching the results for repeated datetimes.
+    
+    Args:
+        dt (datetime): Naive datetime to format.
+        fmt (str): strftime format.
+        
+    Returns:
+        str: Formatted date/time.
+    """
+    return dt.strftime(fmt)
+
 class DateTimeTransformer(DataTransformer):
     """
     Date and time transformation utility class.
@@ -41,16 +129,27 @@ class DateTimeTransformer(DataTransformer):
         ])
         self.calculate_durations = self.config.get("datetime_transformer.calculate_durations", False)
         
+        # Extractors for the configured components, so transform does not check each one per record
+        components = set(self.components_to_extract)
+        self._extractors = [(name, extract) for name, extract in _COMPONENT_EXTRACTORS if name in components]
+        
         # Parse reference date if provided
         self.reference_date = None
         if self.config.get("datetime_transformer.reference_date"):
             try:
-                self.reference_date = parser.parse(self.config["datetime_transformer.reference_date"])
+                self.reference_date = _parse_cached(self.config["datetime_transformer.reference_date"])
             except Exception as e:
-                self.logger.warning(f"Invalid reference_date format: {e}")
+                self.logger.warning("Invalid reference_date format: %s", e)
+    
+    @functools.cached_property
+    def datetime_cleaner(self) -> DateTimeCleaner:
+        """
+        DateTimeCleaner instance for preprocessing, created on first use.
         
-        # Create a DateTimeCleaner instance for preprocessing
-        self.datetime_cleaner = DateTimeCleaner(config)
+        Returns:
+            DateTimeCleaner: Cleaner built from this transformer's configuration.
+        """
+        return DateTimeCleaner(self.config)
     
     def transform(self, data: Any) -> Optional[Union[str, Dict[str, Any]]]:
         """
@@ -63,48 +162,29 @@ class DateTimeTransformer(DataTransformer):
             Optional[Union[str, Dict[str, Any]]]: Transformed date/time, which could be a formatted string
             or a dictionary of extracted components, or None if input is invalid.
         """
-        # Clean the date/time first
-        cleaned_datetime_str = self.datetime_cleaner.clean(data)
-        if cleaned_datetime_str is None:
-            return None
-        
-        # Parse to datetime object for further processing
-        try:
-            dt_obj = parser.parse(cleaned_datetime_str)
-        except Exception as e:
-            self.logger.error(f"Error parsing datetime: {e}")
-            return None
+        # Clean straight to a datetime when the cleaned string would keep all of it
+        if self.datetime_cleaner.output_format == _SECONDS_FORMAT:
+            dt_obj = self.datetime_cleaner.clean_to_datetime(data)
+            if dt_obj is None:
+                return None
+            dt_obj = dt_obj.replace(microsecond=0, tzinfo=None)
+            cleaned_datetime_str = None
+        else:
+            # Clean the date/time first
+            cleaned_datetime_str = self.datetime_cleaner.clean(data)
+            if cleaned_datetime_str is None:
+                return None
+            
+            # Parse to datetime object for further processing
+            try:
+                dt_obj = _parse_cached(cleaned_datetime_str)
+            except Exception as e:
+                self.logger.error("Error parsing datetime: %s", e)
+                return None
         
         # Extract components if configured
         if self.extract_components:
-            components = {}
-            
-            if "year" in self.components_to_extract:
-                components["year"] = dt_obj.year
-                
-            if "month" in self.components_to_extract:
-                components["month"] = dt_obj.month
-                
-            if "day" in self.components_to_extract:
-                components["day"] = dt_obj.day
-                
-            if "hour" in self.components_to_extract:
-                components["hour"] = dt_obj.hour
-                
-            if "minute" in self.components_to_extract:
-                components["minute"] = dt_obj.minute
-                
-            if "second" in self.components_to_extract:
-                components["second"] = dt_obj.second
-                
-            if "weekday" in self.components_to_extract:
-                components["weekday"] = dt_obj.weekday()  # Monday=0, Sunday=6
-                
-            if "is_weekend" in self.components_to_extract:
-                components["is_weekend"] = dt_obj.weekday() >= 5  # Saturday=5, Sunday=6
-                
-            if "quarter" in self.components_to_extract:
-                components["quarter"] = (dt_obj.month - 1) // 3 + 1
+            components = {name: extract(dt_obj) for name, extract in self._extractors}
                 
             # Calculate durations if configured
             if self.calculate_durations and self.reference_date:
@@ -115,7 +195,9 @@ class DateTimeTransformer(DataTransformer):
             return components
         
         # Otherwise, return formatted string
-        return dt_obj.strftime(self.output_format)
+        if cleaned_datetime_str is None:
+            return _strftime_cached(dt_obj, self.output_format)
+        return _format_cached(cleaned_datetime_str, self.output_format)
     
     def get_age(self, birth_date: Any, reference_date: Any = None) -> Optional[int]:
         """
@@ -128,35 +210,37 @@ class DateTimeTransformer(DataTransformer):
         Returns:
             Optional[int]: Calculated age, or None if input is invalid.
         """
-        # Clean birth date
-        birth_date_str = self.datetime_cleaner.clean(birth_date)
-        if birth_date_str is None:
-            return None
-        
-        try:
-            birth_dt = parser.parse(birth_date_str)
-        except Exception as e:
-            self.logger.error(f"Error parsing birth date: {e}")
+        birth_parts = self._date_parts(birth_date)
+        if birth_parts is None:
             return None
         
         # Get reference date
         if reference_date:
-            ref_date_str = self.datetime_cleaner.clean(reference_date)
-            if ref_date_str is None:
-                return None
-            try:
-                ref_dt = parser.parse(ref_date_str)
-            except Exception as e:
-                self.logger.error(f"Error parsing reference date: {e}")
+            ref_parts = self._date_parts(reference_date)
+            if ref_parts is None:
                 return None
         else:
-            ref_dt = datetime.now()
-        
-        # Calculate age
-        age = ref_dt.year - birth_dt.year
+            today = date.today()
+            ref_parts = (today.year, today.month, today.day)
         
-        # Adjust if birthday hasn't occurred yet this year
-        if (ref_dt.month, ref_dt.day) < (birth_dt.month, birth_dt.day):
+        # Calculate age, one less if the birthday hasn't occurred yet this year
+        age = ref_parts[0] - birth_parts[0]
+        if ref_parts[1:] < birth_parts[1:]:
             age -= 1
             
         return age
+    
+    def _date_parts(self, value: Any) -> Optional[Tuple[int, int, int]]:
+        """
+        Clean a date and get its year, month and day without formatting it to a string.
+        
+        Args:
+            value (Any): Date to clean.
+            
+        Returns:
+            Optional[Tuple[int, int, int]]: Year, month and day, or None if input is invalid.
+        """
+        dt = self.datetime_cleaner.clean_to_datetime(value)
+        if dt is None:
+            return None
+        return dt.year, dt.month, dt.day
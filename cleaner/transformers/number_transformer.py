@@ -3,9 +3,14 @@
 Number transformation utilities.
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
+import bisect
+import functools
 import math
 
+import numpy as np
+import pandas as pd
+
 from .base_transformer import DataTransformer
 from ..config import Config
 from ..cleaners.number_cleaner import NumberCleaner
@@ -25,6 +30,7 @@ class NumberTransformer(DataTransformer):
         mean (Optional[float]): Mean value for standardization.
         std (Optional[float]): Standard deviation for standardization.
         bins (Optional[List[float]]): Bin boundaries for discretization.
+        data (np.ndarray): Cleaned values the transformer was fitted to.
         number_cleaner (NumberCleaner): Instance of NumberCleaner for preprocessing.
     """
     
@@ -51,11 +57,19 @@ class NumberTransformer(DataTransformer):
         self.std = self.config.get("number_transformer.std", None)
         self.bins = self.config.get("number_transformer.bins", None)
         
-        # Create a NumberCleaner instance for preprocessing
-        self.number_cleaner = NumberCleaner(config)
+        # Fitted data as a contiguous float array
+        self.data = np.empty(0, dtype=np.float64)
+        self._quantiles: Optional[Dict[str, float]] = None
+    
+    @functools.cached_property
+    def number_cleaner(self) -> NumberCleaner:
+        """
+        NumberCleaner instance for preprocessing, created on first use.
         
-        # Data storage for fit method
-        self.data = []
+        Returns:
+            NumberCleaner: Cleaner built from this transformer's configuration.
+        """
+        return NumberCleaner(self.config)
     
     def fit(self, data_list: List[Any]) -> "NumberTransformer":
         """
@@ -67,35 +81,33 @@ class NumberTransformer(DataTransformer):
         Returns:
             NumberTransformer: Self for method chaining.
         """
-        # Clean and filter the data
-        cleaned_data = []
-        for data in data_list:
-            cleaned = self.number_cleaner.clean(data)
-            if cleaned is not None:
-                cleaned_data.append(cleaned)
+        # Clean and filter the data in a vectorized pass
+        cleaned = self.number_cleaner.clean_series(pd.Series(list(data_list), dtype=object)).dropna()
+        arr = cleaned.to_numpy(dtype=np.float64)
         
-        self.data = cleaned_data
+        self.data = arr
+        self._quantiles = None
         
         # Calculate min and max for normalization
         if self.normalize and self.min_value is None and self.max_value is None:
-            if cleaned_data:
-                self.min_value = min(cleaned_data)
-                self.max_value = max(cleaned_data)
+            if arr.size:
+                self.min_value = float(arr.min())
+                self.max_value = float(arr.max())
         
         # Calculate mean and std for standardization
         if self.standardize and self.mean is None and self.std is None:
-            if cleaned_data:
-                self.mean = sum(cleaned_data) / len(cleaned_data)
-                variance = sum((x - self.mean) ** 2 for x in cleaned_data) / len(cleaned_data)
-                self.std = math.sqrt(variance)
+            if arr.size:
+                # Reuse the mean for the population std, summing squared deviations with one dot product
+                self.mean = float(arr.mean())
+                deviations = arr - self.mean
+                self.std = math.sqrt(float(np.dot(deviations, deviations)) / arr.size)
         
         # Create bins for discretization
         if self.discretize and self.bins is None:
-            if cleaned_data:
-                self.min_value = min(cleaned_data) if self.min_value is None else self.min_value
-                self.max_value = max(cleaned_data) if self.max_value is None else self.max_value
-                bin_width = (self.max_value - self.min_value) / self.bin_count
-                self.bins = [self.min_value + i * bin_width for i in range(self.bin_count + 1)]
+            if arr.size:
+                self.min_value = float(arr.min()) if self.min_value is None else self.min_value
+                self.max_value = float(arr.max()) if self.max_value is None else self.max_value
+                self.bins = np.linspace(self.min_value, self.max_value, self.bin_count + 1).tolist()
         
         return self
     
@@ -119,7 +131,7 @@ class NumberTransformer(DataTransformer):
         # Apply log transformation
         if self.log_transform:
             if transformed_num <= 0:
-                self.logger.warning(f"Log transformation requires positive numbers, got {transformed_num}")
+                self.logger.warning("Log transformation requires positive numbers, got %s", transformed_num)
             else:
                 transformed_num = math.log(transformed_num)
         
@@ -146,19 +158,125 @@ class NumberTransformer(DataTransformer):
             if self.bins is None:
                 self.logger.warning("Discretization requires bins. Call fit() first.")
             else:
-                for i in range(len(self.bins) - 1):
-                    if self.bins[i] <= transformed_num <= self.bins[i+1]:
-                        transformed_num = f"Bin {i+1}"
-                        break
-                # Handle values outside bins
-                if isinstance(transformed_num, (int, float)):
-                    if transformed_num < self.bins[0]:
-                        transformed_num = f"Bin 0"
-                    else:
-                        transformed_num = f"Bin {len(self.bins)}"
+                if self.bins[0] <= transformed_num <= self.bins[-1]:
+                    # Bin i covers bins[i-1] to bins[i], and a value on an edge goes to the lower bin
+                    transformed_num = f"Bin {max(bisect.bisect_left(self.bins, transformed_num), 1)}"
+                elif transformed_num < self.bins[0]:
+                    # Handle values outside bins
+                    transformed_num = "Bin 0"
+                else:
+                    transformed_num = f"Bin {len(self.bins)}"
         
         return transformed_num
     
+    def transform_batch(self, data_list: List[Any]) -> List[Any]:
+        """
+        Transform a batch of numbers in a vectorized pass.
+        
+        Args:
+            data_list (List[Any]): List of numbers to be transformed.
+            
+        Returns:
+            List[Any]: List of transformed numbers or bin labels, with None for invalid input.
+        """
+        if not (self.log_transform or self.normalize or self.standardize or self.discretize):
+            return super().transform_batch(data_list)
+        
+        series = data_list if isinstance(data_list, pd.Series) else pd.Series(list(data_list), dtype=object)
+        cleaned = self.number_cleaner.clean_series(series)
+        transformed, changed = self._transform_cleaned(cleaned)
+        
+        if transformed.dtype.kind == "i":
+            transformed_list = [None if label < 0 else f"Bin {label}" for label in transformed.tolist()]
+        else:
+            transformed_list = [None if math.isnan(value) else value for value in transformed.tolist()]
+            # Numbers no step changed keep their cleaned type, as in transform
+            unchanged = np.flatnonzero(~changed & ~np.isnan(transformed))
+            for i, value in zip(unchanged.tolist(), cleaned.iloc[unchanged].tolist()):
+                transformed_list[i] = value
+        
+        self.transform_stats["total_records"] += len(transformed_list)
+        self.transform_stats["transformed_records"] += len(transformed_list)
+        
+        self.logger.info("Batch transformation completed. Stats: %s", self.transform_stats)
+        return transformed_list
+    
+    def transform_array(self, arr: Union[np.ndarray, pd.Series, List[Any]]) -> np.ndarray:
+        """
+        Transform an array of numbers, applying each configured step to the whole array at once.
+        
+        Args:
+            arr (Union[np.ndarray, pd.Series, List[Any]]): Numbers to be transformed.
+            
+        Returns:
+            np.ndarray: Transformed numbers as float64, with NaN for invalid input,
+            or int64 bin numbers with -1 for invalid input when discretizing.
+        """
+        series = arr if isinstance(arr, pd.Series) else pd.Series(list(arr), dtype=object)
+        return self._transform_cleaned(self.number_cleaner.clean_series(series))[0]
+    
+    def _transform_cleaned(self, cleaned: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Apply each configured step to an array of cleaned numbers.
+        
+        Args:
+            cleaned (pd.Series): Cleaned numbers, with missing values for invalid input.
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Transformed numbers or bin numbers as
+            returned by transform_array, and a mask of the values a step changed.
+        """
+        values = cleaned.to_numpy(dtype=np.float64, na_value=np.nan)
+        missing = np.isnan(values)
+        changed = np.zeros(len(values), dtype=bool)
+        
+        # Apply log transformation
+        if self.log_transform:
+            positive = values > 0
+            non_positive_count = int((~positive & ~missing).sum())
+            if non_positive_count:
+                self.logger.warning("Log transformation requires positive numbers, got %s that are not", non_positive_count)
+            # Log into a copy, as the cleaned array can be a read-only view
+            values = np.log(values, out=values.copy(), where=positive)
+            changed |= positive
+        
+        # Apply normalization
+        if self.normalize:
+            if self.min_value is None or self.max_value is None:
+                self.logger.warning("Normalization requires min and max values. Call fit() first.")
+            elif self.max_value == self.min_value:
+                values = np.where(missing, np.nan, 0.0)
+                changed[:] = True
+            else:
+                values = (values - self.min_value) / (self.max_value - self.min_value)
+                changed[:] = True
+        
+        # Apply standardization
+        if self.standardize:
+            if self.mean is None or self.std is None:
+                self.logger.warning("Standardization requires mean and std values. Call fit() first.")
+            elif self.std == 0:
+                values = np.where(missing, np.nan, 0.0)
+                changed[:] = True
+            else:
+                values = (values - self.mean) / self.std
+                changed[:] = True
+        
+        # Apply discretization
+        if self.discretize:
+            if self.bins is None:
+                self.logger.warning("Discretization requires bins. Call fit() first.")
+            else:
+                # Bin i covers bins[i-1] to bins[i], and a value on an edge goes to the lower bin
+                bins = np.asarray(self.bins, dtype=np.float64)
+                labels = np.maximum(np.searchsorted(bins, values, side="left"), 1)
+                labels[values < bins[0]] = 0
+                labels[(values > bins[-1]) | np.isnan(values)] = len(bins)
+                labels[missing] = -1
+                return labels.astype(np.int64), np.ones(len(values), dtype=bool)
+        
+        return values, changed
+    
     def get_statistics(self) -> Dict:
         """
         Get statistics of the fitted data.
@@ -167,27 +285,34 @@ class NumberTransformer(DataTransformer):
             Dict: Statistics dictionary.
         """
         stats = {
-            "count": len(self.data),
+            "count": int(self.data.size),
             "min": self.min_value,
             "max": self.max_value,
             "mean": self.mean,
             "std": self.std
         }
         
-        if self.data:
-            # Calculate median
-            sorted_data = sorted(self.data)
-            n = len(sorted_data)
-            if n % 2 == 0:
-                median = (sorted_data[n//2 - 1] + sorted_data[n//2]) / 2
-            else:
-                median = sorted_data[n//2]
-            stats["median"] = median
-            
-            # Calculate quartiles
-            q1 = sorted_data[n//4]
-            q3 = sorted_data[3*n//4]
-            stats["q1"] = q1
-            stats["q3"] = q3
+        if self.data.size:
+            stats.update(self._get_quantiles())
         
         return stats
+    
+    def _get_quantiles(self) -> Dict[str, float]:
+        """
+        Get the median and quartiles of the fitted data, computed once per fit.
+        
+        Returns:
+            Dict[str, float]: Median and first and third quartiles.
+        """
+        if self._quantiles is None:
+            arr = self.data
+            n = arr.size
+            
+            # Quartiles are the values at the n//4 and 3n//4 sorted positions
+            partitioned = np.partition(arr, [n//4, 3*n//4])
+            self._quantiles = {
+                "median": float(np.median(arr)),
+                "q1": float(partitioned[n//4]),
+                "q3": float(partitioned[3*n//4])
+            }
+        return self._quantiles
@@ -3,7 +3,7 @@
 Text transformation utilities.
 """
 
-from typing import Any, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 import re
 import string
 from collections import Counter
@@ -11,6 +11,17 @@ from collections import Counter
 from .base_transformer import DataTransformer
 from ..config import Config
 
+# Word token pattern and punctuation deletion table
+_TOKEN_RE = re.compile(r"\b\w+\b")
+_PUNCT_TABLE = str.maketrans("", "", string.punctuation)
+
+# Tables that also change the case of ASCII letters, applying both in one pass
+_LOWER_PUNCT_TABLE = {**_PUNCT_TABLE, **str.maketrans(string.ascii_uppercase, string.ascii_lowercase)}
+_UPPER_PUNCT_TABLE = {**_PUNCT_TABLE, **str.maketrans(string.ascii_lowercase, string.ascii_uppercase)}
+
+# Maximum number of lemmatized or stemmed words cached per transformer
+_WORD_CACHE_SIZE = 100_000
+
 class TextTransformer(DataTransformer):
     """
     Text transformation utility class.
@@ -25,7 +36,7 @@ class TextTransformer(DataTransformer):
         lemmatize (bool): Whether to lemmatize words.
         stem (bool): Whether to stem words.
         ngrams (Optional[int]): Size of n-grams to generate.
-        stopwords (Set[str]): Set of stopwords to remove.
+        stopwords (FrozenSet[str]): Lowercased set of stopwords to remove.
     """
     
     def __init__(self, config: Optional[Config] = None):
@@ -48,8 +59,8 @@ class TextTransformer(DataTransformer):
         self.stem = self.config.get("text_transformer.stem", False)
         self.ngrams = self.config.get("text_transformer.ngrams", None)
         
-        # Load stopwords
-        self.stopwords = set(self.config.get("text_transformer.stopwords", [
+        # Load stopwords, lowercased so tokens can be matched case-insensitively
+        self.stopwords = frozenset(word.lower() for word in self.config.get("text_transformer.stopwords", [
             "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
             "with", "by", "of", "about", "as", "is", "was", "are", "were",
             "be", "been", "being", "have", "has", "had", "do", "does", "did"
@@ -74,13 +85,15 @@ class TextTransformer(DataTransformer):
                 
                 self.lemmatizer = WordNetLemmatizer()
                 self.stemmer = PorterStemmer()
+                self._lem_cache = {}
+                self._stem_cache = {}
                 self.nltk_initialized = True
             except ImportError:
                 self.logger.warning("NLTK not installed. Lemmatization and stemming will be disabled.")
                 self.lemmatize = False
                 self.stem = False
             except Exception as e:
-                self.logger.warning(f"Error initializing NLTK: {e}")
+                self.logger.warning("Error initializing NLTK: %s", e)
                 self.lemmatize = False
                 self.stem = False
     
@@ -95,6 +108,62 @@ class TextTransformer(DataTransformer):
             Union[str, List[str], Optional[List[List[str]]]]: Transformed text, which could be a string, 
             a list of tokens, or a list of n-grams depending on configuration.
         """
+        transformed_text = self._prepare_text(text)
+        if transformed_text is None:
+            return None
+        
+        # Tokenize if configured
+        if self._uses_tokens():
+            tokens = self._process_tokens(transformed_text)
+            
+            # Generate n-grams
+            if self.ngrams:
+                ngrams = self._ngrams(tokens)
+                return None if ngrams is None else [list(ngram) for ngram in ngrams]
+            
+            # Return tokens if tokenize is enabled
+            if self.tokenize:
+                return tokens
+            
+            # Otherwise join back to string
+            transformed_text = " ".join(tokens)
+        
+        return transformed_text
+    
+    def _ngrams(self, tokens: List[str]) -> Optional[List[Tuple[str, ...]]]:
+        """
+        Generate n-grams of tokens as tuples, windowing the token list in C with zip.
+        
+        Args:
+            tokens (List[str]): Tokens to generate n-grams from.
+            
+        Returns:
+            Optional[List[Tuple[str, ...]]]: N-grams, or None if there are fewer tokens than n.
+        """
+        n = self.ngrams
+        if len(tokens) < n:
+            return None
+        return list(zip(*[tokens[i:] for i in range(n)]))
+    
+    def _uses_tokens(self) -> bool:
+        """
+        Check if the configured transformation works on tokens.
+        
+        Returns:
+            bool: True if text is split into tokens, False otherwise.
+        """
+        return bool(self.tokenize or self.remove_stopwords or self.lemmatize or self.stem or self.ngrams)
+    
+    def _prepare_text(self, text: Any) -> Optional[str]:
+        """
+        Convert text to a string and apply the case and punctuation transformations.
+        
+        Args:
+            text (Any): Text to be transformed.
+            
+        Returns:
+            Optional[str]: Transformed text, or None if input is invalid.
+        """
         if text is None:
             return None
             
@@ -102,9 +171,13 @@ class TextTransformer(DataTransformer):
         try:
             transformed_text = str(text)
         except Exception as e:
-            self.logger.error(f"Error converting to string: {e}")
+            self.logger.error("Error converting to string: %s", e)
             return None
         
+        # Change case and remove punctuation in one pass for ASCII text
+        if self.strip_punctuation and (self.lowercase or self.uppercase) and transformed_text.isascii():
+            return transformed_text.translate(_LOWER_PUNCT_TABLE if self.lowercase else _UPPER_PUNCT_TABLE)
+        
         # Apply text case transformations
         if self.lowercase:
             transformed_text = transformed_text.lower()
@@ -115,45 +188,114 @@ class TextTransformer(DataTransformer):
         
         # Remove punctuation
         if self.strip_punctuation:
-            transformed_text = transformed_text.translate(str.maketrans("", "", string.punctuation))
+            transformed_text = transformed_text.translate(_PUNCT_TABLE)
         
-        # Tokenize if configured
-        if self.tokenize or self.remove_stopwords or self.lemmatize or self.stem or self.ngrams:
-            # Split into tokens
-            tokens = re.findall(r"\b\w+\b", transformed_text)
-            
-            # Remove stopwords
-            if self.remove_stopwords:
-                tokens = [token for token in tokens if token.lower() not in self.stopwords]
-            
-            # Initialize NLTK if needed
-            self._initialize_nltk()
-            
-            # Lemmatize
-            if self.lemmatize and self.lemmatizer:
-                tokens = [self.lemmatizer.lemmatize(token) for token in tokens]
+        return transformed_text
+    
+    def _process_tokens(self, transformed_text: str) -> List[str]:
+        """
+        Split text into tokens, removing stopwords and lemmatizing or stemming them if configured.
+        
+        Args:
+            transformed_text (str): Text to split.
             
-            # Stem
-            if self.stem and self.stemmer:
-                tokens = [self.stemmer.stem(token) for token in tokens]
+        Returns:
+            List[str]: Processed tokens.
+        """
+        # Split into tokens, removing stopwords in the same pass
+        tokens = self._split_words(transformed_text)
+        if self.remove_stopwords:
+            stopwords = self.stopwords
+            if self.lowercase:
+                # Text is already lowercased, so tokens can be matched directly
+                tokens = [token for token in tokens if token not in stopwords]
+            else:
+                tokens = [token for token, lower in zip(tokens, map(str.lower, tokens)) if lower not in stopwords]
+        
+        # Initialize NLTK if needed
+        self._initialize_nltk()
+        
+        # Bound once so the loops below do no attribute lookups per token
+        cached_word = self._cached_word
+        
+        # Lemmatize
+        if self.lemmatize and self.lemmatizer:
+            lem_cache, lemmatize = self._lem_cache, self.lemmatizer.lemmatize
+            tokens = [cached_word(lem_cache, lemmatize, token) for token in tokens]
+        
+        # Stem
+        if self.stem and self.stemmer:
+            stem_cache, stem = self._stem_cache, self.stemmer.stem
+            tokens = [cached_word(stem_cache, stem, token) for token in tokens]
+        
+        return tokens
+    
+    def _split_words(self, transformed_text: str) -> List[str]:
+        """
+        Split transformed text into words.
+        
+        ASCII text with punctuation stripped only has whitespace between words,
+        so it is split without the regex engine.
+        
+        Args:
+            transformed_text (str): Text to split.
             
-            # Generate n-grams
-            if self.ngrams:
-                if len(tokens) < self.ngrams:
-                    return None
-                ngrams = []
-                for i in range(len(tokens) - self.ngrams + 1):
-                    ngrams.append(tokens[i:i+self.ngrams])
-                return ngrams
+        Returns:
+            List[str]: Words in the text.
+        """
+        if self.strip_punctuation and transformed_text.isascii():
+            return transformed_text.split()
+        return _TOKEN_RE.findall(transformed_text)
+    
+    @staticmethod
+    def _cached_word(cache: Dict[str, str], func: Callable[[str], str], token: str) -> str:
+        """
+        Lemmatize or stem a word, reusing the result for words seen before.
+        
+        Args:
+            cache (Dict[str, str]): Results by word, filled up to a fixed size.
+            func (Callable[[str], str]): Lemmatizer or stemmer function.
+            token (str): Word to process.
             
-            # Return tokens if tokenize is enabled
-            if self.tokenize:
-                return tokens
+        Returns:
+            str: Processed word.
+        """
+        result = cache.get(token)
+        if result is None:
+            result = func(token)
+            if len(cache) < _WORD_CACHE_SIZE:
+                cache[token] = result
+        return result
+    
+    def _word_tokens(self, text: Any, lowercase: bool) -> Optional[List[Any]]:
+        """
+        Get the words of transformed text without joining and re-splitting them.
+        
+        Args:
+            text (Any): Text to split into words.
+            lowercase (bool): Whether words from untokenized output are lowercased.
             
-            # Otherwise join back to string
-            transformed_text = " ".join(tokens)
+        Returns:
+            Optional[List[Any]]: Words, n-grams if configured, or None if input is invalid.
+        """
+        transformed_text = self._prepare_text(text)
+        if transformed_text is None:
+            return None
         
-        return transformed_text
+        # N-grams are counted as tuples, which are hashable
+        if self.ngrams:
+            return self._ngrams(self._process_tokens(transformed_text))
+        
+        # Text lowercased by the transformation does not need lowercasing again
+        lowercase = lowercase and not self.lowercase
+        
+        if not self._uses_tokens():
+            return self._split_words(transformed_text.lower() if lowercase else transformed_text)
+        
+        tokens = self._process_tokens(transformed_text)
+        if lowercase and not self.tokenize:
+            tokens = [token.lower() for token in tokens]
+        return tokens
     
     def count_words(self, text: Any) -> Optional[Dict[str, int]]:
         """
@@ -165,15 +307,8 @@ class TextTransformer(DataTransformer):
         Returns:
             Optional[Dict[str, int]]: Dictionary of word frequencies, or None if input is invalid.
         """
-        transformed_text = self.transform(text)
-        
-        if isinstance(transformed_text, list):
-            # If already tokenized
-            tokens = transformed_text
-        elif isinstance(transformed_text, str):
-            # Tokenize the string
-            tokens = re.findall(r"\b\w+\b", transformed_text.lower())
-        else:
+        tokens = self._word_tokens(text, lowercase=True)
+        if tokens is None:
             return None
         
         return dict(Counter(tokens))
@@ -188,15 +323,8 @@ class TextTransformer(DataTransformer):
         Returns:
             Optional[List[int]]: List of word lengths, or None if input is invalid.
         """
-        transformed_text = self.transform(text)
-        
-        if isinstance(transformed_text, list):
-            # If already tokenized
-            tokens = transformed_text
-        elif isinstance(transformed_text, str):
-            # Tokenize the string
-            tokens = re.findall(r"\b\w+\b", transformed_text)
-        else:
+        tokens = self._word_tokens(text, lowercase=False)
+        if tokens is None:
             return None
         
         return [len(token) for token in tokens]
@@ -3,16 +3,20 @@
 Utility functions for data cleaning and transformation.
 """
 
-from .data_io import load_data, save_data
-from .validation import validate_data
-from .reporting import generate_report
+from .data_io import load_data, load_many, save_data
+from .validation import compile_schema, register_validator, validate_data
+from .reporting import generate_report, generate_quality_report_batch
 from .logging_config import setup_logging, logging_config
 
 __all__ = [
     "load_data",
+    "load_many",
     "save_data",
     "validate_data",
+    "compile_schema",
+    "register_validator",
     "generate_report",
+    "generate_quality_report_batch",
     "setup_logging",
     "logging_config"
 ]
@@ -6,26 +6,56 @@ Functions for loading and saving data in various formats.
 import os
 import json
 import csv
-from typing import Any, Dict, List, Optional, Union
+import math
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 
+import numpy as np
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
 from ..config import Config
 
 # Default encoding
 DEFAULT_ENCODING = "utf-8"
 
-def load_data(file_path: str, config: Optional[Config] = None, **kwargs) -> Union[pd.DataFrame, List, Dict]:
+# JSON backends: "auto" uses orjson when installed and the call allows it, "json" forces the standard library
+JSON_BACKENDS = ("auto", "json")
+
+# Maximum number of threads loading files concurrently
+MAX_LOAD_WORKERS = 32
+
+# Rows per chunk when streaming CSV files
+DEFAULT_CHUNK_SIZE = 50_000
+
+# CSV backends: "pandas" uses the pandas C parser, "arrow" the multithreaded pyarrow parser
+CSV_BACKENDS = ("pandas", "arrow")
+
+def load_data(file_path: str, config: Optional[Config] = None,
+              **kwargs) -> Union[pd.DataFrame, List, Dict, Iterator[pd.DataFrame]]:
     """
     Load data from a file.
     
+    With ``data_io.stream`` enabled in the config, CSV and Parquet files are
+    returned as an iterator of DataFrame chunks of ``data_io.chunk_size`` rows.
+    
     Args:
         file_path (str): Path to the file.
         config (Config, optional): Configuration object with loading parameters.
         **kwargs: Additional parameters to pass to the loading function.
         
     Returns:
-        Union[pd.DataFrame, List, Dict]: Loaded data.
+        Union[pd.DataFrame, List, Dict, Iterator[pd.DataFrame]]: Loaded data.
         
     Raises:
         FileNotFoundError: If the file does not exist.
@@ -34,35 +64,57 @@ def load_data(file_path: str, config: Optional[Config] = None, **kwargs) -> Unio
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"File not found: {file_path}")
     
-    # Get file extension
-    _, extension = os.path.splitext(file_path)
-    extension = extension.lower()
+    # Get the loader for the file extension
+    extension = os.path.splitext(file_path)[1].lower()
+    loader = _LOADERS.get(extension)
+    if loader is None:
+        raise ValueError(f"Unsupported file format: {extension}")
     
-    # Get default configuration
-    encoding = kwargs.get("encoding", DEFAULT_ENCODING)
+    kwargs = _with_config_encoding(extension, config, kwargs)
     
-    if config:
-        # Override with config if provided
-        encoding = config.get("data_io.encoding", encoding)
+    # Apply format options from config
+    if config and extension == ".csv":
+        if config.get("data_io.stream", False):
+            loader = load_csv_chunks
+            kwargs["chunksize"] = config.get("data_io.chunk_size", DEFAULT_CHUNK_SIZE)
+        else:
+            kwargs["csv_backend"] = config.get("data_io.csv_backend", "pandas")
+    elif config and extension == ".json":
+        kwargs["json_backend"] = config.get("data_io.json_backend", "auto")
+    elif config and extension == ".parquet" and config.get("data_io.stream", False):
+        loader = load_parquet_batches
+        kwargs["batch_size"] = config.get("data_io.chunk_size", DEFAULT_CHUNK_SIZE)
     
-    # Load based on file extension
-    if extension == ".csv":
-        return load_csv(file_path, encoding=encoding, **kwargs)
-        
-    elif extension == ".json":
-        return load_json(file_path, encoding=encoding, **kwargs)
-        
-    elif extension in [".xlsx", ".xls"]:
-        return load_excel(file_path, **kwargs)
-        
-    elif extension == ".txt":
-        return load_text(file_path, encoding=encoding, **kwargs)
+    return loader(file_path, **kwargs)
+
+def load_many(file_paths: List[str], config: Optional[Config] = None, max_workers: Optional[int] = None,
+              **kwargs) -> List[Any]:
+    """
+    Load several files concurrently.
+    
+    Files are loaded with load_data on a thread pool, so reads of different
+    files overlap instead of waiting on each other.
+    
+    Args:
+        file_paths (List[str]): Paths to the files.
+        config (Config, optional): Configuration object with loading parameters.
+        max_workers (int, optional): Number of threads. Defaults to one per file, up to MAX_LOAD_WORKERS.
+        **kwargs: Additional parameters to pass to the loading function.
         
-    elif extension == ".parquet":
-        return load_parquet(file_path, **kwargs)
+    Returns:
+        List[Any]: Loaded data, in the order of file_paths.
         
-    else:
-        raise ValueError(f"Unsupported file format: {extension}")
+    Raises:
+        FileNotFoundError: If a file does not exist.
+        ValueError: If a file format is not supported.
+    """
+    file_paths = list(file_paths)
+    if len(file_paths) <= 1:
+        return [load_data(file_path, config=config, **kwargs) for file_path in file_paths]
+    
+    max_workers = max_workers or min(len(file_paths), MAX_LOAD_WORKERS)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda file_path: load_data(file_path, config=config, **kwargs), file_paths))
 
 def save_data(data: Any, file_path: str, config: Optional[Config] = None, **kwargs) -> None:
     """
@@ -77,56 +129,94 @@ def save_data(data: Any, file_path: str, config: Optional[Config] = None, **kwar
     Raises:
         ValueError: If the file format is not supported or data type is not compatible.
     """
-    # Get file extension
-    _, extension = os.path.splitext(file_path)
-    extension = extension.lower()
+    # Get the saver for the file extension
+    extension = os.path.splitext(file_path)[1].lower()
+    saver = _SAVERS.get(extension)
+    if saver is None:
+        raise ValueError(f"Unsupported file format: {extension}")
     
-    # Get default configuration
-    encoding = kwargs.get("encoding", DEFAULT_ENCODING)
+    kwargs = _with_config_encoding(extension, config, kwargs)
     
+    # Apply format options from config
+    if config and extension == ".json":
+        kwargs["json_backend"] = config.get("data_io.json_backend", "auto")
+    
+    saver(data, file_path, **kwargs)
+
+def _with_config_encoding(extension: str, config: Optional[Config], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Set the encoding parameter for text formats, taken from config if provided.
+    
+    Args:
+        extension (str): Lowercase file extension.
+        config (Config, optional): Configuration object with IO parameters.
+        kwargs (Dict[str, Any]): Parameters for the loading or saving function.
+        
+    Returns:
+        Dict[str, Any]: Parameters with the encoding set for text formats.
+    """
+    if extension not in _TEXT_EXTENSIONS:
+        return kwargs
+    
+    encoding = kwargs.get("encoding", DEFAULT_ENCODING)
     if config:
         # Override with config if provided
         encoding = config.get("data_io.encoding", encoding)
-    
-    # Save based on file extension
-    if extension == ".csv":
-        save_csv(data, file_path, encoding=encoding, **kwargs)
-        
-    elif extension == ".json":
-        save_json(data, file_path, encoding=encoding, **kwargs)
-        
-    elif extension in [".xlsx", ".xls"]:
-        save_excel(data, file_path, **kwargs)
-        
-    elif extension == ".txt":
-        save_text(data, file_path, encoding=encoding, **kwargs)
-        
-    elif extension == ".parquet":
-        save_parquet(data, file_path, **kwargs)
-        
-    else:
-        raise ValueError(f"Unsupported file format: {extension}")
+    return {**kwargs, "encoding": encoding}
 
-def load_csv(file_path: str, encoding: str = DEFAULT_ENCODING, **kwargs) -> pd.DataFrame:
+def load_csv(file_path: str, encoding: str = DEFAULT_ENCODING, csv_backend: str = "pandas", **kwargs) -> pd.DataFrame:
     """
     Load data from a CSV file.
     
+    The "arrow" backend parses blocks of the file on several threads with
+    pyarrow, which must be installed. It infers some types differently from
+    the pandas parser, e.g. ISO timestamps are read as datetimes, and
+    supports fewer of the pandas.read_csv parameters.
+    
     Args:
         file_path (str): Path to the CSV file.
         encoding (str): File encoding.
+        csv_backend (str): CSV backend, "pandas" or "arrow".
         **kwargs: Additional parameters to pass to pandas.read_csv.
         
     Returns:
         pd.DataFrame: Loaded data as a DataFrame.
+        
+    Raises:
+        ValueError: If the backend is not supported.
     """
+    if csv_backend not in CSV_BACKENDS:
+        raise ValueError(f"Unsupported CSV backend: {csv_backend}")
+    if csv_backend == "arrow":
+        return pd.read_csv(file_path, encoding=encoding, engine="pyarrow", **kwargs)
     return pd.read_csv(file_path, encoding=encoding, **kwargs)
 
-def save_csv(data: Union[pd.DataFrame, List[Dict]], file_path: str, encoding: str = DEFAULT_ENCODING, **kwargs) -> None:
+def load_csv_chunks(file_path: str, chunksize: int = DEFAULT_CHUNK_SIZE, encoding: str = DEFAULT_ENCODING,
+                    **kwargs) -> Iterator[pd.DataFrame]:
+    """
+    Load data from a CSV file in chunks, keeping only one chunk in memory at a time.
+    
+    Args:
+        file_path (str): Path to the CSV file.
+        chunksize (int): Number of rows per chunk.
+        encoding (str): File encoding.
+        **kwargs: Additional parameters to pass to pandas.read_csv.
+        
+    Returns:
+        Iterator[pd.DataFrame]: Reader yielding the file as DataFrames of up to chunksize rows.
+    """
+    return pd.read_csv(file_path, encoding=encoding, chunksize=chunksize, **kwargs)
+
+def save_csv(data: Union[pd.DataFrame, List[Dict], Iterable[pd.DataFrame]], file_path: str,
+             encoding: str = DEFAULT_ENCODING, **kwargs) -> None:
     """
     Save data to a CSV file.
     
+    An iterable of DataFrames, such as the chunks from load_csv_chunks, is
+    written one chunk at a time, with the header taken from the first chunk.
+    
     Args:
-        data (Union[pd.DataFrame, List[Dict]]): Data to save.
+        data (Union[pd.DataFrame, List[Dict], Iterable[pd.DataFrame]]): Data to save.
         file_path (str): Path to save the CSV file.
         encoding (str): File encoding.
         **kwargs: Additional parameters to pass to pandas.to_csv or csv.writer.
@@ -143,38 +233,159 @@ def save_csv(data: Union[pd.DataFrame, List[Dict]], file_path: str, encoding: st
                 writer = csv.DictWriter(f, fieldnames=fieldnames, **kwargs)
                 writer.writeheader()
                 writer.writerows(data)
+    elif isinstance(data, Iterable) and not isinstance(data, (str, bytes, list, dict)):
+        header = kwargs.pop("header", True)
+        mode = "w"
+        for chunk in data:
+            if not isinstance(chunk, pd.DataFrame):
+                raise ValueError("Chunks must be pandas DataFrames")
+            chunk.to_csv(file_path, encoding=encoding, mode=mode, header=header, **kwargs)
+            mode, header = "a", False
     else:
-        raise ValueError("Data must be a pandas DataFrame or a list of dictionaries")
+        raise ValueError("Data must be a pandas DataFrame, a list of dictionaries or an iterable of DataFrames")
+
+def get_json_backend() -> str:
+    """
+    Get the JSON library used by load_json and save_json with the "auto" backend.
+    
+    Returns:
+        str: "orjson" if it is installed, "json" otherwise.
+    """
+    return "json" if orjson is None else "orjson"
 
-def load_json(file_path: str, encoding: str = DEFAULT_ENCODING, **kwargs) -> Union[List, Dict]:
+def _use_orjson(json_backend: str, encoding: str, kwargs: Dict[str, Any]) -> bool:
+    """
+    Check if a JSON call can go through orjson.
+    
+    orjson only reads and writes UTF-8 and takes none of the json module's
+    keyword arguments, so other calls use the standard library.
+    
+    Args:
+        json_backend (str): Requested backend, one of JSON_BACKENDS.
+        encoding (str): File encoding.
+        kwargs (Dict[str, Any]): Additional parameters for the json module.
+        
+    Returns:
+        bool: True if orjson should be used, False otherwise.
+        
+    Raises:
+        ValueError: If the backend is not supported.
+    """
+    if json_backend not in JSON_BACKENDS:
+        raise ValueError(f"Unsupported JSON backend: {json_backend}")
+    return (json_backend == "auto" and orjson is not None and not kwargs
+            and encoding.lower().replace("_", "-") in ("utf-8", "utf8"))
+
+def load_json(file_path: str, encoding: str = DEFAULT_ENCODING, json_backend: str = "auto", **kwargs) -> Union[List, Dict]:
     """
     Load data from a JSON file.
     
+    With the "auto" backend, UTF-8 files are parsed with orjson when it is
+    installed. Files orjson rejects, such as ones containing NaN or integers
+    beyond 64 bits, are parsed again with the json module.
+    
     Args:
         file_path (str): Path to the JSON file.
         encoding (str): File encoding.
+        json_backend (str): JSON backend, "auto" or "json".
         **kwargs: Additional parameters to pass to json.load.
         
     Returns:
         Union[List, Dict]: Loaded JSON data.
     """
+    if _use_orjson(json_backend, encoding, kwargs):
+        with open(file_path, "rb") as f:
+            content = f.read()
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return json.loads(content.decode(encoding))
+    
     with open(file_path, "r", encoding=encoding) as f:
         return json.load(f, **kwargs)
 
-def save_json(data: Any, file_path: str, encoding: str = DEFAULT_ENCODING, indent: int = 4, **kwargs) -> None:
+def save_json(data: Any, file_path: str, encoding: str = DEFAULT_ENCODING, indent: int = 4,
+              json_backend: str = "auto", **kwargs) -> None:
     """
     Save data to a JSON file.
     
+    With the "auto" backend, orjson is used when it is installed and indent
+    is None or 2, the only layouts it writes. orjson writes non-ASCII
+    characters unescaped. Data holding NaN or infinity, which orjson would
+    write as null, and data it cannot serialize are written with the json
+    module, so they load back unchanged. Both write NumPy values as numbers
+    or lists and dates as ISO 8601 strings.
+    
     Args:
         data (Any): Data to save (must be JSON serializable).
         file_path (str): Path to save the JSON file.
         encoding (str): File encoding.
         indent (int): Number of spaces for indentation.
+        json_backend (str): JSON backend, "auto" or "json".
         **kwargs: Additional parameters to pass to json.dump.
     """
+    if _use_orjson(json_backend, encoding, kwargs) and indent in (None, 2) and not _has_non_finite(data):
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        try:
+            content = orjson.dumps(data, option=option)
+        except orjson.JSONEncodeError:
+            content = None
+        if content is not None:
+            with open(file_path, "wb") as f:
+                f.write(content)
+            return
+    
+    kwargs.setdefault("default", _json_default)
     with open(file_path, "w", encoding=encoding) as f:
         json.dump(data, f, indent=indent, **kwargs)
 
+def _has_non_finite(data: Any) -> bool:
+    """
+    Check if data holds NaN or infinite floats, which orjson writes as null.
+    
+    Args:
+        data (Any): Data to check.
+        
+    Returns:
+        bool: True if any float in the data is NaN or infinite, False otherwise.
+    """
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, (float, np.floating)):
+            if not math.isfinite(obj):
+                return True
+        elif isinstance(obj, dict):
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple)):
+            stack.extend(obj)
+        elif isinstance(obj, np.ndarray):
+            if obj.dtype.kind in "fc":
+                if not np.isfinite(obj).all():
+                    return True
+            elif obj.dtype.kind == "O":
+                stack.extend(obj.ravel().tolist())
+    return False
+
+def _json_default(obj: Any) -> Any:
+    """
+    Convert NumPy values and dates, which reports and cleaned data often contain, for the json module.
+    
+    Args:
+        obj (Any): Object the json module cannot serialize.
+        
+    Returns:
+        Any: Python scalar or list for NumPy values, ISO 8601 string for dates.
+        
+    Raises:
+        TypeError: If the object cannot be converted.
+    """
+    if isinstance(obj, (np.generic, np.ndarray)):
+        return obj.tolist()
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 def load_excel(file_path: str, **kwargs) -> pd.DataFrame:
     """
     Load data from an Excel file.
@@ -188,18 +399,65 @@ def load_excel(file_path: str, **kwargs) -> pd.DataFrame:
     """
     return pd.read_excel(file_path, **kwargs)
 
-def save_excel(data: pd.DataFrame, file_path: str, **kwargs) -> None:
+def save_excel(data: pd.DataFrame, file_path: str, streaming: bool = False, **kwargs) -> None:
     """
     Save data to an Excel file.
     
+    With streaming enabled, rows are written to disk as they are produced so
+    memory use does not grow with the sheet. Streaming requires xlsxwriter
+    and a .xlsx file, writes the header and values without the index, and
+    leaves missing values blank.
+    
     Args:
         data (pd.DataFrame): Data to save.
         file_path (str): Path to save the Excel file.
-        **kwargs: Additional parameters to pass to pandas.to_excel.
+        streaming (bool): Whether to write rows with bounded memory.
+        **kwargs: Additional parameters to pass to pandas.to_excel, or sheet_name when streaming.
+        
+    Raises:
+        ValueError: If streaming is requested without xlsxwriter or for a non-.xlsx file.
     """
-    with pd.ExcelWriter(file_path) as writer:
+    is_xlsx = file_path.lower().endswith(".xlsx")
+    if streaming:
+        if xlsxwriter is None or not is_xlsx:
+            raise ValueError("Streaming Excel output requires xlsxwriter and a .xlsx file")
+        _save_excel_streaming(data, file_path, **kwargs)
+        return
+    
+    # xlsxwriter writes .xlsx files faster than openpyxl, pandas' default engine
+    engine = "xlsxwriter" if xlsxwriter is not None and is_xlsx else None
+    with pd.ExcelWriter(file_path, engine=engine) as writer:
         data.to_excel(writer, **kwargs)
 
+def _save_excel_streaming(data: pd.DataFrame, file_path: str, sheet_name: str = "Sheet1") -> None:
+    """
+    Write a DataFrame to a .xlsx file row by row in xlsxwriter's constant memory mode.
+    
+    Args:
+        data (pd.DataFrame): Data to save.
+        file_path (str): Path to save the Excel file.
+        sheet_name (str): Name of the worksheet.
+    """
+    workbook = xlsxwriter.Workbook(file_path, {"constant_memory": True})
+    try:
+        worksheet = workbook.add_worksheet(sheet_name)
+        date_format = workbook.add_format({"num_format": "yyyy-mm-dd hh:mm:ss"})
+        worksheet.write_row(0, 0, [str(column) for column in data.columns])
+        
+        # Constant memory mode only keeps the current row, so cells are written row by row
+        for row_index, row in enumerate(data.itertuples(index=False, name=None), start=1):
+            for col_index, value in enumerate(row):
+                if value is None or value is pd.NA or value is pd.NaT or (isinstance(value, float) and math.isnan(value)):
+                    continue
+                if isinstance(value, np.generic):
+                    value = value.item()
+                if isinstance(value, datetime):
+                    worksheet.write_datetime(row_index, col_index, value.replace(tzinfo=None), date_format)
+                else:
+                    worksheet.write(row_index, col_index, value)
+    finally:
+        workbook.close()
+
 def load_text(file_path: str, encoding: str = DEFAULT_ENCODING, **kwargs) -> List[str]:
     """
     Load data from a text file.
@@ -231,26 +489,80 @@ def save_text(data: Union[str, List[str]], file_path: str, encoding: str = DEFAU
         else:
             f.write(data)
 
-def load_parquet(file_path: str, **kwargs) -> pd.DataFrame:
+def load_parquet(file_path: str, columns: Optional[List[str]] = None, filters: Optional[List] = None,
+                 **kwargs) -> pd.DataFrame:
     """
     Load data from a Parquet file.
     
+    Only the requested columns are read, and row groups whose min/max
+    statistics cannot match the filters are skipped without being read.
+    
     Args:
         file_path (str): Path to the Parquet file.
+        columns (List[str], optional): Columns to read. If None, all columns are read.
+        filters (List, optional): Row filters as a list of (column, op, value) tuples
+            that must all hold, or a list of such lists of which any must hold, e.g.
+            ``[("year", ">=", 2020), ("country", "in", ["FR", "DE"])]``.
         **kwargs: Additional parameters to pass to pandas.read_parquet.
         
     Returns:
         pd.DataFrame: Loaded data as a DataFrame.
     """
-    return pd.read_parquet(file_path, **kwargs)
+    if filters is not None:
+        kwargs["filters"] = filters
+    return pd.read_parquet(file_path, columns=columns, **kwargs)
 
-def save_parquet(data: pd.DataFrame, file_path: str, **kwargs) -> None:
+def load_parquet_batches(file_path: str, batch_size: int = DEFAULT_CHUNK_SIZE,
+                         columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+    """
+    Load data from a Parquet file in batches, keeping only one batch in memory at a time.
+    
+    Requires pyarrow.
+    
+    Args:
+        file_path (str): Path to the Parquet file.
+        batch_size (int): Maximum number of rows per batch.
+        columns (List[str], optional): Columns to read. If None, all columns are read.
+        
+    Returns:
+        Iterator[pd.DataFrame]: The file as DataFrames of up to batch_size rows.
+    """
+    import pyarrow.parquet as pq
+    
+    parquet_file = pq.ParquetFile(file_path)
+    for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+        yield batch.to_pandas()
+
+def save_parquet(data: pd.DataFrame, file_path: str, compression: Optional[str] = "zstd", **kwargs) -> None:
     """
     Save data to a Parquet file.
     
     Args:
         data (pd.DataFrame): Data to save.
         file_path (str): Path to save the Parquet file.
+        compression (str, optional): Compression codec. zstd gives smaller files than
+            pandas' default snappy at a similar speed.
         **kwargs: Additional parameters to pass to pandas.to_parquet.
     """
-    data.to_parquet(file_path, **kwargs)
+    data.to_parquet(file_path, compression=compression, **kwargs)
+
+# Loading and saving functions by lowercase file extension
+_LOADERS = {
+    ".csv": load_csv,
+    ".json": load_json,
+    ".xlsx": load_excel,
+    ".xls": load_excel,
+    ".txt": load_text,
+    ".parquet": load_parquet
+}
+_SAVERS = {
+    ".csv": save_csv,
+    ".json": save_json,
+    ".xlsx": save_excel,
+    ".xls": save_excel,
+    ".txt": save_text,
+    ".parquet": save_parquet
+}
+
+# Extensions of text formats, whose functions take an encoding
+_TEXT_EXTENSIONS = frozenset({".csv", ".json", ".txt"})
@@ -4,6 +4,8 @@ Functions and configuration for setting up logging across the project.
 """
 
 import logging
+import logging.config
+import logging.handlers
 import os
 from datetime import datetime
 from typing import Dict, Optional
@@ -42,6 +44,12 @@ logging_config = {
     }
 }
 
+# Formatters for the named formats, shared by the handlers added below
+_FORMATTERS = {
+    name: logging.Formatter(formatter["format"])
+    for name, formatter in logging_config["formatters"].items()
+}
+
 def setup_logging(config: Optional[Dict] = None, log_file_path: Optional[str] = None) -> None:
     """
     Set up logging configuration for the project.
@@ -58,8 +66,8 @@ def setup_logging(config: Optional[Dict] = None, log_file_path: Optional[str] =
     if log_file_path:
         # Ensure directory exists
         log_dir = os.path.dirname(log_file_path)
-        if log_dir and not os.path.exists(log_dir):
-            os.makedirs(log_dir)
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
         
         # Update file handler
         if "file" in config["handlers"]:
@@ -98,8 +106,8 @@ def create_rotating_log_handler(log_file_path: str, max_bytes: int = 10485760, b
     """
     # Ensure directory exists
     log_dir = os.path.dirname(log_file_path)
-    if log_dir and not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    if log_dir:
+        os.makedirs(log_dir, exist_ok=True)
     
     return logging.handlers.RotatingFileHandler(
         log_file_path,
@@ -122,8 +130,8 @@ def create_timed_rotating_log_handler(log_file_path: str, when: str = "midnight"
     """
     # Ensure directory exists
     log_dir = os.path.dirname(log_file_path)
-    if log_dir and not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    if log_dir:
+        os.makedirs(log_dir, exist_ok=True)
     
     return logging.handlers.TimedRotatingFileHandler(
         log_file_path,
@@ -143,6 +151,18 @@ def configure_logging_levels(levels: Dict[str, str]) -> None:
         logger = logging.getLogger(logger_name)
         logger.setLevel(level.upper())
 
+def _get_formatter(formatter_name: str) -> logging.Formatter:
+    """
+    Get the shared formatter for a format name.
+    
+    Args:
+        formatter_name (str): Formatter name, "detailed" or "standard".
+        
+    Returns:
+        logging.Formatter: Formatter, the standard one for unknown names.
+    """
+    return _FORMATTERS.get(formatter_name, _FORMATTERS["standard"])
+
 def add_file_handler(logger_name: str, log_file_path: str, level: str = "DEBUG", formatter_name: str = "detailed") -> None:
     """
     Add a file handler to a logger.
@@ -159,13 +179,7 @@ def add_file_handler(logger_name: str, log_file_path: str, level: str = "DEBUG",
     handler = logging.FileHandler(log_file_path)
     handler.setLevel(level.upper())
     
-    # Create formatter
-    if formatter_name == "detailed":
-        formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s")
-    else:
-        formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-    
-    handler.setFormatter(formatter)
+    handler.setFormatter(_get_formatter(formatter_name))
     logger.addHandler(handler)
 
 def add_console_handler(logger_name: str, level: str = "INFO", formatter_name: str = "standard") -> None:
@@ -183,13 +197,7 @@ def add_console_handler(logger_name: str, level: str = "INFO", formatter_name: s
     handler = logging.StreamHandler()
     handler.setLevel(level.upper())
     
-    # Create formatter
-    if formatter_name == "detailed":
-        formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s")
-    else:
-        formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-    
-    handler.setFormatter(formatter)
+    handler.setFormatter(_get_formatter(formatter_name))
     logger.addHandler(handler)
 
 def create_log_dir(base_dir: str = "./logs") -> str:
@@ -205,7 +213,6 @@ def create_log_dir(base_dir: str = "./logs") -> str:
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_dir = os.path.join(base_dir, timestamp)
     
-    if not os.path.exists(log_dir):
-        os.makedirs(log_dir)
+    os.makedirs(log_dir, exist_ok=True)
     
     return log_dir
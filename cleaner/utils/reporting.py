@@ -3,10 +3,38 @@
 Functions for generating data cleaning and transformation reports.
 """
 
+import functools
+import heapq
+import html
 import json
+import math
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 import pandas as pd
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .data_io import _has_non_finite
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Minimum number of cells before column statistics are split across processes
+PARALLEL_STATISTICS_THRESHOLD = 5_000_000
+
+# Statistics reported for numeric and string columns
+NUMERIC_STATISTICS = ("min", "max", "mean", "median", "std", "variance")
+STRING_STATISTICS = ("min_length", "max_length", "mean_length")
 
 def generate_report(data: Any, report_type: str = "cleaning", **kwargs) -> Dict[str, Any]:
     """
@@ -23,7 +51,7 @@ def generate_report(data: Any, report_type: str = "cleaning", **kwargs) -> Dict[
     # Create base report structure
     report = {
         "report_type": report_type,
-        "generated_at": datetime.now().isoformat(),
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
         "metadata": {
             "data_type": type(data).__name__
         },
@@ -33,21 +61,12 @@ def generate_report(data: Any, report_type: str = "cleaning", **kwargs) -> Dict[
     }
     
     # Generate report based on type
-    if report_type == "cleaning":
-        return generate_cleaning_report(data, report, **kwargs)
-        
-    elif report_type == "transformation":
-        return generate_transformation_report(data, report, **kwargs)
-        
-    elif report_type == "quality":
-        return generate_quality_report(data, report, **kwargs)
-        
-    elif report_type == "validation":
-        return generate_validation_report(data, report, **kwargs)
-        
-    else:
+    generator = _REPORT_GENERATORS.get(report_type)
+    if generator is None:
         report["errors"] = [f"Unsupported report type: {report_type}"]
         return report
+    
+    return generator(data, report, **kwargs)
 
 def generate_cleaning_report(data: Any, report: Dict[str, Any], **kwargs) -> Dict[str, Any]:
     """
@@ -160,7 +179,7 @@ def generate_quality_report(data: Any, report: Dict[str, Any], **kwargs) -> Dict
     # For other data types
     report["results"] = {
         "data_type": type(data).__name__,
-        "data_size": get_data_size(data),
+        "data_size": get_data_size(data, kwargs.get("size_mode", "bytes")),
         "missing_values": count_missing_values(data)
     }
     
@@ -171,14 +190,22 @@ def generate_quality_report(data: Any, report: Dict[str, Any], **kwargs) -> Dict
     
     return report
 
-def generate_dataframe_quality_report(df: pd.DataFrame, report: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+def generate_dataframe_quality_report(df: pd.DataFrame, report: Dict[str, Any],
+                                      column_tables: Optional[Tuple[pd.Series, pd.Series, pd.Series, Dict[Any, Dict[str, Any]]]] = None,
+                                      **kwargs) -> Dict[str, Any]:
     """
     Generate a data quality report for a pandas DataFrame.
     
     Args:
         df (pd.DataFrame): DataFrame to assess quality for.
         report (Dict): Base report structure.
-        **kwargs: Additional report parameters.
+        column_tables (Optional[Tuple]): Precomputed column statistics tables,
+            as returned by calculate_column_tables, to use instead of scanning df.
+        **kwargs: Additional report parameters. With categorize_strings=True,
+            low-cardinality object string columns are scanned as categoricals,
+            so repeated scans compare integer codes instead of strings. With
+            n_jobs other than 1 (-1 for all CPUs), column statistics of frames
+            larger than parallel_threshold cells are computed in worker processes.
         
     Returns:
         Dict[str, Any]: DataFrame quality report.
@@ -190,54 +217,74 @@ def generate_dataframe_quality_report(df: pd.DataFrame, report: Dict[str, Any],
         "columns_list": list(df.columns)
     })
     
-    # Calculate column-wise statistics
+    dtypes = df.dtypes
+    numeric_columns, string_columns, datetime_count, object_count = _partition_columns(df)
+    
+    # Scan low-cardinality string columns through category codes if requested
+    if column_tables is None and kwargs.get("categorize_strings", False):
+        df = categorize_string_columns(df, [col for col in string_columns if dtypes[col] == object])
+    
+    # Compute each statistic for all columns, splitting the columns across processes for large frames
+    row_count = len(df)
+    n_jobs = kwargs.get("n_jobs", 1)
+    if column_tables is not None:
+        counts, missing_counts, unique_counts, kind_stats = column_tables
+    elif row_count == 0:
+        # An empty frame has nothing to scan: every count is zero and every value statistic is NaN
+        counts = missing_counts = unique_counts = pd.Series(0, index=df.columns, dtype="int64")
+        kind_stats = {column: dict.fromkeys(NUMERIC_STATISTICS, np.nan) for column in numeric_columns}
+        kind_stats.update((column, dict.fromkeys(STRING_STATISTICS, np.nan)) for column in string_columns)
+    elif n_jobs != 1 and len(df.columns) > 1 and df.size > kwargs.get("parallel_threshold", PARALLEL_STATISTICS_THRESHOLD):
+        counts, missing_counts, unique_counts, kind_stats = calculate_column_tables_parallel(
+            df, numeric_columns, string_columns, n_jobs
+        )
+    else:
+        counts, missing_counts, unique_counts, kind_stats = calculate_column_tables(df, numeric_columns, string_columns)
+    duplicate_rows = count_duplicate_rows(df) if row_count > 0 else 0
+    
+    # Percentages for all columns at once
+    if row_count > 0:
+        missing_percentages = missing_counts / row_count * 100
+        unique_percentages = unique_counts / row_count * 100
+    else:
+        missing_percentages = unique_percentages = [0] * len(df.columns)
+    
+    # Assemble column-wise statistics from the precomputed tables
     column_stats = {}
-    for column in df.columns:
+    for column, dtype, count, missing_count, missing_percentage, unique_count, unique_percentage in zip(
+        df.columns, dtypes, counts, missing_counts, missing_percentages, unique_counts, unique_percentages
+    ):
         column_stats[column] = {
-            "data_type": str(df[column].dtype),
-            "count": df[column].count(),
-            "missing_count": df[column].isna().sum(),
-            "missing_percentage": (df[column].isna().sum() / len(df) * 100) if len(df) > 0 else 0,
-            "unique_count": df[column].nunique(),
-            "unique_percentage": (df[column].nunique() / len(df) * 100) if len(df) > 0 else 0
+            "data_type": str(dtype),
+            "count": count,
+            "missing_count": missing_count,
+            "missing_percentage": missing_percentage,
+            "unique_count": unique_count,
+            "unique_percentage": unique_percentage
         }
         
-        # Add numeric statistics if applicable
-        if pd.api.types.is_numeric_dtype(df[column]):
-            column_stats[column].update({
-                "min": df[column].min(),
-                "max": df[column].max(),
-                "mean": df[column].mean(),
-                "median": df[column].median(),
-                "std": df[column].std(),
-                "variance": df[column].var()
-            })
-        
-        # Add string statistics if applicable
-        elif pd.api.types.is_string_dtype(df[column]):
-            column_stats[column].update({
-                "min_length": df[column].str.len().min(),
-                "max_length": df[column].str.len().max(),
-                "mean_length": df[column].str.len().mean()
-            })
+        # Add numeric or string statistics if applicable
+        if column in kind_stats:
+            column_stats[column].update(kind_stats[column])
     
     # Add results
+    total_missing = missing_counts.sum()
     report["results"] = {
-        "total_rows": len(df),
+        "total_rows": row_count,
         "total_columns": len(df.columns),
-        "total_missing_values": df.isna().sum().sum(),
-        "total_missing_percentage": (df.isna().sum().sum() / df.size * 100) if df.size > 0 else 0,
+        "total_missing_values": total_missing,
+        "total_missing_percentage": (total_missing / df.size * 100) if df.size > 0 else 0,
         "columns_statistics": column_stats,
-        "duplicate_rows": df.duplicated().sum(),
-        "duplicate_rows_percentage": (df.duplicated().sum() / len(df) * 100) if len(df) > 0 else 0
+        "duplicate_rows": duplicate_rows,
+        "duplicate_rows_percentage": (duplicate_rows / row_count * 100) if row_count > 0 else 0
     }
     
     # Calculate overall statistics
     report["statistics"] = {
-        "numeric_columns": sum(1 for col in df.columns if pd.api.types.is_numeric_dtype(df[col])),
-        "string_columns": sum(1 for col in df.columns if pd.api.types.is_string_dtype(df[col])),
-        "datetime_columns": sum(1 for col in df.columns if pd.api.types.is_datetime64_any_dtype(df[col])),
-        "object_columns": sum(1 for col in df.columns if pd.api.types.is_object_dtype(df[col])),
+        "numeric_columns": len(numeric_columns),
+        "string_columns": len(string_columns),
+        "datetime_columns": datetime_count,
+        "object_columns": object_count,
         "columns_with_missing_values": sum(1 for col_stats in column_stats.values() if col_stats["missing_count"] > 0),
         "columns_with_high_missing_values": sum(1 for col_stats in column_stats.values() if col_stats["missing_percentage"] > 50)
     }
@@ -288,6 +335,330 @@ def generate_validation_report(data: Any, report: Dict[str, Any], **kwargs) -> D
     
     return report
 
+def generate_quality_report_batch(dfs: List[pd.DataFrame], **kwargs) -> List[Dict[str, Any]]:
+    """
+    Generate data quality reports for many DataFrames, such as the chunks of one dataset.
+    
+    When the frames share their columns and dtypes, their column statistics
+    are computed together on one concatenated frame with grouped reductions,
+    instead of one set of reductions per frame. Other inputs are reported one
+    frame at a time.
+    
+    Args:
+        dfs (List[pd.DataFrame]): DataFrames to assess quality for.
+        **kwargs: Additional report parameters, as for generate_report.
+        
+    Returns:
+        List[Dict[str, Any]]: One quality report per DataFrame, in input order.
+    """
+    dfs = list(dfs)
+    if len(dfs) > 1 and not kwargs.get("categorize_strings", False) and _share_schema(dfs):
+        tables = calculate_column_tables_batch(dfs)
+        return [generate_report(df, "quality", column_tables=df_tables, **kwargs) for df, df_tables in zip(dfs, tables)]
+    
+    return [generate_report(df, "quality", **kwargs) for df in dfs]
+
+def _share_schema(dfs: List[pd.DataFrame]) -> bool:
+    """
+    Check if non-empty DataFrames have the same unique columns and dtypes.
+    
+    Args:
+        dfs (List[pd.DataFrame]): DataFrames to check.
+        
+    Returns:
+        bool: True if the frames can be reduced together, False otherwise.
+    """
+    first = dfs[0]
+    if not first.columns.is_unique or len(first.columns) == 0:
+        return False
+    return all(
+        len(df) > 0 and df.columns.equals(first.columns) and df.dtypes.equals(first.dtypes)
+        for df in dfs
+    )
+
+def calculate_column_tables_batch(dfs: List[pd.DataFrame]) -> List[Tuple[pd.Series, pd.Series, pd.Series, Dict[Any, Dict[str, Any]]]]:
+    """
+    Calculate the per-column statistics tables of several DataFrames together.
+    
+    The frames are concatenated once and each statistic is computed for all of
+    them with one grouped reduction. String length statistics depend on each
+    frame's values, so they are still computed per frame.
+    
+    Args:
+        dfs (List[pd.DataFrame]): Non-empty DataFrames with the same columns and dtypes.
+        
+    Returns:
+        List[Tuple]: Tables for each DataFrame, as returned by calculate_column_tables.
+    """
+    combined = pd.concat(dfs, keys=range(len(dfs)))
+    groups = combined.groupby(level=0)
+    counts = groups.count()
+    missing_counts = combined.isna().groupby(level=0).sum()
+    unique_counts = groups.nunique()
+    
+    # Numeric statistics for all frames, grouped by dtype as in calculate_numeric_statistics
+    numeric_columns = _partition_columns(dfs[0])[0]
+    columns_by_dtype: Dict[Any, List[Any]] = {}
+    for column in numeric_columns:
+        columns_by_dtype.setdefault(combined[column].dtype, []).append(column)
+    kind_stats = [{column: {} for column in numeric_columns} for _ in dfs]
+    for dtype_columns in columns_by_dtype.values():
+        numeric_table = groups[dtype_columns].agg(["min", "max", "mean", "median", "std", "var"])
+        for (column, name), values in numeric_table.items():
+            name = "variance" if name == "var" else name
+            for frame_stats, value in zip(kind_stats, values.tolist()):
+                frame_stats[column][name] = value
+    
+    tables = []
+    for i, df in enumerate(dfs):
+        kind_stats[i].update(calculate_string_statistics(df, _partition_columns(df)[1]))
+        tables.append((counts.loc[i], missing_counts.loc[i], unique_counts.loc[i], kind_stats[i]))
+    
+    return tables
+
+def _partition_columns(df: pd.DataFrame) -> Tuple[List[Any], List[Any], int, int]:
+    """
+    Partition the columns of a DataFrame by kind in one pass over the dtypes.
+    
+    Columns of object kind count as strings only if their values are strings,
+    so those are checked on the column itself.
+    
+    Args:
+        df (pd.DataFrame): DataFrame to partition.
+        
+    Returns:
+        Tuple: Numeric columns, string columns, number of datetime columns and
+            number of object columns.
+    """
+    numeric_columns = []
+    string_columns = []
+    datetime_count = 0
+    object_count = 0
+    for column, dtype in df.dtypes.items():
+        if pd.api.types.is_numeric_dtype(dtype):
+            numeric_columns.append(column)
+        elif pd.api.types.is_string_dtype(df[column] if dtype.kind == "O" else dtype):
+            string_columns.append(column)
+        datetime_count += pd.api.types.is_datetime64_any_dtype(dtype)
+        object_count += pd.api.types.is_object_dtype(dtype)
+    return numeric_columns, string_columns, datetime_count, object_count
+
+def calculate_column_tables(df: pd.DataFrame, numeric_columns: List[Any], string_columns: List[Any]) -> Tuple[pd.Series, pd.Series, pd.Series, Dict[Any, Dict[str, Any]]]:
+    """
+    Calculate the per-column statistics tables of a quality report.
+    
+    Args:
+        df (pd.DataFrame): DataFrame to analyze.
+        numeric_columns (List): Columns to compute numeric statistics for.
+        string_columns (List): Columns to compute string statistics for.
+        
+    Returns:
+        Tuple: Non-missing counts, missing counts and unique counts as Series
+            indexed by column, and a dict of kind-specific statistics per column.
+    """
+    # Each statistic for all columns in one pass over the frame
+    counts = df.count()
+    missing_counts = df.isna().sum()
+    unique_counts = df.nunique()
+    
+    # Kind-specific statistics, computed only for the columns of that kind
+    kind_stats = calculate_numeric_statistics(df, numeric_columns)
+    kind_stats.update(calculate_string_statistics(df, string_columns))
+    
+    return counts, missing_counts, unique_counts, kind_stats
+
+def calculate_column_tables_parallel(df: pd.DataFrame, numeric_columns: List[Any], string_columns: List[Any],
+                                     n_jobs: int = -1) -> Tuple[pd.Series, pd.Series, pd.Series, Dict[Any, Dict[str, Any]]]:
+    """
+    Calculate the per-column statistics tables of a quality report in worker processes.
+    
+    The columns are split into one group per worker and each group is sent as
+    its own sub-frame, so workers never receive the whole DataFrame.
+    
+    Args:
+        df (pd.DataFrame): DataFrame to analyze.
+        numeric_columns (List): Columns to compute numeric statistics for.
+        string_columns (List): Columns to compute string statistics for.
+        n_jobs (int): Number of worker processes (-1 for all CPUs).
+        
+    Returns:
+        Tuple: Same tables as calculate_column_tables.
+    """
+    max_workers = n_jobs if n_jobs > 0 else (os.cpu_count() or 1)
+    group_size = max(1, math.ceil(len(df.columns) / max_workers))
+    numeric_set = set(numeric_columns)
+    string_set = set(string_columns)
+    
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = []
+        for start in range(0, len(df.columns), group_size):
+            group = df.iloc[:, start:start + group_size]
+            futures.append(executor.submit(
+                calculate_column_tables,
+                group,
+                [col for col in group.columns if col in numeric_set],
+                [col for col in group.columns if col in string_set]
+            ))
+        results = [future.result() for future in futures]
+    
+    kind_stats = {}
+    for result in results:
+        kind_stats.update(result[3])
+    return (
+        pd.concat([result[0] for result in results]),
+        pd.concat([result[1] for result in results]),
+        pd.concat([result[2] for result in results]),
+        kind_stats
+    )
+
+def categorize_string_columns(df: pd.DataFrame, columns: List[Any], max_unique_ratio: float = 0.5) -> pd.DataFrame:
+    """
+    Convert low-cardinality string columns to categoricals.
+    
+    Each column is factorized once, and the codes are reused to build the
+    categorical when the column has few enough distinct values. None and NaN
+    both become missing values.
+    
+    Args:
+        df (pd.DataFrame): DataFrame containing the columns. It is not modified.
+        columns (List[Any]): Columns to consider.
+        max_unique_ratio (float): Maximum ratio of distinct values to rows for a column to be converted.
+        
+    Returns:
+        pd.DataFrame: DataFrame with the converted columns, or df itself if none were converted.
+    """
+    result = df
+    for column in columns:
+        codes, uniques = pd.factorize(df[column])
+        if len(uniques) < max_unique_ratio * len(df):
+            if result is df:
+                result = df.copy(deep=False)
+            result[column] = pd.Categorical.from_codes(codes, uniques)
+    return result
+
+def count_duplicate_rows(df: pd.DataFrame) -> int:
+    """
+    Count the rows that repeat an earlier row.
+    
+    Frames without object columns are deduplicated on one 64-bit hash per
+    row, which is faster than comparing rows column by column. Object columns
+    are hashed through their string form, so 1 and "1" would collide; frames
+    with them use DataFrame.duplicated.
+    
+    Args:
+        df (pd.DataFrame): DataFrame to check.
+        
+    Returns:
+        int: Number of duplicate rows.
+    """
+    if len(df.columns) == 0 or any(dtype.kind == "O" for dtype in df.dtypes):
+        duplicated = df.duplicated()
+    else:
+        duplicated = pd.util.hash_pandas_object(df, index=False).duplicated()
+    
+    # Sum the boolean mask directly rather than through a Series reduction
+    return int(duplicated.to_numpy().sum())
+
+def calculate_numeric_statistics(df: pd.DataFrame, columns: List[Any]) -> Dict[Any, Dict[str, Any]]:
+    """
+    Calculate summary statistics of numeric columns with one reduction per statistic.
+    
+    Columns are reduced together in groups of the same dtype, so minimum and
+    maximum keep the column's type instead of being upcast to a common one.
+    
+    Args:
+        df (pd.DataFrame): DataFrame containing the columns.
+        columns (List[Any]): Numeric columns to summarize.
+        
+    Returns:
+        Dict[Any, Dict[str, Any]]: Statistics by column.
+    """
+    columns_by_dtype: Dict[Any, List[Any]] = {}
+    for column in columns:
+        columns_by_dtype.setdefault(df[column].dtype, []).append(column)
+    
+    stats = {column: {} for column in columns}
+    for dtype_columns in columns_by_dtype.values():
+        group = df[dtype_columns]
+        for name, values in (
+            ("min", group.min()),
+            ("max", group.max()),
+            ("mean", group.mean()),
+            ("median", group.median()),
+            ("std", group.std()),
+            ("variance", group.var())
+        ):
+            for column, value in values.items():
+                stats[column][name] = value
+    
+    return stats
+
+def calculate_string_statistics(df: pd.DataFrame, columns: List[Any]) -> Dict[Any, Dict[str, Any]]:
+    """
+    Calculate string length statistics of string columns.
+    
+    With pyarrow installed, lengths are computed on an Arrow array, which
+    avoids boxing every length of an object column as a Python int.
+    
+    Args:
+        df (pd.DataFrame): DataFrame containing the columns.
+        columns (List[Any]): String columns to summarize.
+        
+    Returns:
+        Dict[Any, Dict[str, Any]]: Statistics by column.
+    """
+    stats = {}
+    for column in columns:
+        column_stats = _arrow_string_statistics(df[column]) if pa is not None else None
+        if column_stats is None:
+            lengths = df[column].str.len()
+            column_stats = {
+                "min_length": lengths.min(),
+                "max_length": lengths.max(),
+                "mean_length": lengths.mean()
+            }
+        stats[column] = column_stats
+    return stats
+
+def _arrow_string_statistics(series: pd.Series) -> Optional[Dict[str, Any]]:
+    """
+    Calculate string length statistics of a column with Arrow compute functions.
+    
+    Args:
+        series (pd.Series): String column.
+        
+    Returns:
+        Optional[Dict[str, Any]]: Statistics, NaN for a column without strings, or None
+        if the column cannot be converted to an Arrow string array.
+    """
+    try:
+        array = pa.array(series, from_pandas=True)
+    except (pa.ArrowException, TypeError, ValueError):
+        return None
+    if not (pa.types.is_string(array.type) or pa.types.is_large_string(array.type)):
+        return None
+    
+    lengths = pc.utf8_length(array)
+    min_max = pc.min_max(lengths)
+    mean = pc.mean(lengths).as_py()
+    return {
+        "min_length": _nan_if_none(min_max["min"].as_py()),
+        "max_length": _nan_if_none(min_max["max"].as_py()),
+        "mean_length": _nan_if_none(mean)
+    }
+
+def _nan_if_none(value: Any) -> Any:
+    """
+    Replace a missing Arrow aggregate with NaN, as pandas reports it.
+    
+    Args:
+        value (Any): Aggregate value.
+        
+    Returns:
+        Any: The value, or NaN if it is None.
+    """
+    return float("nan") if value is None else value
+
 def calculate_cleaning_statistics(original_data: Any, cleaned_data: Any) -> Dict[str, Any]:
     """
     Calculate statistics for data cleaning operations.
@@ -304,11 +675,43 @@ def calculate_cleaning_statistics(original_data: Any, cleaned_data: Any) -> Dict
     # Handle pandas DataFrames
     if isinstance(original_data, pd.DataFrame) and isinstance(cleaned_data, pd.DataFrame):
         stats["rows_removed"] = len(original_data) - len(cleaned_data)
-        stats["columns_modified"] = sum(1 for col in original_data.columns if not original_data[col].equals(cleaned_data[col]))
-        stats["total_changes"] = original_data.ne(cleaned_data).sum().sum()
+        
+        # Compare each column once, deriving both its modified flag and its change count
+        columns_modified = 0
+        total_changes = 0
+        for column in original_data.columns:
+            original_column = original_data[column]
+            cleaned_column = cleaned_data[column]
+            changes = _count_changes(original_column, cleaned_column)
+            columns_modified += changes > 0 or original_column.dtype != cleaned_column.dtype
+            total_changes += changes
+        stats["columns_modified"] = columns_modified
+        stats["total_changes"] = total_changes
     
     return stats
 
+def _count_changes(original: pd.Series, cleaned: pd.Series) -> int:
+    """
+    Count the values that differ between two aligned columns.
+    
+    Values missing in both columns are not counted as changes.
+    
+    Args:
+        original (pd.Series): Column before cleaning.
+        cleaned (pd.Series): Column after cleaning.
+        
+    Returns:
+        int: Number of changed values.
+    """
+    changed = original.ne(cleaned)
+    if not changed.any():
+        return 0
+    
+    both_missing = original.isna() & cleaned.isna()
+    if both_missing.any():
+        changed &= ~both_missing
+    return int(changed.sum())
+
 def calculate_transformation_statistics(original_data: Any, transformed_data: Any) -> Dict[str, Any]:
     """
     Calculate statistics for data transformation operations.
@@ -396,49 +799,108 @@ def calculate_quality_score(results: Dict[str, Any]) -> float:
     # Ensure score is between 0 and 100
     return max(0.0, min(100.0, score))
 
-def get_data_size(data: Any) -> int:
+def calculate_quality_scores_batch(missing_percentages: Any, duplicate_percentages: Any) -> np.ndarray:
+    """
+    Calculate quality scores for many reports at once.
+    
+    Applies the same formula as calculate_quality_score element-wise.
+    
+    Args:
+        missing_percentages (array-like): Total missing value percentage per report.
+        duplicate_percentages (array-like): Duplicate row percentage per report.
+        
+    Returns:
+        np.ndarray: Quality scores (0-100).
+    """
+    missing = np.asarray(missing_percentages, dtype=np.float64)
+    duplicates = np.asarray(duplicate_percentages, dtype=np.float64)
+    return np.clip(100.0 - missing - duplicates * 0.5, 0.0, 100.0)
+
+@functools.singledispatch
+def get_data_size(data: Any, size_mode: str = "bytes") -> int:
     """
     Get the size of the data.
     
+    pandas objects are measured in bytes by default, counting the index and
+    the contents of object columns; size_mode="cells" returns the number of
+    values instead. Other containers and strings are measured by length.
+    Support for other types can be added with get_data_size.register.
+    
     Args:
         data (Any): Data to get size for.
+        size_mode (str): "bytes" or "cells", used for pandas objects.
         
     Returns:
-        int: Size of the data.
+        int: Size of the data, 0 for unsupported types.
+        
+    Raises:
+        ValueError: If the size mode of a pandas object is not supported.
     """
-    if isinstance(data, (list, tuple, set)):
-        return len(data)
-    elif isinstance(data, dict):
-        return len(data)
-    elif isinstance(data, str):
-        return len(data)
-    elif isinstance(data, pd.DataFrame):
+    return 0
+
+@get_data_size.register(list)
+@get_data_size.register(tuple)
+@get_data_size.register(set)
+@get_data_size.register(dict)
+@get_data_size.register(str)
+def _get_sized_data_size(data: Any, size_mode: str = "bytes") -> int:
+    """Get the length of a container or string."""
+    return len(data)
+
+@get_data_size.register(pd.DataFrame)
+def _get_dataframe_size(data: pd.DataFrame, size_mode: str = "bytes") -> int:
+    """Get the size of a DataFrame in bytes or cells."""
+    if size_mode == "bytes":
+        return int(data.memory_usage(deep=True, index=True).sum())
+    if size_mode == "cells":
         return data.size
-    elif isinstance(data, pd.Series):
+    raise ValueError(f"Unsupported size mode: {size_mode}")
+
+@get_data_size.register(pd.Series)
+def _get_series_size(data: pd.Series, size_mode: str = "bytes") -> int:
+    """Get the size of a Series in bytes or values."""
+    if size_mode == "bytes":
+        return int(data.memory_usage(deep=True, index=True))
+    if size_mode == "cells":
         return len(data)
-    else:
-        return 0
+    raise ValueError(f"Unsupported size mode: {size_mode}")
 
+@functools.singledispatch
 def count_missing_values(data: Any) -> int:
     """
     Count missing values in the data.
     
+    Support for other types can be added with count_missing_values.register.
+    
     Args:
         data (Any): Data to count missing values for.
         
     Returns:
-        int: Number of missing values.
+        int: Number of missing values, 0 for unsupported types.
     """
-    if isinstance(data, pd.DataFrame):
-        return data.isna().sum().sum()
-    elif isinstance(data, pd.Series):
-        return data.isna().sum()
-    elif isinstance(data, (list, tuple)):
-        return sum(1 for x in data if x is None or pd.isna(x))
-    elif isinstance(data, dict):
-        return sum(1 for x in data.values() if x is None or pd.isna(x))
-    else:
-        return 0
+    return 0
+
+@count_missing_values.register(pd.DataFrame)
+def _count_dataframe_missing_values(data: pd.DataFrame) -> int:
+    """Count missing values in a DataFrame."""
+    return data.isna().sum().sum()
+
+@count_missing_values.register(pd.Series)
+def _count_series_missing_values(data: pd.Series) -> int:
+    """Count missing values in a Series."""
+    return data.isna().sum()
+
+@count_missing_values.register(list)
+@count_missing_values.register(tuple)
+def _count_sequence_missing_values(data: Any) -> int:
+    """Count missing values in a list or tuple."""
+    # Check all values at once through an object Series, which keeps nested sequences as single values
+    return int(pd.Series(data, dtype=object).isna().sum())
+
+@count_missing_values.register(dict)
+def _count_dict_missing_values(data: Dict[Any, Any]) -> int:
+    """Count missing values among the values of a dict."""
+    return int(pd.Series(list(data.values()), dtype=object).isna().sum())
 
 def get_most_common_operations(results: Dict[str, Any]) -> List[str]:
     """
@@ -455,15 +917,9 @@ def get_most_common_operations(results: Dict[str, Any]) -> List[str]:
     if not operations:
         return []
     
-    # Count operation frequencies
-    operation_counts = {}
-    for op in operations:
-        op_name = op.get("name", "unknown")
-        operation_counts[op_name] = operation_counts.get(op_name, 0) + 1
-    
-    # Sort by frequency
-    sorted_operations = sorted(operation_counts.items(), key=lambda x: x[1], reverse=True)
-    return [op[0] for op in sorted_operations[:5]]
+    # Count operation frequencies and keep the top five
+    operation_counts = Counter(op.get("name", "unknown") for op in operations)
+    return [op[0] for op in operation_counts.most_common(5)]
 
 def get_most_complete_columns(column_stats: Dict[str, Any], top_n: int = 5) -> List[str]:
     """
@@ -476,9 +932,10 @@ def get_most_complete_columns(column_stats: Dict[str, Any], top_n: int = 5) -> L
     Returns:
         List[str]: Most complete columns.
     """
-    # Sort columns by missing percentage
-    sorted_columns = sorted(column_stats.items(), key=lambda x: x[1]["missing_percentage"])
-    return [col[0] for col in sorted_columns[:top_n]]
+    # Select the lowest missing percentages without sorting every column
+    missing = [(col, stats["missing_percentage"]) for col, stats in column_stats.items()]
+    top_columns = heapq.nsmallest(top_n, missing, key=lambda x: x[1])
+    return [col[0] for col in top_columns]
 
 def get_most_incomplete_columns(column_stats: Dict[str, Any], top_n: int = 5) -> List[str]:
     """
@@ -491,9 +948,10 @@ def get_most_incomplete_columns(column_stats: Dict[str, Any], top_n: int = 5) ->
     Returns:
         List[str]: Most incomplete columns.
     """
-    # Sort columns by missing percentage (descending)
-    sorted_columns = sorted(column_stats.items(), key=lambda x: x[1]["missing_percentage"], reverse=True)
-    return [col[0] for col in sorted_columns[:top_n]]
+    # Select the highest missing percentages without sorting every column
+    missing = [(col, stats["missing_percentage"]) for col, stats in column_stats.items()]
+    top_columns = heapq.nlargest(top_n, missing, key=lambda x: x[1])
+    return [col[0] for col in top_columns]
 
 def get_most_duplicated_columns(df: pd.DataFrame, top_n: int = 5) -> List[str]:
     """
@@ -506,15 +964,12 @@ def get_most_duplicated_columns(df: pd.DataFrame, top_n: int = 5) -> List[str]:
     Returns:
         List[str]: Most duplicated columns.
     """
-    duplicate_counts = {}
+    # Values after the first occurrence of each distinct value, missing values included
+    duplicate_counts = len(df) - df.nunique(dropna=False)
     
-    for column in df.columns:
-        duplicate_count = df[column].duplicated().sum()
-        duplicate_counts[column] = duplicate_count
-    
-    # Sort by duplicate count (descending)
-    sorted_columns = sorted(duplicate_counts.items(), key=lambda x: x[1], reverse=True)
-    return [col[0] for col in sorted_columns[:top_n]]
+    # Select the highest duplicate counts without sorting every column
+    top_columns = heapq.nlargest(top_n, duplicate_counts.items(), key=lambda x: x[1])
+    return [col[0] for col in top_columns]
 
 def get_most_common_errors(results: Dict[str, Any]) -> List[str]:
     """
@@ -531,15 +986,9 @@ def get_most_common_errors(results: Dict[str, Any]) -> List[str]:
     if not errors:
         return []
     
-    # Count error frequencies
-    error_counts = {}
-    for error in errors:
-        error_msg = error.get("message", "unknown")
-        error_counts[error_msg] = error_counts.get(error_msg, 0) + 1
-    
-    # Sort by frequency
-    sorted_errors = sorted(error_counts.items(), key=lambda x: x[1], reverse=True)
-    return [err[0] for err in sorted_errors[:5]]
+    # Count error frequencies and keep the top five
+    error_counts = Counter(error.get("message", "unknown") for error in errors)
+    return [err[0] for err in error_counts.most_common(5)]
 
 def export_report(report: Dict[str, Any], file_path: str, format: str = "json", **kwargs) -> None:
     """
@@ -549,11 +998,26 @@ def export_report(report: Dict[str, Any], file_path: str, format: str = "json",
         report (Dict): Report to export.
         file_path (str): File path to export to.
         format (str): Export format (json, csv, html).
-        **kwargs: Additional export parameters.
+        **kwargs: Additional export parameters. For JSON, indent sets the
+            indentation (default 4); orjson writes the file when it is
+            installed, indent is None or 2 and the report holds no NaN or
+            infinity, which orjson would write as null.
     """
     if format == "json":
+        indent = kwargs.get("indent", 4)
+        if orjson is not None and indent in (None, 2) and not _has_non_finite(report):
+            option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+            try:
+                content = orjson.dumps(report, default=str, option=option)
+            except orjson.JSONEncodeError:
+                content = None
+            if content is not None:
+                with open(file_path, "wb") as f:
+                    f.write(content)
+                return
+        
         with open(file_path, "w") as f:
-            json.dump(report, f, indent=4, default=str)
+            json.dump(report, f, indent=indent, default=str)
     
     elif format == "csv" and "columns_statistics" in report.get("results", {}):
         # Export column statistics as CSV
@@ -577,7 +1041,7 @@ def generate_html_report(report: Dict[str, Any]) -> str:
     Returns:
         str: HTML representation of the report.
     """
-    html = f"""
+    parts = [f"""
     <!DOCTYPE html>
     <html>
     <head>
@@ -598,21 +1062,30 @@ def generate_html_report(report: Dict[str, Any]) -> str:
             <h1>{report['report_type'].title()} Report</h1>
             <p>Generated at: {report['generated_at']}</p>
         </div>
-    """
+    """]
     
     # Add summary section
     if "summary" in report:
-        html += f"""
+        parts.append("""
         <div class="report-section">
             <div class="section-title">Summary</div>
-        """
+        """)
         for key, value in report['summary'].items():
             if isinstance(value, list):
-                value_str = ", ".join(value)
+                value_str = ", ".join(map(str, value))
             else:
                 value_str = str(value)
-            html += f"<div class='summary-item'><strong>{key}:</strong> {value_str}</div>"
-        html += "</div>"
+            # Escape keys and values, which can hold user strings such as column names
+            parts.append(f"<div class='summary-item'><strong>{html.escape(str(key))}:</strong> {html.escape(value_str)}</div>")
+        parts.append("</div>")
     
-    html += "</body></html>"
-    return html
+    parts.append("</body></html>")
+    return "".join(parts)
+
+# Report generators by report type
+_REPORT_GENERATORS = {
+    "cleaning": generate_cleaning_report,
+    "transformation": generate_transformation_report,
+    "quality": generate_quality_report,
+    "validation": generate_validation_report
+}
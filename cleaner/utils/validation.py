@@ -3,10 +3,69 @@
 Functions for validating data quality and formats.
 """
 
+import functools
+import math
+import os
 import re
-from typing import Any, Dict, List, Optional, Union
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from datetime import datetime
 
+import numpy as np
+
+# Default email and URL patterns, compiled once. The URL path is a single character class
+# rather than a repeated group, which backtracks exponentially on paths that fail to match
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+_URL_RE = re.compile(r"^(https?:\/\/)?([\da-z.-]+)\.([a-z.]{2,6})[\/\w .-]*$")
+
+# Minimum list length before numeric items are validated with NumPy
+VECTORIZE_MIN_ITEMS = 1000
+
+# Integers below this magnitude compare exactly as float64
+_FLOAT_EXACT_INT_LIMIT = 2 ** 53
+
+# Range of integers that int64 arrays and bounds can hold
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+# Minimum list length before items are validated in worker processes when n_jobs is not 1
+PARALLEL_VALIDATION_THRESHOLD = 10000
+
+# A compiled check returns the errors, warnings and validated data for one value
+_Check = Callable[[Any], Tuple[List[str], List[str], Any]]
+
+@functools.lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """
+    Compile a schema pattern, reusing the compiled form for repeated patterns.
+    
+    Args:
+        pattern (str): Regular expression pattern.
+        
+    Returns:
+        re.Pattern: Compiled pattern.
+    """
+    return re.compile(pattern)
+
+@functools.lru_cache(maxsize=4096)
+def _parse_datetime(value: str, date_format: Optional[str] = None) -> Optional[datetime]:
+    """
+    Parse a datetime string, caching the results for repeated strings.
+    
+    Args:
+        value (str): String to parse.
+        date_format (str, optional): strptime format; ISO 8601 if None.
+        
+    Returns:
+        Optional[datetime]: Parsed datetime, or None if the string does not match.
+    """
+    try:
+        if date_format:
+            return datetime.strptime(value, date_format)
+        return datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        return None
+
 def validate_data(data: Any, schema: Optional[Dict] = None, **kwargs) -> Dict[str, Any]:
     """
     Validate data against a schema.
@@ -36,38 +95,32 @@ def validate_data(data: Any, schema: Optional[Dict] = None, **kwargs) -> Dict[st
     
     # Perform schema-based validation
     validation_type = schema.get("type", "")
-    
-    if validation_type == "string":
-        return validate_string(data, schema, results, **kwargs)
-        
-    elif validation_type == "number":
-        return validate_number(data, schema, results, **kwargs)
-        
-    elif validation_type == "integer":
-        return validate_integer(data, schema, results, **kwargs)
-        
-    elif validation_type == "boolean":
-        return validate_boolean(data, schema, results, **kwargs)
-        
-    elif validation_type == "datetime":
-        return validate_datetime(data, schema, results, **kwargs)
-        
-    elif validation_type == "list":
-        return validate_list(data, schema, results, **kwargs)
-        
-    elif validation_type == "dict":
-        return validate_dict(data, schema, results, **kwargs)
-        
-    elif validation_type == "email":
-        return validate_email(data, schema, results, **kwargs)
-        
-    elif validation_type == "url":
-        return validate_url(data, schema, results, **kwargs)
-        
-    else:
+    validator = _VALIDATORS.get(validation_type)
+    if validator is None:
         results["errors"].append(f"Unsupported validation type: {validation_type}")
         results["valid"] = False
         return results
+    
+    return validator(data, schema, results, **kwargs)
+
+def register_validator(validation_type: str, validator: Callable[..., Dict[str, Any]]) -> None:
+    """
+    Register a validator for a custom schema type.
+    
+    The validator is called as validator(data, schema, results, **kwargs) and
+    must return the updated results dictionary, like the built-in validate_*
+    functions.
+    
+    Args:
+        validation_type (str): Schema type name.
+        validator (Callable): Validator function.
+        
+    Raises:
+        ValueError: If the type is a built-in validation type.
+    """
+    if validation_type in _CHECK_COMPILERS:
+        raise ValueError(f"Cannot override built-in validation type: {validation_type}")
+    _VALIDATORS[validation_type] = validator
 
 def validate_basic(data: Any, results: Dict[str, Any], **kwargs) -> Dict[str, Any]:
     """
@@ -130,7 +183,7 @@ def validate_string(data: Any, schema: Dict, results: Dict[str, Any], **kwargs)
     # Pattern validation
     pattern = schema.get("pattern", None)
     if pattern:
-        if not re.match(pattern, data):
+        if not _compile_pattern(pattern).match(data):
             results["errors"].append(f"String must match pattern: {pattern}")
             results["valid"] = False
     
@@ -242,16 +295,12 @@ def validate_datetime(data: Any, schema: Dict, results: Dict[str, Any], **kwargs
     """
     # Parse string to datetime if needed
     if isinstance(data, str):
-        date_format = schema.get("format", None)
-        try:
-            if date_format:
-                data = datetime.strptime(data, date_format)
-            else:
-                data = datetime.fromisoformat(data)
-        except (ValueError, TypeError):
+        parsed = _parse_datetime(data, schema.get("format", None))
+        if parsed is None:
             results["errors"].append(f"Invalid datetime format: {data}")
             results["valid"] = False
             return results
+        data = parsed
     elif not isinstance(data, datetime):
         results["errors"].append(f"Expected datetime object or string, got {type(data).__name__}")
         results["valid"] = False
@@ -280,7 +329,9 @@ def validate_list(data: Any, schema: Dict, results: Dict[str, Any], **kwargs) ->
         data (Any): Data to validate.
         schema (Dict): Validation schema.
         results (Dict): Results dictionary to update.
-        **kwargs: Additional validation parameters.
+        **kwargs: Additional validation parameters. With n_jobs other than 1
+            (-1 for all CPUs), items of lists longer than parallel_threshold
+            are validated in worker processes.
         
     Returns:
         Dict[str, Any]: Updated results dictionary.
@@ -302,21 +353,187 @@ def validate_list(data: Any, schema: Dict, results: Dict[str, Any], **kwargs) ->
         results["errors"].append(f"List must contain at most {max_items} items")
         results["valid"] = False
     
-    # Item validation
+    # Item validation, with the item schema compiled once for all items
     item_schema = schema.get("items", None)
     if item_schema:
-        validated_items = []
-        for i, item in enumerate(data):
-            item_result = validate_data(item, item_schema, **kwargs)
-            if not item_result["valid"]:
-                for error in item_result["errors"]:
-                    results["errors"].append(f"Item {i}: {error}")
-                results["valid"] = False
-            validated_items.append(item_result["validated_data"])
-        results["validated_data"] = validated_items
+        item_errors, results["validated_data"] = _validate_items(data, item_schema, None, kwargs)
+        if item_errors:
+            results["errors"].extend(item_errors)
+            results["valid"] = False
     
     return results
 
+def _validate_items(data: List[Any], item_schema: Dict, item_check: Optional[_Check],
+                    kwargs: Dict[str, Any]) -> Tuple[List[str], List[Any]]:
+    """
+    Validate the items of a list against an item schema.
+    
+    Long lists of numbers are checked with NumPy. Other lists are split across
+    worker processes when n_jobs is not 1 and the list is longer than
+    parallel_threshold, and checked in this process otherwise.
+    
+    Args:
+        data (List[Any]): List to validate.
+        item_schema (Dict): Schema of the items.
+        item_check (_Check, optional): Compiled item check, compiled here if None.
+        kwargs (Dict): Additional validation parameters.
+        
+    Returns:
+        Tuple[List[str], List[Any]]: Item errors and validated items.
+    """
+    number_errors = _number_item_errors(data, item_schema)
+    if number_errors is not None:
+        return number_errors, list(data)
+    
+    n_jobs = kwargs.get("n_jobs", 1)
+    if n_jobs != 1 and len(data) > kwargs.get("parallel_threshold", PARALLEL_VALIDATION_THRESHOLD):
+        return _check_items_parallel(data, item_schema, kwargs, n_jobs)
+    
+    if item_check is None:
+        item_check = _compile_check(item_schema, kwargs)
+    return _check_items(data, item_check)
+
+def _check_items(items: List[Any], item_check: _Check, offset: int = 0) -> Tuple[List[str], List[Any]]:
+    """
+    Run a compiled item check over a list of items.
+    
+    Args:
+        items (List[Any]): Items to check.
+        item_check (_Check): Compiled item check.
+        offset (int): Index of the first item in the full list, used in error messages.
+        
+    Returns:
+        Tuple[List[str], List[Any]]: Item errors and validated items.
+    """
+    errors = []
+    append_error = errors.append
+    validated_items = []
+    append_item = validated_items.append
+    for i, item in enumerate(items, offset):
+        item_errors, _, validated_item = item_check(item)
+        for error in item_errors:
+            append_error(f"Item {i}: {error}")
+        append_item(validated_item)
+    return errors, validated_items
+
+def _check_items_chunk(items: List[Any], item_schema: Dict, kwargs: Dict[str, Any],
+                       offset: int) -> Tuple[List[str], List[Any]]:
+    """
+    Check one chunk of a list in a worker process.
+    
+    Compiled checks are closures and cannot be pickled, so each worker
+    compiles the item schema itself.
+    
+    Args:
+        items (List[Any]): Chunk of items to check.
+        item_schema (Dict): Schema of the items.
+        kwargs (Dict): Additional validation parameters.
+        offset (int): Index of the first item in the full list.
+        
+    Returns:
+        Tuple[List[str], List[Any]]: Item errors and validated items of the chunk.
+    """
+    return _check_items(items, _compile_check(item_schema, kwargs), offset)
+
+def _check_items_parallel(data: List[Any], item_schema: Dict, kwargs: Dict[str, Any],
+                          n_jobs: int) -> Tuple[List[str], List[Any]]:
+    """
+    Check the items of a list in chunks across worker processes.
+    
+    Args:
+        data (List[Any]): List to validate.
+        item_schema (Dict): Schema of the items.
+        kwargs (Dict): Additional validation parameters.
+        n_jobs (int): Number of worker processes (-1 for all CPUs).
+        
+    Returns:
+        Tuple[List[str], List[Any]]: Item errors and validated items, in list order.
+    """
+    max_workers = n_jobs if n_jobs > 0 else (os.cpu_count() or 1)
+    chunk_size = max(1, math.ceil(len(data) / max_workers))
+    
+    # Workers validate nested lists in-process
+    worker_kwargs = {**kwargs, "n_jobs": 1}
+    
+    errors = []
+    validated_items = []
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_check_items_chunk, data[start:start + chunk_size], item_schema, worker_kwargs, start)
+            for start in range(0, len(data), chunk_size)
+        ]
+        for future in futures:
+            chunk_errors, chunk_items = future.result()
+            errors.extend(chunk_errors)
+            validated_items.extend(chunk_items)
+    return errors, validated_items
+
+def _number_item_errors(data: List[Any], item_schema: Dict) -> Optional[List[str]]:
+    """
+    Validate the items of a long list of numbers with NumPy.
+    
+    The range and multiple checks run as array comparisons, and only failing
+    items are visited to format their errors.
+    
+    Args:
+        data (List[Any]): List to validate.
+        item_schema (Dict): Schema of the items.
+        
+    Returns:
+        Optional[List[str]]: Item errors, as validate_list reports them, or None if the
+        list is short, the schema is not numeric or the items do not form a numeric array.
+    """
+    validation_type = item_schema.get("type")
+    if validation_type not in ("number", "integer") or len(data) < VECTORIZE_MIN_ITEMS:
+        return None
+    
+    minimum = item_schema.get("minimum", None)
+    maximum = item_schema.get("maximum", None)
+    multiple_of = item_schema.get("multiple_of", None)
+    if multiple_of == 0:
+        return None
+    
+    # Lists of ints and bools become int64 arrays; a float makes a float64 array, which an
+    # integer schema rejects item by item. Strings, None and huge ints give other dtypes
+    try:
+        values = np.asarray(data)
+    except (TypeError, ValueError):
+        return None
+    if values.ndim != 1 or not (values.dtype.kind == "i" or (values.dtype.kind == "f" and validation_type == "number")):
+        return None
+    
+    # int64 items checked against int64 bounds compare exactly. Anything else is compared
+    # in float64, which is only exact when every item is below 2**53; a float array may
+    # hold ints rounded on conversion, so larger items are validated one at a time
+    bounds = [bound for bound in (minimum, maximum, multiple_of) if bound is not None]
+    if values.dtype.kind != "i" or not all(type(bound) is int and _INT64_MIN <= bound <= _INT64_MAX for bound in bounds):
+        with np.errstate(invalid="ignore"):
+            if not ((values > -_FLOAT_EXACT_INT_LIMIT) & (values < _FLOAT_EXACT_INT_LIMIT)).all():
+                return None
+        values = values.astype(np.float64, copy=False)
+    
+    checks = []
+    if minimum is not None:
+        checks.append((values < minimum, f"Number must be at least {minimum}"))
+    if maximum is not None:
+        checks.append((values > maximum, f"Number must be at most {maximum}"))
+    if multiple_of is not None:
+        with np.errstate(invalid="ignore"):
+            checks.append((values % multiple_of != 0, f"Number must be a multiple of {multiple_of}"))
+    if not checks:
+        return []
+    
+    failed = checks[0][0].copy()
+    for mask, _ in checks[1:]:
+        failed |= mask
+    
+    errors = []
+    for i in np.flatnonzero(failed).tolist():
+        for mask, error in checks:
+            if mask[i]:
+                errors.append(f"Item {i}: {error}")
+    return errors
+
 def validate_dict(data: Any, schema: Dict, results: Dict[str, Any], **kwargs) -> Dict[str, Any]:
     """
     Validate dictionary data.
@@ -389,12 +606,10 @@ def validate_email(email: str, schema: Optional[Dict] = None, results: Optional[
         return results
     
     # Email regex pattern
-    email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-    
-    if schema and "pattern" in schema:
-        email_pattern = schema["pattern"]
+    email_re = _compile_pattern(schema["pattern"]) if schema and "pattern" in schema else _EMAIL_RE
     
-    if not re.match(email_pattern, email):
+    # The default pattern needs an "@", so addresses without one skip the regex
+    if (email_re is _EMAIL_RE and "@" not in email) or not email_re.match(email):
         results["errors"].append(f"Invalid email format: {email}")
         results["valid"] = False
     
@@ -433,17 +648,283 @@ def validate_url(url: str, schema: Optional[Dict] = None, results: Optional[Dict
         return results
     
     # URL regex pattern (simplified)
-    url_pattern = r"^(https?:\/\/)?([\da-z.-]+)\.([a-z.]{2,6})([\/\w .-]*)*\/?$"
+    url_re = _compile_pattern(schema["pattern"]) if schema and "pattern" in schema else _URL_RE
     
-    if schema and "pattern" in schema:
-        url_pattern = schema["pattern"]
-    
-    if not re.match(url_pattern, url):
+    # The default pattern needs a ".", so URLs without one skip the regex
+    if (url_re is _URL_RE and "." not in url) or not url_re.match(url):
         results["errors"].append(f"Invalid URL format: {url}")
         results["valid"] = False
     
     return results
 
+def compile_schema(schema: Optional[Dict] = None, valid_only: bool = False,
+                   **kwargs) -> Callable[[Any], Union[Dict[str, Any], bool]]:
+    """
+    Compile a schema into a validator function.
+    
+    The schema is read once: its type, bounds, patterns and nested schemas are
+    bound into closures, so validating many values skips the dispatch and
+    schema lookups validate_data repeats on every call. The schema must not be
+    modified after compiling.
+    
+    Args:
+        schema (Dict, optional): Validation schema.
+        valid_only (bool): Whether the validator only returns whether a value is
+            valid, without building a results dictionary.
+        **kwargs: Additional validation parameters, as for validate_data.
+        
+    Returns:
+        Callable[[Any], Union[Dict[str, Any], bool]]: Function validating one value and
+        returning the same results as validate_data(value, schema, **kwargs), or
+        only results["valid"] if valid_only is True.
+    """
+    check = _compile_check(schema, kwargs)
+    
+    if valid_only:
+        return lambda data: not check(data)[0]
+    
+    def validate(data: Any) -> Dict[str, Any]:
+        errors, warnings, validated_data = check(data)
+        return {
+            "valid": not errors,
+            "errors": errors,
+            "warnings": warnings,
+            "validated_data": validated_data
+        }
+    
+    return validate
+
+def _compile_check(schema: Optional[Dict], kwargs: Dict[str, Any]) -> _Check:
+    """
+    Compile a schema into a check function.
+    
+    Args:
+        schema (Dict, optional): Validation schema.
+        kwargs (Dict): Additional validation parameters.
+        
+    Returns:
+        _Check: Check function for the schema.
+    """
+    if not schema:
+        return _compile_basic_check(kwargs)
+    
+    validation_type = schema.get("type", "")
+    compiler = _CHECK_COMPILERS.get(validation_type)
+    if compiler is None and validation_type in _VALIDATORS:
+        return _compile_registered_check(validation_type, schema, kwargs)
+    if compiler is None:
+        error = f"Unsupported validation type: {validation_type}"
+        return lambda data: ([error], [], data)
+    return compiler(schema, kwargs)
+
+def _compile_registered_check(validation_type: str, schema: Dict, kwargs: Dict[str, Any]) -> _Check:
+    """Wrap a validator registered with register_validator as a check."""
+    validator = _VALIDATORS[validation_type]
+    
+    def check(data: Any) -> Tuple[List[str], List[str], Any]:
+        results = validator(data, schema, {"valid": True, "errors": [], "warnings": [], "validated_data": data}, **kwargs)
+        return results["errors"], results["warnings"], results["validated_data"]
+    
+    return check
+
+def _compile_basic_check(kwargs: Dict[str, Any]) -> _Check:
+    """Compile the checks of validate_basic."""
+    allow_null = kwargs.get("allow_null", False)
+    allow_empty = kwargs.get("allow_empty", False)
+    
+    def check(data: Any) -> Tuple[List[str], List[str], Any]:
+        errors = []
+        if data is None:
+            if not allow_null:
+                errors.append("Value cannot be None")
+        elif hasattr(data, "__iter__") and not isinstance(data, (str, bytes)):
+            if len(data) == 0 and not allow_empty:
+                errors.append("Collection cannot be empty")
+        return errors, [], data
+    
+    return check
+
+def _compile_string_check(schema: Dict, kwargs: Dict[str, Any]) -> _Check:
+    """Compile the checks of validate_string."""
+    min_length = schema.get("min_length", 0)
+    max_length = schema.get("max_length", None)
+    pattern = schema.get("pattern", None)
+    pattern_re = _compile_pattern(pattern) if pattern else None
+    choices = schema.get("choices", None)
+    case = schema.get("case", None)
+    
+    # Look choices up in a hash set instead of scanning the list
+    try:
+        choice_set = frozenset(choices) if choices else None
+    except TypeError:
+        choice_set = choices
+    
+    def check(data: Any) -> Tuple[List[str], List[str], Any]:
+        if not isinstance(data, str):
+            return [f"Expected string, got {type(data).__name__}"], [], data
+        
+        errors = []
+        warnings = []
+        if len(data) < min_length:
+            errors.append(f"String must be at least {min_length} characters long")
+        if max_length is not None and len(data) > max_length:
+            errors.append(f"String must be at most {max_length} characters long")
+        if pattern_re is not None and not pattern_re.match(data):
+            errors.append(f"String must match pattern: {pattern}")
+        if choice_set and data not in choice_set:
+            errors.append(f"String must be one of: {', '.join(choices)}")
+        if case == "upper" and not data.isupper():
+            warnings.append("String should be uppercase")
+        elif case == "lower" and not data.islower():
+            warnings.append("String should be lowercase")
+        return errors, warnings, data
+    
+    return check
+
+def _compile_number_check(schema: Dict, kwargs: Dict[str, Any], integer: bool = False) -> _Check:
+    """Compile the checks of validate_number, or of validate_integer if integer is True."""
+    minimum = schema.get("minimum", None)
+    maximum = schema.get("maximum", None)
+    multiple_of = schema.get("multiple_of", None)
+    expected_types = int if integer else (int, float)
+    expected_name = "integer" if integer else "number"
+    
+    def check(data: Any) -> Tuple[List[str], List[str], Any]:
+        if not isinstance(data, expected_types):
+            return [f"Expected {expected_name}, got {type(data).__name__}"], [], data
+        
+        errors = []
+        if minimum is not None and data < minimum:
+            errors.append(f"Number must be at least {minimum}")
+        if maximum is not None and data > maximum:
+            errors.append(f"Number must be at most {maximum}")
+        if multiple_of is not None and data % multiple_of != 0:
+            errors.append(f"Number must be a multiple of {multiple_of}")
+        return errors, [], data
+    
+    return check
+
+def _compile_integer_check(schema: Dict, kwargs: Dict[str, Any]) -> _Check:
+    """Compile the checks of validate_integer."""
+    return _compile_number_check(schema, kwargs, integer=True)
+
+def _compile_boolean_check(schema: Dict, kwargs: Dict[str, Any]) -> _Check:
+    """Compile the checks of validate_boolean."""
+    def check(data: Any) -> Tuple[List[str], List[str], Any]:
+        if not isinstance(data, bool):
+            return [f"Expected boolean, got {type(data).__name__}"], [], data
+        return [], [], data
+    
+    return check
+
+def _compile_datetime_check(schema: Dict, kwargs: Dict[str, Any]) -> _Check:
+    """Compile the checks of validate_datetime."""
+    date_format = schema.get("format", None)
+    min_date = schema.get("min_date", None)
+    max_date = schema.get("max_date", None)
+    
+    def check(data: Any) -> Tuple[List[str], List[str], Any]:
+        if isinstance(data, str):
+            parsed = _parse_datetime(data, date_format)
+            if parsed is None:
+                return [f"Invalid datetime format: {data}"], [], data
+            data = parsed
+        elif not isinstance(data, datetime):
+            return [f"Expected datetime object or string, got {type(data).__name__}"], [], data
+        
+        errors = []
+        if min_date and data < min_date:
+            errors.append(f"Date must be on or after {min_date}")
+        if max_date and data > max_date:
+            errors.append(f"Date must be on or before {max_date}")
+        return errors, [], data
+    
+    return check
+
+def _compile_list_check(schema: Dict, kwargs: Dict[str, Any]) -> _Check:
+    """Compile the checks of validate_list, compiling the item schema once."""
+    min_items = schema.get("min_items", 0)
+    max_items = schema.get("max_items", None)
+    item_schema = schema.get("items", None)
+    item_check = _compile_check(item_schema, kwargs) if item_schema else None
+    
+    def check(data: Any) -> Tuple[List[str], List[str], Any]:
+        if not isinstance(data, list):
+            return [f"Expected list, got {type(data).__name__}"], [], data
+        
+        errors = []
+        if len(data) < min_items:
+            errors.append(f"List must contain at least {min_items} items")
+        if max_items is not None and len(data) > max_items:
+            errors.append(f"List must contain at most {max_items} items")
+        if item_check is None:
+            return errors, [], data
+        
+        item_errors, validated_items = _validate_items(data, item_schema, item_check, kwargs)
+        errors.extend(item_errors)
+        return errors, [], validated_items
+    
+    return check
+
+def _compile_dict_check(schema: Dict, kwargs: Dict[str, Any]) -> _Check:
+    """Compile the checks of validate_dict, compiling each property schema once."""
+    # Interned field names match interned data keys by identity in dict lookups
+    required = [_intern_field(field) for field in schema.get("required", [])]
+    property_checks = [
+        (_intern_field(field), _compile_check(field_schema, kwargs))
+        for field, field_schema in schema.get("properties", {}).items()
+    ]
+    
+    def check(data: Any) -> Tuple[List[str], List[str], Any]:
+        if not isinstance(data, dict):
+            return [f"Expected dictionary, got {type(data).__name__}"], [], data
+        
+        errors = [f"Required field missing: {field}" for field in required if field not in data]
+        validated_data = {}
+        for field, field_check in property_checks:
+            if field in data:
+                field_errors, _, validated_data[field] = field_check(data[field])
+                for error in field_errors:
+                    errors.append(f"Field '{field}': {error}")
+        return errors, [], validated_data
+    
+    return check
+
+def _intern_field(field: Any) -> Any:
+    """Intern a field name if it is a plain string."""
+    return sys.intern(field) if type(field) is str else field
+
+def _compile_email_check(schema: Dict, kwargs: Dict[str, Any]) -> _Check:
+    """Compile the checks of validate_email."""
+    email_re = _compile_pattern(schema["pattern"]) if "pattern" in schema else _EMAIL_RE
+    max_length = kwargs.get("max_length", 254)
+    
+    def check(data: Any) -> Tuple[List[str], List[str], Any]:
+        if not isinstance(data, str):
+            return [f"Expected string, got {type(data).__name__}"], [], data
+        
+        errors = []
+        if (email_re is _EMAIL_RE and "@" not in data) or not email_re.match(data):
+            errors.append(f"Invalid email format: {data}")
+        if len(data) > max_length:
+            errors.append(f"Email exceeds maximum length of {max_length} characters")
+        return errors, [], data
+    
+    return check
+
+def _compile_url_check(schema: Dict, kwargs: Dict[str, Any]) -> _Check:
+    """Compile the checks of validate_url."""
+    url_re = _compile_pattern(schema["pattern"]) if "pattern" in schema else _URL_RE
+    
+    def check(data: Any) -> Tuple[List[str], List[str], Any]:
+        if not isinstance(data, str):
+            return [f"Expected string, got {type(data).__name__}"], [], data
+        if (url_re is _URL_RE and "." not in data) or not url_re.match(data):
+            return [f"Invalid URL format: {data}"], [], data
+        return [], [], data
+    
+    return check
+
 def is_valid_type(value: Any, expected_type: Union[type, tuple]) -> bool:
     """
     Check if value is of expected type.
@@ -475,3 +956,29 @@ def is_in_range(value: Union[int, float], min_val: Optional[Union[int, float]] =
     if max_val is not None and value > max_val:
         return False
     return True
+
+# Check compilers by schema type
+_CHECK_COMPILERS = {
+    "string": _compile_string_check,
+    "number": _compile_number_check,
+    "integer": _compile_integer_check,
+    "boolean": _compile_boolean_check,
+    "datetime": _compile_datetime_check,
+    "list": _compile_list_check,
+    "dict": _compile_dict_check,
+    "email": _compile_email_check,
+    "url": _compile_url_check
+}
+
+# Validators by schema type, including types added with register_validator
+_VALIDATORS = {
+    "string": validate_string,
+    "number": validate_number,
+    "integer": validate_integer,
+    "boolean": validate_boolean,
+    "datetime": validate_datetime,
+    "list": validate_list,
+    "dict": validate_dict,
+    "email": validate_email,
+    "url": validate_url
+}
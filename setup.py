@@ -72,6 +72,15 @@ setup(
             "pytest>=6.0.0",
             "pytest-cov>=2.10.0",
             "tox>=3.20.0"
+        ],
+        "numba": [
+            "numba>=0.53.0"
+        ],
+        "json": [
+            "orjson>=3.6.0"
+        ],
+        "arrow": [
+            "pyarrow>=7.0.0"
         ]
     },
     classifiers=[
@@ -0,0 +1,151 @@
+# Cleaner Tests
+"""
+Tests for the data cleaners.
+"""
+
+import pickle
+
+import pandas as pd
+
+from cleaner.cleaners import DateTimeCleaner, NumberCleaner, TextCleaner
+from cleaner.config import Config
+
+
+class DoublingNumberCleaner(NumberCleaner):
+    def _clean_impl(self, number):
+        cleaned = super()._clean_impl(number)
+        return None if cleaned is None else cleaned * 2
+
+
+class UpperTextCleaner(TextCleaner):
+    def clean(self, text):
+        return str(text).upper()
+
+
+def test_clean_batch_uses_overridden_clean_impl():
+    cleaner = DoublingNumberCleaner(Config())
+
+    assert cleaner.clean("3") == 6
+    assert cleaner.clean_batch(["1", "2", "x"]) == [2, 4]
+
+
+def test_clean_batch_uses_overridden_clean():
+    cleaner = UpperTextCleaner(Config())
+
+    assert cleaner.clean_batch(["ab", "cd"]) == ["AB", "CD"]
+
+
+def test_clean_batch_vectorizes_builtin_cleaners():
+    for cleaner in (NumberCleaner(Config()), TextCleaner(Config()), DateTimeCleaner(Config())):
+        assert cleaner._is_vectorizable(["1"])
+
+
+def test_datetime_input_formats_keep_config_order():
+    cleaner = DateTimeCleaner(Config({"datetime_cleaner": {"input_formats": ["%m/%d/%Y", "%d/%m/%Y"]}}))
+
+    assert cleaner.clean("25/12/2024") == "2024-12-25 00:00:00"
+    assert cleaner.clean("05/04/2024") == "2024-05-04 00:00:00"
+
+
+def test_datetime_clean_batch_validates_aware_values_and_bounds_like_clean():
+    config = Config({"datetime_cleaner": {
+        "min_datetime": "2000-01-01T00:00:00+00:00",
+        "max_datetime": "2021-05-05T12:00:00+00:00"
+    }})
+    data = ["2021-05-05T10:00:00+02:00", "2021-05-05T23:30:00-05:00", "2000-01-01T00:30:00+01:00", "2010-06-01"]
+
+    expected = [DateTimeCleaner(config).clean(value) for value in data]
+    assert DateTimeCleaner(config).clean_batch(data) == [value for value in expected if value is not None]
+
+
+def test_uncombinable_replace_patterns_are_applied_one_by_one():
+    for patterns in (
+        {"(?i)cat": "dog", "b": "c"},
+        {"(?P<x>a)": "b", "(?P<x>c)": "d"},
+        {"(a)(?(1)b)": "x", "c": "d"}
+    ):
+        sequential = TextCleaner(Config({"text_cleaner": {"replace_patterns": patterns}}))
+        combined = TextCleaner(Config({"text_cleaner": {"replace_patterns": patterns, "combine_replace_patterns": True}}))
+
+        assert combined._combined_replace is None
+        for text in ("CAT and cab", "ab cd", "a b c"):
+            assert combined.clean(text) == sequential.clean(text)
+
+
+def test_combined_replace_patterns_expand_their_own_groups():
+    cleaner = TextCleaner(Config({"text_cleaner": {
+        "replace_patterns": {r"(\d+)kg": r"\1 kg", "(?i:colour)": "color"},
+        "combine_replace_patterns": True
+    }}))
+
+    assert cleaner._combined_replace is not None
+    assert cleaner.clean("5kg of Colour") == "5 kg of color"
+
+
+def test_text_clean_batch_matches_clean_for_missing_markers():
+    cleaner = TextCleaner(Config())
+    data = ["Hello, World!", None, float("nan"), pd.NA, pd.NaT, 1.5, "   "]
+
+    expected = [cleaner.clean(value) for value in data]
+    assert cleaner.clean_batch(data) == [value for value in expected if value is not None]
+
+
+NUMBER_INPUTS = ["1", "1,234", "2.5", "-3", " 7 ", "1e3", "abc", "", None, 5, 2.5, float("nan"), "١٢", "9223372036854775808"]
+TEXT_INPUTS = ["Hello, World!", "  Extra   spaces\nhere ", "Digits 123", "Ünïcödé text", "!!!", "", None, 42]
+DATETIME_INPUTS = ["2024-01-15", "2024/01/15", "15/01/2024", "2024-01-15 10:30:00", "2024-01-15T10:30:00Z",
+                   "2024-02-30", "not a date", "", None]
+
+
+def _assert_batch_matches_clean(cleaner, data):
+    expected = [cleaner.clean(value) for value in data]
+    assert cleaner.clean_batch(data) == [value for value in expected if value is not None]
+
+
+def test_number_clean_batch_matches_clean():
+    for config in ({}, {"number_cleaner": {"default_type": "float"}}, {"number_cleaner": {"min_value": 0, "max_value": 100}}):
+        _assert_batch_matches_clean(NumberCleaner(Config(config)), NUMBER_INPUTS)
+
+
+def test_text_clean_batch_matches_clean():
+    for config in ({}, {"text_cleaner": {"lowercase": False, "remove_digits": True}},
+                   {"text_cleaner": {"replace_patterns": {"world": "there", r"\d+": "#"}}}):
+        _assert_batch_matches_clean(TextCleaner(Config(config)), TEXT_INPUTS)
+
+
+def test_datetime_clean_batch_matches_clean():
+    for config in ({}, {"datetime_cleaner": {"output_format": "%d.%m.%Y"}},
+                   {"datetime_cleaner": {"min_datetime": "2024-01-10", "max_datetime": "2024-01-20"}}):
+        _assert_batch_matches_clean(DateTimeCleaner(Config(config)), DATETIME_INPUTS)
+
+
+def test_clean_cache_reuses_results_until_cleared():
+    cleaner = NumberCleaner(Config())
+    cleaner.clean("1,234")
+    cleaner.clean("1,234")
+    assert cleaner._clean_cached.cache_info().hits == 1
+
+    # Cached values are typed, so equal values of different types are cleaned separately
+    assert type(cleaner.clean(1)) is type(cleaner.clean(1.0)) is int
+    assert cleaner._clean_cached.cache_info().currsize == 3
+
+    cleaner.clear_cache()
+    assert cleaner._clean_cached.cache_info().currsize == 0
+
+
+def test_clean_cache_is_rebuilt_after_pickling():
+    cleaner = DateTimeCleaner(Config())
+    cleaner.clean("2024-01-15")
+
+    restored = pickle.loads(pickle.dumps(cleaner))
+    assert restored._clean_datetime_cached.cache_info().currsize == 0
+    assert restored.clean("2024-01-15") == cleaner.clean("2024-01-15")
+
+
+def test_parallel_clean_batch_matches_serial():
+    data = NUMBER_INPUTS * 5
+    serial = NumberCleaner(Config())
+    parallel = NumberCleaner(Config({"general": {"n_jobs": 2, "parallel_threshold": 10}}))
+
+    assert parallel.clean_batch(data) == serial.clean_batch(data)
+    assert list(parallel.iter_clean(iter(data))) == serial.clean_batch(data)
+    assert parallel.get_stats() == serial.get_stats()
@@ -0,0 +1,70 @@
+# Config Tests
+"""
+Tests for the Config class.
+"""
+
+import pytest
+
+from cleaner.config import Config
+
+
+def test_get_sees_changes_to_returned_sections():
+    config = Config()
+    assert config.get("general.n_jobs") == 1
+
+    config.get("general")["n_jobs"] = 4
+
+    assert config.get("general.n_jobs") == 4
+
+
+def test_get_sees_keys_added_to_returned_sections():
+    config = Config()
+    assert config.get("general.foo") is None
+
+    config.get("general")["foo"] = 1
+
+    assert config.get("general.foo") == 1
+    assert "general.foo" in config
+
+
+def test_to_dict_returns_a_deep_copy():
+    config = Config()
+    config.to_dict()["general"]["foo"] = 1
+
+    assert config.get("general.foo") is None
+
+
+def test_set_merge_and_reset():
+    config = Config()
+    config.set("general.n_jobs", 2)
+    assert config["general.n_jobs"] == 2
+
+    config.merge({"general": {"n_jobs": 3}})
+    assert config["general.n_jobs"] == 3
+
+    config.reset("general.n_jobs")
+    assert config["general.n_jobs"] == 1
+
+
+def test_str_shows_current_values():
+    config = Config()
+    str(config)
+    repr(config)
+
+    config.get("general")["n_jobs"] = 4
+
+    assert '"n_jobs": 4' in str(config)
+    assert '"n_jobs": 4' in repr(config)
+
+
+def test_section_is_read_only_and_current():
+    config = Config({"url_cleaner": {"remove_www": True}})
+    section = config.section("url_cleaner")
+    assert section.remove_www is True
+
+    with pytest.raises(AttributeError):
+        section.remove_www = False
+
+    config.get("url_cleaner")["remove_www"] = False
+    assert config.section("url_cleaner").remove_www is False
+    assert config.section("missing") == ()
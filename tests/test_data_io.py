@@ -0,0 +1,75 @@
+# Data IO Tests
+"""
+Tests for loading and saving data.
+"""
+
+import math
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cleaner.utils.data_io import load_csv, load_excel, load_json, save_excel, save_json
+from cleaner.utils.reporting import export_report
+
+
+def test_save_json_round_trips_non_finite_floats(tmp_path):
+    path = str(tmp_path / "data.json")
+    for indent in (None, 2, 4):
+        save_json({"a": float("nan"), "b": [1.0, float("inf")], "c": np.array([np.nan])}, path, indent=indent)
+        data = load_json(path)
+
+        assert math.isnan(data["a"])
+        assert data["b"] == [1.0, float("inf")]
+        assert math.isnan(data["c"][0])
+
+
+def test_save_json_backends_write_the_same_data(tmp_path):
+    data = {"a": 1, "b": [1.5, "x", None], "c": {"d": True}, "e": np.int64(3), "f": np.arange(3)}
+    expected = {"a": 1, "b": [1.5, "x", None], "c": {"d": True}, "e": 3, "f": [0, 1, 2]}
+
+    for json_backend in ("auto", "json"):
+        path = str(tmp_path / f"{json_backend}.json")
+        save_json(data, path, indent=2, json_backend=json_backend)
+        assert load_json(path, json_backend=json_backend) == expected
+
+
+def test_export_report_keeps_indent_and_non_finite_floats(tmp_path):
+    path = str(tmp_path / "report.json")
+    report = {"report_type": "quality", "results": {"mean": float("nan")}}
+
+    export_report(report, path)
+    with open(path) as f:
+        content = f.read()
+
+    assert content.startswith('{\n    "report_type"')
+    assert math.isnan(load_json(path)["results"]["mean"])
+
+
+def test_load_json_backends_read_the_same_data(tmp_path):
+    pytest.importorskip("orjson")
+    path = str(tmp_path / "data.json")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"a": [1, 2.5, "\\u00fc"], "b": null, "c": 18446744073709551616}')
+
+    assert load_json(path) == load_json(path, json_backend="json") == {"a": [1, 2.5, "ü"], "b": None, "c": 2 ** 64}
+
+
+def test_load_csv_arrow_backend_matches_pandas(tmp_path):
+    pytest.importorskip("pyarrow")
+    path = str(tmp_path / "data.csv")
+    pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", None], "c": [1.5, None, 3.0]}).to_csv(path, index=False)
+
+    pd.testing.assert_frame_equal(load_csv(path, csv_backend="arrow"), load_csv(path), check_dtype=False)
+
+
+def test_save_excel_with_xlsxwriter_round_trips(tmp_path):
+    pytest.importorskip("xlsxwriter")
+    pytest.importorskip("openpyxl")
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", None], "c": [datetime(2024, 1, 15, 10, 30), datetime(2024, 2, 1)]})
+
+    for streaming in (False, True):
+        path = str(tmp_path / f"data_{streaming}.xlsx")
+        save_excel(df, path, streaming=streaming, **({} if streaming else {"index": False}))
+        pd.testing.assert_frame_equal(load_excel(path), df, check_dtype=False)
@@ -0,0 +1,45 @@
+# Number Transformer Tests
+"""
+Tests for the NumberTransformer.
+"""
+
+import math
+
+from cleaner.config import Config
+from cleaner.transformers import NumberTransformer
+
+
+def test_fit_keeps_integers_beyond_int64():
+    transformer = NumberTransformer(Config({"number_transformer": {"normalize": True}}))
+    transformer.fit(["1", "9223372036854775808"])
+
+    assert transformer.data.tolist() == [1.0, 9223372036854775808.0]
+    assert transformer.min_value == 1.0
+    assert transformer.max_value == 9223372036854775808.0
+
+
+def test_fit_matches_per_value_cleaning():
+    data = ["1", "9223372036854775808", "-5", "1,234", "١٢", "abc", None]
+    transformer = NumberTransformer(Config()).fit(data)
+
+    expected = [transformer.number_cleaner.clean(value) for value in data]
+    assert transformer.data.tolist() == [float(value) for value in expected if value is not None]
+
+
+def test_transform_batch_log_transforms_floats():
+    transformer = NumberTransformer(Config({
+        "number_cleaner": {"default_type": "float"},
+        "number_transformer": {"log_transform": True}
+    }))
+
+    assert transformer.transform_batch(["1", "2", "10"]) == [math.log(1), math.log(2), math.log(10)]
+
+
+def test_transform_batch_keeps_type_of_values_log_transform_skips():
+    transformer = NumberTransformer(Config({"number_transformer": {"log_transform": True}}))
+    data = ["-3", "0", "10", "abc"]
+
+    expected = [transformer.transform(value) for value in data]
+    result = transformer.transform_batch(data)
+    assert result == expected
+    assert [type(value) for value in result] == [type(value) for value in expected] == [int, int, float, type(None)]
@@ -0,0 +1,32 @@
+# Reporting Tests
+"""
+Tests for data quality reports.
+"""
+
+import math
+
+import pandas as pd
+
+from cleaner.utils.reporting import generate_dataframe_quality_report
+
+
+def test_empty_frame_report_keeps_value_statistics():
+    df = pd.DataFrame({
+        "number": pd.Series([], dtype="float64"),
+        "text": pd.Series([], dtype=object)
+    })
+    stats = generate_dataframe_quality_report(df, {"metadata": {}})["results"]["columns_statistics"]
+
+    for key in ("min", "max", "mean", "median", "std", "variance"):
+        assert math.isnan(stats["number"][key])
+    for key in ("min_length", "max_length", "mean_length"):
+        assert math.isnan(stats["text"][key])
+    assert stats["number"]["count"] == 0
+
+
+def test_empty_frame_report_matches_scanned_frame_keys():
+    df = pd.DataFrame({"number": [1.0, 2.0], "text": ["a", "bc"]})
+    scanned = generate_dataframe_quality_report(df, {"metadata": {}})["results"]["columns_statistics"]
+    empty = generate_dataframe_quality_report(df.iloc[:0], {"metadata": {}})["results"]["columns_statistics"]
+
+    assert {column: set(stats) for column, stats in empty.items()} == {column: set(stats) for column, stats in scanned.items()}
@@ -0,0 +1,40 @@
+# Transformer Tests
+"""
+Tests for the data transformers.
+"""
+
+from cleaner.config import Config
+from cleaner.transformers import DataTransformer, TextTransformer
+
+
+class IdentityTransformer(DataTransformer):
+    def transform(self, data):
+        return data
+
+
+def test_transform_stats_are_a_mutable_dict():
+    transformer = IdentityTransformer(Config())
+    transformer.transform_stats["errors"] += 1
+    transformer.transform_batch([1, 2])
+
+    assert transformer.get_stats() == {"total_records": 2, "transformed_records": 2, "errors": 1}
+
+    transformer.reset_stats()
+    assert transformer.get_stats() == {"total_records": 0, "transformed_records": 0, "errors": 0}
+
+
+def test_ngrams_are_lists_and_countable():
+    transformer = TextTransformer(Config({"text_transformer": {"ngrams": 2}}))
+
+    assert transformer.transform("red fox red fox") == [["red", "fox"], ["fox", "red"], ["red", "fox"]]
+    assert transformer.count_words("red fox red fox") == {("red", "fox"): 2, ("fox", "red"): 1}
+    assert transformer.transform("fox") is None
+
+
+def test_parallel_transform_batch_matches_serial():
+    data = ["The quick brown fox", "", None, "Jumps over the lazy dog"] * 5
+    serial = TextTransformer(Config({"text_transformer": {"tokenize": True}}))
+    parallel = TextTransformer(Config({"general": {"n_jobs": 2, "parallel_threshold": 10}, "text_transformer": {"tokenize": True}}))
+
+    assert parallel.transform_batch(data) == serial.transform_batch(data)
+    assert parallel.get_stats() == serial.get_stats()
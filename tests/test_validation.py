@@ -0,0 +1,76 @@
+# Validation Tests
+"""
+Tests for schema validation.
+"""
+
+from datetime import datetime
+
+from cleaner.utils import compile_schema, validate_data
+from cleaner.utils.validation import VECTORIZE_MIN_ITEMS, _number_item_errors
+
+
+SCHEMAS_AND_VALUES = [
+    (None, ["text", "", None, 0, [], {}]),
+    ({"type": "string", "min_length": 2, "max_length": 5, "pattern": r"[a-z]+$"}, ["abc", "a", "abcdefg", "ABC", 3, None]),
+    ({"type": "string", "choices": ["red", "green"], "case": "lower"}, ["red", "blue", "Red"]),
+    ({"type": "number", "minimum": 0, "maximum": 10, "multiple_of": 0.5}, [5, 2.5, -1, 11, 0.3, "5", True, None]),
+    ({"type": "integer", "minimum": 1}, [1, 0, 1.5, "1", 2 ** 70]),
+    ({"type": "boolean"}, [True, False, 0, "true"]),
+    ({"type": "datetime", "format": "%Y-%m-%d", "min_date": datetime(2024, 1, 1)},
+     ["2024-06-01", "2023-06-01", "06/01/2024", datetime(2024, 6, 1), 20240601]),
+    ({"type": "list", "min_items": 1, "max_items": 3, "items": {"type": "integer", "maximum": 5}},
+     [[1, 2], [], [1, 2, 3, 4], [1, 9, "x"], "not a list"]),
+    ({"type": "dict", "required": ["name"], "properties": {"name": {"type": "string"}, "age": {"type": "integer", "minimum": 0}}},
+     [{"name": "Ann", "age": 3}, {"age": -1}, {"name": 5}, []]),
+    ({"type": "email"}, ["user@example.com", "not an email", None]),
+    ({"type": "url"}, ["https://example.com/path", "not a url"]),
+    ({"type": "unknown"}, ["value"]),
+]
+
+
+def test_compile_schema_matches_validate_data():
+    for schema, values in SCHEMAS_AND_VALUES:
+        validate = compile_schema(schema)
+        is_valid = compile_schema(schema, valid_only=True)
+        for value in values:
+            expected = validate_data(value, schema)
+            assert validate(value) == expected, (schema, value)
+            assert is_valid(value) == expected["valid"], (schema, value)
+
+
+def _item_errors(data, item_schema):
+    validate = compile_schema(item_schema)
+    return [f"Item {i}: {error}" for i, item in enumerate(data) for error in validate(item)["errors"]]
+
+
+def test_validate_list_numpy_path_matches_item_checks():
+    size = VECTORIZE_MIN_ITEMS
+    lists = [
+        list(range(size)),
+        [i / 4 for i in range(size)],
+        [float("nan"), float("inf")] + [1.0] * size,
+        [True, False] * size,
+        [2 ** 53 + 1, 2 ** 63 - 1] + [0] * size,
+        [1] * size + [2.5]
+    ]
+    item_schemas = [
+        {"type": "number", "minimum": 10, "maximum": 500, "multiple_of": 3},
+        {"type": "number", "minimum": 0.5, "multiple_of": 0.5},
+        {"type": "integer", "maximum": 2 ** 53},
+        {"type": "integer", "minimum": 1.5}
+    ]
+    assert _number_item_errors(lists[0], item_schemas[0]) is not None
+
+    for item_schema in item_schemas:
+        for data in lists:
+            results = validate_data(data, {"type": "list", "items": item_schema})
+            expected = _item_errors(data, item_schema)
+            assert results["errors"] == expected, item_schema
+            assert results["valid"] == (not expected)
+
+
+def test_parallel_validate_list_matches_serial():
+    data = ["a", "bb", "", 3] * 10
+    schema = {"type": "list", "items": {"type": "string", "min_length": 1}}
+
+    assert validate_data(data, schema, n_jobs=2, parallel_threshold=10) == validate_data(data, schema)